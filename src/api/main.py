@@ -5,43 +5,35 @@ Main entry point for the MCP server providing natural language
 to query translation capabilities.
 """
 
+import asyncio
+import logging
 import sys
+from collections.abc import Callable
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
 
+import httpx
 import structlog
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.infrastructure.cache import InMemoryResultCache
+from src.infrastructure.config.logging_config import configure_logging
 from src.infrastructure.config.settings import get_settings, Settings
 from src.infrastructure.llm.openai_translator import OpenAITranslator
 from src.infrastructure.llm.anthropic_translator import AnthropicTranslator
 from src.infrastructure.llm.gemini_translator import GeminiTranslator
+from src.infrastructure.llm.semantic_cache import SemanticCache
+from src.infrastructure.llm.template_translator import TemplateMatcher, TemplateTranslator
 from src.domain.ports.translator_port import TranslatorPort
 from src.application.services.datasource_service import DatasourceService
 from src.application.services.query_service import QueryService
 
+
 # Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
-        if get_settings().log_format == "json"
-        else structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+configure_logging(get_settings())
 
 logger = structlog.get_logger(__name__)
 
@@ -49,6 +41,11 @@ logger = structlog.get_logger(__name__)
 _datasource_service: DatasourceService | None = None
 _query_service: QueryService | None = None
 _settings: Settings | None = None
+_http_client: httpx.AsyncClient | None = None
+
+# Request-path values captured once at startup (settings are immutable)
+_llm_info: dict[str, str] = {}
+_debug: bool = False
 
 
 def get_datasource_service() -> DatasourceService:
@@ -65,86 +62,222 @@ def get_query_service() -> QueryService:
     return _query_service
 
 
-def create_translator(settings: Settings) -> TranslatorPort:
+def get_llm_info() -> dict[str, str]:
+    """Get the active LLM provider and model, as captured at startup."""
+    return _llm_info
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled keep-alive HTTP/2 client shared by LLM SDK clients."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+def _make_openai(settings: Settings, http_client: httpx.AsyncClient | None) -> TranslatorPort:
+    """Create the OpenAI translator."""
+    if not settings.openai_api_key:
+        raise ValueError("OPENAI_API_KEY is required for OpenAI provider")
+    return OpenAITranslator(
+        api_key=settings.openai_api_key.get_secret_value(),
+        model=settings.openai_model,
+        temperature=settings.llm_temperature,
+        max_tokens=settings.llm_max_tokens,
+        max_concurrency=settings.llm_max_concurrency,
+        http_client=http_client,
+    )
+
+
+def _make_anthropic(settings: Settings, http_client: httpx.AsyncClient | None) -> TranslatorPort:
+    """Create the Anthropic translator."""
+    if not settings.anthropic_api_key:
+        raise ValueError("ANTHROPIC_API_KEY is required for Anthropic provider")
+    return AnthropicTranslator(
+        api_key=settings.anthropic_api_key.get_secret_value(),
+        model=settings.anthropic_model,
+        temperature=settings.llm_temperature,
+        max_tokens=settings.llm_max_tokens,
+        max_concurrency=settings.llm_max_concurrency,
+        http_client=http_client,
+    )
+
+
+def _make_gemini(settings: Settings, _http_client: httpx.AsyncClient | None) -> TranslatorPort:
+    """Create the Gemini translator (gRPC transport, does not use the HTTP client)."""
+    if not settings.gemini_api_key:
+        raise ValueError("GEMINI_API_KEY is required for Gemini provider")
+    return GeminiTranslator(
+        api_key=settings.gemini_api_key.get_secret_value(),
+        model=settings.gemini_model,
+        temperature=settings.llm_temperature,
+        max_tokens=settings.llm_max_tokens,
+        max_concurrency=settings.llm_max_concurrency,
+    )
+
+
+_TRANSLATOR_FACTORIES: dict[
+    str, Callable[[Settings, httpx.AsyncClient | None], TranslatorPort]
+] = {
+    "openai": _make_openai,
+    "anthropic": _make_anthropic,
+    "gemini": _make_gemini,
+}
+
+
+def create_translator(
+    settings: Settings,
+    http_client: httpx.AsyncClient | None = None,
+) -> TranslatorPort:
     """
     Factory function to create the appropriate translator based on settings.
     
-    Supports: openai, anthropic, gemini
+    Supports: openai, anthropic, gemini. The translator is wrapped in a
+    SemanticCache unless translation caching is disabled, and in a
+    TemplateTranslator when a query templates file exists. When given,
+    http_client is reused by the provider SDK for connection pooling.
     """
     provider = settings.llm_provider
     
     logger.info("creating_translator", provider=provider)
     
-    if provider == "openai":
-        if not settings.openai_api_key:
-            raise ValueError("OPENAI_API_KEY is required for OpenAI provider")
-        return OpenAITranslator(
-            api_key=settings.openai_api_key.get_secret_value(),
-            model=settings.openai_model,
-            temperature=settings.llm_temperature,
-            max_tokens=settings.llm_max_tokens,
+    factory = _TRANSLATOR_FACTORIES.get(provider)
+    if factory is None:
+        raise ValueError(
+            f"Unknown LLM provider: {provider}. Use: {', '.join(_TRANSLATOR_FACTORIES)}"
         )
-    
-    elif provider == "anthropic":
-        if not settings.anthropic_api_key:
-            raise ValueError("ANTHROPIC_API_KEY is required for Anthropic provider")
-        return AnthropicTranslator(
-            api_key=settings.anthropic_api_key.get_secret_value(),
-            model=settings.anthropic_model,
-            temperature=settings.llm_temperature,
-            max_tokens=settings.llm_max_tokens,
-        )
-    
-    elif provider == "gemini":
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required for Gemini provider")
-        return GeminiTranslator(
-            api_key=settings.gemini_api_key.get_secret_value(),
-            model=settings.gemini_model,
-            temperature=settings.llm_temperature,
-            max_tokens=settings.llm_max_tokens,
+
+    translator = factory(settings, http_client)
+
+    if settings.translation_cache_enabled:
+        translator = SemanticCache(
+            translator,
+            threshold=settings.translation_cache_threshold,
+            max_entries=settings.translation_cache_max_entries,
+            semantic=settings.translation_cache_semantic,
         )
-    
-    else:
-        raise ValueError(f"Unknown LLM provider: {provider}. Use: openai, anthropic, gemini")
+
+    # Templates run first: a regex pass is cheaper than any cache lookup
+    if Path(settings.query_templates_path).exists():
+        matcher = TemplateMatcher.from_file(settings.query_templates_path)
+        translator = TemplateTranslator(translator, matcher)
+
+    return translator
+
+
+async def warm_up(
+    translator: TranslatorPort,
+    datasource_service: DatasourceService | None,
+    timeout_seconds: float = 5.0,
+) -> None:
+    """
+    Open LLM (and, when a service is given, datasource) connections ahead of the first request.
+
+    Best effort: failures and timeouts are logged and never block startup.
+    """
+
+    async def _warm_translator() -> None:
+        await asyncio.wait_for(translator.warm_up(), timeout_seconds)
+
+    targets = {"translator": _warm_translator()}
+    if datasource_service is not None:
+        targets["datasources"] = datasource_service.connect_all()
+
+    results = await asyncio.gather(*targets.values(), return_exceptions=True)
+    for target, result in zip(targets, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("warm_up_failed", target=target, error=repr(result))
+        else:
+            logger.debug("warm_up_completed", target=target)
+
+
+async def evict_idle_datasources(
+    datasource_service: DatasourceService,
+    idle_ttl_seconds: int,
+) -> None:
+    """Periodically close datasource connections that have gone unused."""
+    while True:
+        await asyncio.sleep(max(idle_ttl_seconds / 2, 1))
+        try:
+            await datasource_service.disconnect_idle(idle_ttl_seconds)
+        except Exception as e:
+            logger.warning("idle_eviction_failed", error=str(e))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
-    global _datasource_service, _query_service, _settings
+    global _datasource_service, _query_service, _settings, _llm_info, _debug, _http_client
 
-    logger.info("starting_mcp_server")
+    info_enabled = logger.is_enabled_for(logging.INFO)
+    if info_enabled:
+        logger.info("starting_mcp_server")
 
     # Load settings
     _settings = get_settings()
+    _llm_info = {
+        "llm_provider": _settings.llm_provider,
+        "llm_model": _settings.get_active_model(),
+    }
+    _debug = _settings.debug
 
     # Initialize services
     _datasource_service = DatasourceService(
         config_path=_settings.config_file_path,
+        schema_cache_ttl_seconds=_settings.schema_cache_ttl_seconds,
     )
 
     # Create translator based on provider
-    translator = create_translator(_settings)
+    _http_client = create_http_client()
+    translator = create_translator(_settings, _http_client)
 
     _query_service = QueryService(
         datasource_service=_datasource_service,
         translator=translator,
         settings=_settings,
+        result_cache=(
+            InMemoryResultCache(max_entries=_settings.result_cache_max_entries)
+            if _settings.result_cache_enabled
+            else None
+        ),
     )
 
-    logger.info(
-        "mcp_server_started",
-        host=_settings.host,
-        port=_settings.port,
-        mode=_settings.default_query_mode.value,
-        llm_provider=_settings.llm_provider,
+    # Warm connections in the background so startup isn't delayed; datasources
+    # otherwise connect on first use
+    warm_up_task = asyncio.create_task(warm_up(
+        translator,
+        _datasource_service if _settings.preconnect_datasources else None,
+    ))
+    idle_task = (
+        asyncio.create_task(
+            evict_idle_datasources(_datasource_service, _settings.datasource_idle_ttl_seconds)
+        )
+        if _settings.datasource_idle_ttl_seconds
+        else None
     )
 
+    if info_enabled:
+        logger.info(
+            "mcp_server_started",
+            host=_settings.host,
+            port=_settings.port,
+            mode=_settings.default_query_mode.value,
+            llm_provider=_settings.llm_provider,
+        )
+
     yield
 
     # Cleanup on shutdown
-    logger.info("stopping_mcp_server")
+    if info_enabled:
+        logger.info("stopping_mcp_server")
+
+    warm_up_task.cancel()
+    if idle_task:
+        idle_task.cancel()
+    await _datasource_service.aflush()
+    await _datasource_service.disconnect_all()
+    await _http_client.aclose()
 
 
 # Create FastAPI application
@@ -169,17 +302,18 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Global exception handler for unhandled errors."""
-    logger.error(
-        "unhandled_exception",
-        path=request.url.path,
-        method=request.method,
-        error=str(exc),
-    )
+    if logger.is_enabled_for(logging.ERROR):
+        logger.error(
+            "unhandled_exception",
+            path=request.url.path,
+            method=request.method,
+            error=str(exc),
+        )
     return JSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "detail": str(exc) if get_settings().debug else "An error occurred",
+            "detail": str(exc) if _debug else "An error occurred",
         },
     )
 
@@ -218,6 +352,8 @@ def main() -> None:
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
 
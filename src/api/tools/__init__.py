@@ -4,13 +4,15 @@ MCP Tools Router.
 Defines all MCP tools as FastAPI endpoints.
 """
 
-import os
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.api.main import get_datasource_service, get_query_service
+from src.api.main import get_datasource_service, get_llm_info, get_query_service
 from src.infrastructure.config.settings import get_settings
 from src.domain.entities.datasource import DatasourceType
 from src.domain.entities.query import QueryMode
@@ -18,12 +20,29 @@ from src.domain.entities.query import QueryMode
 router = APIRouter()
 
 
+@lru_cache(maxsize=8)
+def _parse_mode(value: str) -> QueryMode:
+    """Coerce a request mode string to QueryMode (memoized, few distinct values)."""
+    return QueryMode(value)
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
 
 
-class ConfigureDatasourceRequest(BaseModel):
+class ToolRequest(BaseModel):
+    """Base for tool request models: strict, whitespace-stripped, parsed once."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        validate_assignment=False,
+    )
+
+
+class ConfigureDatasourceRequest(ToolRequest):
     """Request model for configure_datasource tool."""
 
     id: str = Field(..., description="Unique identifier for the datasource")
@@ -43,20 +62,20 @@ class ConfigureDatasourceRequest(BaseModel):
     description: str = Field("", description="Optional description")
 
 
-class ToggleDatasourceRequest(BaseModel):
+class ToggleDatasourceRequest(ToolRequest):
     """Request model for toggle_datasource tool."""
 
     id: str = Field(..., description="Datasource ID to toggle")
     enabled: bool | None = Field(None, description="Set enabled state (None to toggle)")
 
 
-class SetQueryModeRequest(BaseModel):
+class SetQueryModeRequest(ToolRequest):
     """Request model for set_query_mode tool."""
 
     mode: str = Field(..., description="Query mode: sql, nosql, files, or mixed")
 
 
-class QueryRequest(BaseModel):
+class QueryRequest(ToolRequest):
     """Request model for query tool."""
 
     query: str = Field(..., description="Natural language query")
@@ -64,14 +83,14 @@ class QueryRequest(BaseModel):
     max_results: int | None = Field(None, description="Maximum results to return")
 
 
-class PreviewQueryRequest(BaseModel):
+class PreviewQueryRequest(ToolRequest):
     """Request model for preview_query tool."""
 
     query: str = Field(..., description="Natural language query to preview")
     mode: str | None = Field(None, description="Optional mode override")
 
 
-class ExportResultsRequest(BaseModel):
+class ExportResultsRequest(ToolRequest):
     """Request model for export_results tool."""
 
     format: str = Field("csv", description="Export format: csv or json")
@@ -106,18 +125,12 @@ async def configure_datasource(request: ConfigureDatasourceRequest) -> ToolRespo
         # Resolve connection string from environment variable if provided
         connection_string = request.connection_string
         if request.connection_string_env:
-            connection_string = os.environ.get(request.connection_string_env)
-            if not connection_string:
-                raise ValueError(
-                    f"Environment variable '{request.connection_string_env}' not found. "
-                    "Please set it in your .env file or environment."
-                )
-
-        # Check if updating existing
-        existing = service.get_datasource(request.id)
-        if existing:
-            service.remove_datasource(request.id)
+            connection_string = get_settings().resolve_env_secret(
+                request.connection_string_env
+            )
 
+        # Updates go through add_datasource too, which keeps the open
+        # adapter when the connection settings are unchanged
         datasource = service.add_datasource(
             id=request.id,
             name=request.name,
@@ -127,6 +140,7 @@ async def configure_datasource(request: ConfigureDatasourceRequest) -> ToolRespo
             enabled=request.enabled,
             description=request.description,
         )
+        await get_query_service().invalidate_results(request.id)
 
         # Don't expose connection string in response
         response_data = datasource.to_dict()
@@ -151,6 +165,7 @@ async def remove_datasource(datasource_id: str) -> ToolResponse:
     service = get_datasource_service()
 
     if service.remove_datasource(datasource_id):
+        await get_query_service().invalidate_results(datasource_id)
         return ToolResponse(
             success=True,
             message=f"Datasource '{datasource_id}' removed successfully",
@@ -186,6 +201,7 @@ async def toggle_datasource(request: ToggleDatasourceRequest) -> ToolResponse:
     datasource = service.toggle_datasource(request.id, request.enabled)
 
     if datasource:
+        await get_query_service().invalidate_results(request.id)
         return ToolResponse(
             success=True,
             message=f"Datasource '{request.id}' is now {'enabled' if datasource.enabled else 'disabled'}",
@@ -220,23 +236,17 @@ async def set_query_mode(request: SetQueryModeRequest) -> ToolResponse:
 
 
 @router.get("/get_schema/{datasource_id}", response_model=ToolResponse)
-async def get_schema(datasource_id: str) -> ToolResponse:
+async def get_schema(datasource_id: str, refresh: bool = False) -> ToolResponse:
     """
-    Get the schema of a datasource.
+    Get the schema of a datasource (cached; pass refresh=true to re-fetch).
     """
     service = get_datasource_service()
-    adapter = service.get_adapter(datasource_id)
 
-    if not adapter:
+    if not service.get_datasource(datasource_id):
         raise HTTPException(status_code=404, detail=f"Datasource '{datasource_id}' not found")
 
     try:
-        async with adapter:
-            schema = await adapter.get_schema()
-
-        datasource = service.get_datasource(datasource_id)
-        if datasource:
-            datasource.update_schema_cache(schema)
+        schema = await service.get_schema(datasource_id, refresh=refresh)
 
         return ToolResponse(
             success=True,
@@ -251,6 +261,29 @@ async def get_schema(datasource_id: str) -> ToolResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/get_all_schemas", response_model=ToolResponse)
+async def get_all_schemas() -> ToolResponse:
+    """
+    Get the schemas of all enabled datasources.
+
+    Schemas are fetched concurrently and cached for subsequent queries.
+    """
+    service = get_datasource_service()
+    results = await service.refresh_schemas()
+
+    schemas = {ds_id: r for ds_id, r in results.items() if not isinstance(r, Exception)}
+    errors = {ds_id: str(r) for ds_id, r in results.items() if isinstance(r, Exception)}
+
+    return ToolResponse(
+        success=not errors,
+        message=f"Schema retrieved for {len(schemas)} of {len(results)} datasource(s)",
+        data={
+            "schemas": schemas,
+            "errors": errors,
+        },
+    )
+
+
 @router.post("/query", response_model=ToolResponse)
 async def query(request: QueryRequest) -> ToolResponse:
     """
@@ -262,9 +295,8 @@ async def query(request: QueryRequest) -> ToolResponse:
     """
     try:
         query_service = get_query_service()
-        settings = get_settings()
 
-        mode = QueryMode(request.mode) if request.mode else None
+        mode = _parse_mode(request.mode) if request.mode else None
 
         result = await query_service.execute_query(
             natural_language=request.query,
@@ -274,8 +306,7 @@ async def query(request: QueryRequest) -> ToolResponse:
 
         # Add result data with provider info
         result_data = result.to_dict()
-        result_data["llm_provider"] = settings.llm_provider
-        result_data["llm_model"] = settings.get_active_model()
+        result_data.update(get_llm_info())
 
         # Use natural response as the main message for non-technical users
         user_message = result.natural_response or f"Encontré {result.row_count} resultado(s)."
@@ -299,9 +330,9 @@ async def preview_query(request: PreviewQueryRequest) -> ToolResponse:
     """
     try:
         query_service = get_query_service()
-        settings = get_settings()
+        llm_info = get_llm_info()
 
-        mode = QueryMode(request.mode) if request.mode else None
+        mode = _parse_mode(request.mode) if request.mode else None
 
         result = await query_service.preview_query(
             natural_language=request.query,
@@ -310,12 +341,11 @@ async def preview_query(request: PreviewQueryRequest) -> ToolResponse:
 
         # Add provider info to preview response
         preview_data = result.get_preview_response()
-        preview_data["llm_provider"] = settings.llm_provider
-        preview_data["llm_model"] = settings.get_active_model()
+        preview_data.update(llm_info)
 
         return ToolResponse(
             success=True,
-            message=f"Query preview generated with {settings.llm_provider.upper()} ({settings.get_active_model()})",
+            message=f"Query preview generated with {llm_info['llm_provider'].upper()} ({llm_info['llm_model']})",
             data=preview_data,
         )
 
@@ -323,10 +353,12 @@ async def preview_query(request: PreviewQueryRequest) -> ToolResponse:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/export_results", response_model=ToolResponse)
-async def export_results(request: ExportResultsRequest) -> ToolResponse:
+@router.post("/export_results")
+async def export_results(request: ExportResultsRequest) -> StreamingResponse:
     """
     Export the last query results to a file format.
+
+    The file is streamed in chunks instead of being embedded in a ToolResponse.
     """
     query_service = get_query_service()
     result = query_service.get_last_result()
@@ -334,23 +366,22 @@ async def export_results(request: ExportResultsRequest) -> ToolResponse:
     if not result:
         raise HTTPException(status_code=404, detail="No query results to export")
 
-    if request.format.lower() == "csv":
-        export_data = result.to_csv_string()
+    export_format = request.format.lower()
+    if export_format == "csv":
+        chunks: Iterator[str] | Iterator[bytes] = result.iter_csv_chunks()
         content_type = "text/csv"
-    elif request.format.lower() == "json":
-        export_data = result.to_json_string()
+    elif export_format == "json":
+        chunks = result.iter_json_chunks()
         content_type = "application/json"
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported format: {request.format}")
 
-    return ToolResponse(
-        success=True,
-        message=f"Results exported as {request.format.upper()}",
-        data={
-            "format": request.format,
-            "content_type": content_type,
-            "content": export_data,
-            "row_count": result.row_count,
+    return StreamingResponse(
+        chunks,
+        media_type=content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{result.query_id}.{export_format}"',
+            "X-Row-Count": str(result.row_count),
         },
     )
 
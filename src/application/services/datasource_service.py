@@ -5,10 +5,16 @@ Handles CRUD operations for datasources, connection validation,
 and adapter factory pattern.
 """
 
-import json
+import asyncio
+import hashlib
+import os
+import time
+from collections.abc import Callable
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING, TypeVar
 
+import orjson
 import structlog
 
 from src.domain.entities.datasource import (
@@ -27,6 +33,37 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+_ConfigT = TypeVar("_ConfigT", ConnectionConfig, FileConfig)
+
+# Parsed config files keyed by path, validated by (st_mtime_ns, st_size)
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=64)
+def _parse_ds_type(value: str) -> DatasourceType:
+    """Case-insensitive DatasourceType lookup (memoized, few distinct values)."""
+    return DatasourceType(value.lower())
+
+
+@lru_cache(maxsize=16)
+def _parse_query_mode(value: str) -> QueryMode:
+    """Case-insensitive QueryMode lookup (memoized, few distinct values)."""
+    return QueryMode(value.lower())
+
+
+@lru_cache(maxsize=256)
+def _intern_config(config: _ConfigT) -> _ConfigT:
+    """Return the shared instance equal to a (frozen) connection or file config."""
+    return config
+
+
+@cache
+def _default_adapter_factory() -> "AdapterFactory":
+    """Build the default adapter factory once (Composition Root fallback)."""
+    from src.infrastructure.adapters.factory import create_default_factory
+
+    return create_default_factory()
+
 
 class DatasourceService:
     """
@@ -35,21 +72,47 @@ class DatasourceService:
     Provides CRUD operations, connection validation, and adapter creation.
     """
 
+    # Delay used to coalesce bursts of config writes inside the event loop
+    SAVE_DELAY_SECONDS = 0.2
+
     def __init__(
         self,
         config_path: str | None = None,
         adapter_factory: "AdapterFactory | None" = None,
+        schema_cache_ttl_seconds: int = 3600,
     ) -> None:
         """Initialize service with optional config path and adapter factory.
         
         Args:
             config_path: Path to JSON config file for persistence
             adapter_factory: Factory for creating adapters (injected for DIP)
+            schema_cache_ttl_seconds: How long a fetched schema is served as fresh
         """
+        self._schema_cache_ttl_seconds = schema_cache_ttl_seconds
         self._datasources: dict[str, Datasource] = {}
         self._adapters: dict[str, DatasourcePort] = {}
+        # Secondary indexes; dicts used as insertion-ordered sets so listings
+        # (and the prompts built from them) keep a stable order
+        self._by_category: dict[DatasourceCategory, dict[str, None]] = {
+            category: {} for category in DatasourceCategory
+        }
+        self._enabled_ids: dict[str, None] = {}
         self._current_mode: QueryMode = QueryMode.MIXED
         self._config_path = Path(config_path) if config_path else None
+        # Sidecar directory persisting fetched schemas across restarts
+        self._schema_cache_dir = (
+            self._config_path.parent / ".schema_cache" if self._config_path else None
+        )
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Orders background config and schema sidecar writes
+        self._write_lock = asyncio.Lock()
+        # Strong references to fire-and-forget tasks (disconnects, config writes)
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        # Schema sidecar writes and deletes not yet on disk
+        self._pending_sidecar_io: set[asyncio.Task[None]] = set()
+        # Datasource IDs with a background schema refresh in flight
+        self._refreshing_schemas: set[str] = set()
         
         # Lazy load factory if not provided (for backward compatibility)
         self._adapter_factory = adapter_factory
@@ -57,6 +120,7 @@ class DatasourceService:
         # Load from config file if provided
         if self._config_path and self._config_path.exists():
             self._load_from_config()
+            self._restore_schema_caches()
 
     # -------------------------------------------------------------------------
     # CRUD Operations
@@ -73,17 +137,36 @@ class DatasourceService:
         description: str = "",
         **kwargs: Any,
     ) -> Datasource:
-        """Add a new datasource configuration."""
-        if isinstance(ds_type, str):
-            ds_type = DatasourceType(ds_type.lower())
-
-        logger.info(
-            "adding_datasource",
-            id=id,
-            name=name,
-            type=ds_type.value,
+        """Add a new datasource configuration and persist it."""
+        datasource = self._build_datasource(
+            id, name, ds_type, connection_string, file_path, enabled, description, **kwargs
         )
 
+        previous = self._datasources.get(id)
+        if previous and not self._same_connection(previous, datasource):
+            self.invalidate_adapter(id)
+
+        self._register(datasource)
+        self._save_config()
+
+        logger.info("datasource_added", id=id, type=datasource.type.value)
+        return datasource
+
+    @staticmethod
+    def _build_datasource(
+        id: str,
+        name: str,
+        ds_type: DatasourceType | str,
+        connection_string: str | None = None,
+        file_path: str | None = None,
+        enabled: bool = True,
+        description: str = "",
+        **kwargs: Any,
+    ) -> Datasource:
+        """Validate arguments and build a Datasource without registering it."""
+        if isinstance(ds_type, str):
+            ds_type = _parse_ds_type(ds_type)
+
         # Build configuration based on type
         connection_config = None
         file_config = None
@@ -91,25 +174,29 @@ class DatasourceService:
         if ds_type.category == DatasourceCategory.FILE:
             if not file_path:
                 raise ValueError(f"File path is required for {ds_type.value} datasource")
-            file_config = FileConfig(
+            file_config = _intern_config(FileConfig(
                 path=file_path,
                 encoding=kwargs.get("encoding", "utf-8"),
                 delimiter=kwargs.get("delimiter", ","),
                 sheet_name=kwargs.get("sheet_name"),
                 has_header=kwargs.get("has_header", True),
-            )
+                parquet_cache=kwargs.get("parquet_cache", False),
+            ))
         else:
             if not connection_string:
                 raise ValueError(f"Connection string is required for {ds_type.value} datasource")
-            connection_config = ConnectionConfig(
+            connection_config = _intern_config(ConnectionConfig(
                 connection_string=connection_string,
                 database=kwargs.get("database"),
                 schema=kwargs.get("schema"),
                 pool_size=kwargs.get("pool_size", 5),
                 timeout_seconds=kwargs.get("timeout_seconds", 30),
-            )
+                pool_max_overflow=kwargs.get("pool_max_overflow", 10),
+                pool_recycle_seconds=kwargs.get("pool_recycle_seconds", 3600),
+                pool_timeout_seconds=kwargs.get("pool_timeout_seconds", 30),
+            ))
 
-        datasource = Datasource(
+        return Datasource(
             id=id,
             name=name,
             type=ds_type,
@@ -119,26 +206,16 @@ class DatasourceService:
             file_config=file_config,
         )
 
-        self._datasources[id] = datasource
-        self._save_config()
-
-        logger.info("datasource_added", id=id, type=ds_type.value)
-        return datasource
-
     def remove_datasource(self, id: str) -> bool:
         """Remove a datasource by ID."""
         if id not in self._datasources:
             logger.warning("datasource_not_found", id=id)
             return False
 
-        # Disconnect if connected
-        if id in self._adapters:
-            adapter = self._adapters.pop(id)
-            # Note: Should call disconnect asynchronously
-            logger.info("adapter_removed", id=id)
-
-        del self._datasources[id]
+        self.invalidate_adapter(id)
+        self._unregister(id)
         self._save_config()
+        self._delete_schema_cache(id)
 
         logger.info("datasource_removed", id=id)
         return True
@@ -153,15 +230,16 @@ class DatasourceService:
         category: DatasourceCategory | None = None,
     ) -> list[Datasource]:
         """List all datasources with optional filtering."""
-        result = list(self._datasources.values())
+        if category:
+            ids = self._by_category[category]
+            if enabled_only:
+                return [self._datasources[i] for i in ids if i in self._enabled_ids]
+            return [self._datasources[i] for i in ids]
 
         if enabled_only:
-            result = [ds for ds in result if ds.enabled]
+            return [self._datasources[i] for i in self._enabled_ids]
 
-        if category:
-            result = [ds for ds in result if ds.category == category]
-
-        return result
+        return list(self._datasources.values())
 
     def toggle_datasource(self, id: str, enabled: bool | None = None) -> Datasource | None:
         """Enable or disable a datasource."""
@@ -172,6 +250,10 @@ class DatasourceService:
 
         # Toggle if enabled is None, else set to provided value
         datasource.enabled = not datasource.enabled if enabled is None else enabled
+        if datasource.enabled:
+            self._enabled_ids[id] = None
+        else:
+            self._enabled_ids.pop(id, None)
         self._save_config()
 
         logger.info(
@@ -188,7 +270,7 @@ class DatasourceService:
     def set_query_mode(self, mode: QueryMode | str) -> QueryMode:
         """Set the current query mode."""
         if isinstance(mode, str):
-            mode = QueryMode(mode.lower())
+            mode = _parse_query_mode(mode)
 
         self._current_mode = mode
         logger.info("query_mode_set", mode=mode.value)
@@ -203,19 +285,25 @@ class DatasourceService:
         mode = mode or self._current_mode
 
         if mode == QueryMode.MIXED:
-            return [ds for ds in self._datasources.values() if ds.enabled]
-
-        category_map = {
-            QueryMode.SQL: DatasourceCategory.SQL,
-            QueryMode.NOSQL: DatasourceCategory.NOSQL,
-            QueryMode.FILES: DatasourceCategory.FILE,
-        }
-
-        target_category = category_map.get(mode)
-        return [
-            ds for ds in self._datasources.values()
-            if ds.enabled and ds.category == target_category
-        ]
+            return [self._datasources[i] for i in self._enabled_ids]
+
+        return self.list_datasources(enabled_only=True, category=mode.category)
+
+    def _register(self, datasource: Datasource) -> None:
+        """Store a datasource and add it to the secondary indexes."""
+        datasource.schema_cache.ttl_seconds = self._schema_cache_ttl_seconds
+        self._unregister(datasource.id)
+        self._datasources[datasource.id] = datasource
+        self._by_category[datasource.category][datasource.id] = None
+        if datasource.enabled:
+            self._enabled_ids[datasource.id] = None
+
+    def _unregister(self, id: str) -> None:
+        """Drop a datasource and its index entries, if present."""
+        datasource = self._datasources.pop(id, None)
+        if datasource:
+            self._by_category[datasource.category].pop(id, None)
+            self._enabled_ids.pop(id, None)
 
     # -------------------------------------------------------------------------
     # Adapter Management
@@ -232,14 +320,34 @@ class DatasourceService:
 
         # Lazy init factory if not provided (Composition Root fallback)
         if not self._adapter_factory:
-            from src.infrastructure.adapters.factory import create_default_factory
-            self._adapter_factory = create_default_factory()
+            self._adapter_factory = _default_adapter_factory()
 
         # Use factory to create adapter (DIP compliant)
         adapter = self._adapter_factory.create(datasource)
         self._adapters[datasource_id] = adapter
         return adapter
 
+    def invalidate_adapter(self, datasource_id: str) -> bool:
+        """Drop the cached adapter for a datasource, closing its connection."""
+        adapter = self._adapters.pop(datasource_id, None)
+        if not adapter:
+            return False
+
+        if adapter.is_connected:
+            self._schedule_disconnect(adapter)
+        logger.info("adapter_removed", id=datasource_id)
+        return True
+
+    @staticmethod
+    def _same_connection(a: Datasource, b: Datasource) -> bool:
+        """Whether an adapter built for one datasource can serve the other."""
+        # Configs are interned, so identity is the common case
+        return (
+            a.type is b.type
+            and a.connection_config == b.connection_config
+            and a.file_config == b.file_config
+        )
+
     # _create_adapter removed - logic moved to AdapterFactory
 
     async def validate_connection(self, datasource_id: str) -> bool:
@@ -249,10 +357,9 @@ class DatasourceService:
             return False
 
         try:
-            await adapter.connect()
-            result = await adapter.validate_connection()
-            await adapter.disconnect()
-            return result
+            # Leaves the connection open for the queries that follow
+            await adapter.ensure_connected()
+            return await adapter.validate_connection()
         except Exception as e:
             logger.error(
                 "connection_validation_failed",
@@ -261,21 +368,205 @@ class DatasourceService:
             )
             return False
 
+    async def validate_all_connections(
+        self,
+        timeout_seconds: float = 5.0,
+    ) -> dict[str, bool]:
+        """
+        Validate every configured datasource concurrently.
+
+        Each check is bounded by ``timeout_seconds`` so one hung endpoint
+        cannot hold up the batch; timeouts count as invalid.
+        """
+
+        async def validate_one(datasource_id: str) -> bool:
+            try:
+                return await asyncio.wait_for(
+                    self.validate_connection(datasource_id),
+                    timeout=timeout_seconds,
+                )
+            except TimeoutError:
+                logger.warning(
+                    "connection_validation_timeout",
+                    datasource_id=datasource_id,
+                    timeout_seconds=timeout_seconds,
+                )
+                return False
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                ds_id: tg.create_task(validate_one(ds_id))
+                for ds_id in self._datasources
+            }
+
+        return {ds_id: task.result() for ds_id, task in tasks.items()}
+
+    async def connect_all(self) -> None:
+        """Open connections for all enabled datasources concurrently."""
+
+        async def connect_one(datasource: Datasource) -> None:
+            adapter = self.get_adapter(datasource.id)
+            if adapter:
+                await adapter.ensure_connected()
+
+        datasources = self.list_datasources(enabled_only=True)
+        results = await asyncio.gather(
+            *(connect_one(ds) for ds in datasources),
+            return_exceptions=True,
+        )
+
+        for datasource, result in zip(datasources, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "datasource_preconnect_failed",
+                    datasource_id=datasource.id,
+                    error=str(result),
+                )
+
+    async def disconnect_idle(self, idle_ttl_seconds: float) -> int:
+        """Close adapters unused for ``idle_ttl_seconds``; they reconnect on next use."""
+        idle = [
+            adapter
+            for adapter in self._adapters.values()
+            if adapter.is_connected and adapter.idle_seconds >= idle_ttl_seconds
+        ]
+        await asyncio.gather(
+            *(adapter.disconnect() for adapter in idle),
+            return_exceptions=True,
+        )
+        if idle:
+            logger.info("idle_datasources_disconnected", count=len(idle))
+        return len(idle)
+
+    def _schedule_disconnect(self, adapter: DatasourcePort) -> None:
+        """Close a dropped adapter's connection in the background, if a loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        task = loop.create_task(adapter.disconnect())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def disconnect_all(self) -> None:
+        """Close every open adapter connection."""
+        adapters = [a for a in self._adapters.values() if a.is_connected]
+        await asyncio.gather(
+            *(adapter.disconnect() for adapter in adapters),
+            return_exceptions=True,
+        )
+
+    async def get_schema(self, datasource_id: str, refresh: bool = False) -> dict[str, Any]:
+        """
+        Return a datasource's schema, serving the cached copy when possible.
+
+        An expired schema is returned as-is while a background task fetches a
+        new one (stale-while-revalidate); only a missing schema, or an explicit
+        ``refresh``, waits on the datasource.
+        """
+        datasource = self._datasources.get(datasource_id)
+        if not datasource:
+            raise ValueError(f"Datasource '{datasource_id}' not found")
+
+        cache = datasource.schema_cache
+        if not refresh and cache.cached_at_monotonic is not None:
+            if not cache.is_valid:
+                self._schedule_schema_refresh(datasource_id)
+            return cache.tables
+
+        return await self._fetch_schema(datasource_id)
+
+    async def _fetch_schema(self, datasource_id: str) -> dict[str, Any]:
+        """Fetch a schema from the datasource and cache it."""
+        adapter = self.get_adapter(datasource_id)
+        if not adapter:
+            raise ValueError(f"Datasource '{datasource_id}' not found")
+
+        await adapter.ensure_connected()
+        schema = await adapter.get_schema()
+        self.cache_schema(datasource_id, schema)
+        return schema
+
+    def _schedule_schema_refresh(self, datasource_id: str) -> None:
+        """Re-fetch an expired schema in the background, once per datasource."""
+        if datasource_id in self._refreshing_schemas:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_schema(datasource_id)
+            except Exception as e:
+                logger.warning("schema_refresh_failed", datasource_id=datasource_id, error=str(e))
+            finally:
+                self._refreshing_schemas.discard(datasource_id)
+
+        self._refreshing_schemas.add(datasource_id)
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def refresh_schemas(
+        self,
+        max_concurrency: int = 16,
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """
+        Fetch the schema of every enabled datasource concurrently.
+
+        Successful schemas are stored in each datasource's schema cache.
+        Failures are returned per datasource instead of aborting the batch.
+        The semaphore keeps the fan-out within connection pool limits.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(datasource: Datasource) -> dict[str, Any]:
+            adapter = self.get_adapter(datasource.id)
+            if not adapter:
+                raise ValueError(f"Datasource '{datasource.id}' not found")
+
+            async with semaphore:
+                await adapter.ensure_connected()
+                schema = await adapter.get_schema()
+
+            self.cache_schema(datasource.id, schema)
+            return schema
+
+        datasources = self.list_datasources(enabled_only=True)
+        results = await asyncio.gather(
+            *(fetch_one(ds) for ds in datasources),
+            return_exceptions=True,
+        )
+
+        schemas: dict[str, dict[str, Any] | Exception] = {}
+        for datasource, result in zip(datasources, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "schema_refresh_failed",
+                    datasource_id=datasource.id,
+                    error=str(result),
+                )
+            schemas[datasource.id] = result
+
+        return schemas
+
     # -------------------------------------------------------------------------
     # Config Persistence
     # -------------------------------------------------------------------------
 
     def _load_from_config(self) -> None:
-        """Load datasources from config file."""
+        """
+        Load datasources from config file.
+
+        The file replaces the current datasources: entries missing from it are
+        removed, and adapters are dropped for removed or reconnected ones.
+        """
         if not self._config_path or not self._config_path.exists():
             return
 
         try:
-            with open(self._config_path) as f:
-                config = json.load(f)
-
-            for ds_id, ds_config in config.get("datasources", {}).items():
-                self.add_datasource(
+            config = self._read_config(self._config_path)
+            datasources = [
+                self._build_datasource(
                     id=ds_id,
                     name=ds_config.get("name", ds_id),
                     ds_type=ds_config["type"],
@@ -285,50 +576,268 @@ class DatasourceService:
                     description=ds_config.get("description", ""),
                     **ds_config.get("options", {}),
                 )
-
+                for ds_id, ds_config in config.get("datasources", {}).items()
+            ]
             if "query_mode" in config:
                 self.set_query_mode(config["query_mode"])
 
-            logger.info(
-                "config_loaded",
-                path=str(self._config_path),
-                datasource_count=len(self._datasources),
-            )
-
         except Exception as e:
             logger.error("config_load_failed", error=str(e))
+            return
+
+        # Apply directly: the file is the source of truth, nothing to write back
+        loaded_ids = {datasource.id for datasource in datasources}
+        for ds_id in [i for i in self._datasources if i not in loaded_ids]:
+            self.invalidate_adapter(ds_id)
+            self._unregister(ds_id)
+            self._delete_schema_cache(ds_id)
+
+        for datasource in datasources:
+            previous = self._datasources.get(datasource.id)
+            if previous and not self._same_connection(previous, datasource):
+                self.invalidate_adapter(datasource.id)
+            self._register(datasource)
+
+        logger.info(
+            "config_loaded",
+            path=str(self._config_path),
+            datasource_count=len(self._datasources),
+        )
+
+    @staticmethod
+    def _read_config(path: Path) -> dict[str, Any]:
+        """Parse a config file, reusing the cached parse while its mtime is unchanged."""
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        config: dict[str, Any] = orjson.loads(path.read_bytes())
+        _CONFIG_CACHE[path] = (version, config)
+        return config
+
+    def reload(self) -> None:
+        """Re-read datasources from the config file, bypassing the parse cache."""
+        if self._config_path:
+            _CONFIG_CACHE.pop(self._config_path, None)
+        self._load_from_config()
+        self._restore_schema_caches()
+
+    # -------------------------------------------------------------------------
+    # Schema Cache Persistence
+    # -------------------------------------------------------------------------
+
+    def cache_schema(self, datasource_id: str, schema: dict[str, Any]) -> None:
+        """Store a fetched schema on the datasource and write it through to disk."""
+        datasource = self._datasources.get(datasource_id)
+        if not datasource:
+            return
+
+        datasource.update_schema_cache(schema)
+        if not self._schema_cache_dir:
+            return
+
+        entry = {
+            "fingerprint": self._schema_fingerprint(datasource),
+            "cached_at": time.time(),
+            "tables": schema,
+        }
+        self._run_sidecar_io(self._write_schema_cache, datasource_id, entry)
+
+    def _delete_schema_cache(self, datasource_id: str) -> None:
+        """Remove a datasource's persisted schema, if schemas are persisted."""
+        if self._schema_cache_dir:
+            self._run_sidecar_io(self._unlink_schema_cache, datasource_id)
+
+    def _run_sidecar_io(self, func: Callable[..., None], *args: Any) -> None:
+        """
+        Run blocking sidecar I/O.
+
+        Inside a running event loop it runs in a worker thread under the
+        config write lock, in call order; otherwise it runs inline.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            func(*args)
+            return
+
+        async def run() -> None:
+            async with self._write_lock:
+                await asyncio.to_thread(func, *args)
+
+        task = loop.create_task(run())
+        self._pending_sidecar_io.add(task)
+        task.add_done_callback(self._pending_sidecar_io.discard)
+
+    def _write_schema_cache(self, datasource_id: str, entry: dict[str, Any]) -> None:
+        """Atomically write a schema sidecar (blocking I/O)."""
+        assert self._schema_cache_dir is not None
+        try:
+            self._schema_cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._schema_cache_file(datasource_id)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("schema_cache_save_failed", datasource_id=datasource_id, error=str(e))
+
+    def _unlink_schema_cache(self, datasource_id: str) -> None:
+        """Delete a schema sidecar (blocking I/O)."""
+        try:
+            self._schema_cache_file(datasource_id).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("schema_cache_delete_failed", datasource_id=datasource_id, error=str(e))
+
+    def _restore_schema_caches(self) -> None:
+        """Reuse persisted schemas that are unexpired and match the current config."""
+        if not self._schema_cache_dir or not self._schema_cache_dir.is_dir():
+            return
+
+        restored = 0
+        now = time.time()
+        for ds_id, datasource in self._datasources.items():
+            path = self._schema_cache_file(ds_id)
+            try:
+                entry = orjson.loads(path.read_bytes())
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning("schema_cache_load_failed", datasource_id=ds_id, error=str(e))
+                continue
+
+            age = now - entry.get("cached_at", 0)
+            if (
+                entry.get("fingerprint") != self._schema_fingerprint(datasource)
+                or not 0 <= age < datasource.schema_cache.ttl_seconds
+            ):
+                continue
+
+            datasource.update_schema_cache(entry["tables"], age_seconds=age)
+            restored += 1
+
+        if restored:
+            logger.info("schema_caches_restored", count=restored)
+
+    def _schema_cache_file(self, datasource_id: str) -> Path:
+        """Sidecar file for a datasource (hashed: IDs are free-form user input)."""
+        assert self._schema_cache_dir is not None
+        name = hashlib.sha256(datasource_id.encode("utf-8")).hexdigest()[:32]
+        return self._schema_cache_dir / f"{name}.json"
+
+    @staticmethod
+    def _schema_fingerprint(datasource: Datasource) -> str:
+        """Identify the source a schema was read from; changes invalidate the cache."""
+        if datasource.file_config:
+            path = Path(datasource.file_config.path)
+            stat = path.stat() if path.exists() else None
+            version = (stat.st_mtime_ns, stat.st_size) if stat else None
+            raw = f"{datasource.type.value}\x00{path}\x00{version}"
+        else:
+            connection = datasource.connection_config
+            raw = f"{datasource.type.value}\x00{connection.connection_string if connection else ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
     def _save_config(self) -> None:
-        """Save datasources to config file."""
+        """
+        Mark the config dirty and schedule a write.
+
+        Inside a running event loop, writes are coalesced into a single
+        write after SAVE_DELAY_SECONDS, performed off the loop in a thread.
+        """
         if not self._config_path:
             return
 
+        self._dirty = True
+
         try:
-            config: dict[str, Any] = {
-                "datasources": {},
-                "query_mode": self._current_mode.value,
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.SAVE_DELAY_SECONDS, self._schedule_flush)
+
+    def flush(self) -> None:
+        """Write pending config changes to disk (atomic replace)."""
+        pending = self._take_pending_config()
+        if pending is not None:
+            self._write_config(*pending)
+
+    async def aflush(self) -> None:
+        """
+        Write pending config changes from a worker thread.
+
+        Also waits for writes already in flight, including schema sidecars;
+        the lock keeps them in order.
+        """
+        if self._pending_sidecar_io:
+            await asyncio.gather(*self._pending_sidecar_io)
+        pending = self._take_pending_config()
+        async with self._write_lock:
+            if pending is not None:
+                await asyncio.to_thread(self._write_config, *pending)
+
+    def _schedule_flush(self) -> None:
+        """Debounce timer callback: hand the write off to a background task."""
+        self._flush_handle = None
+        task = asyncio.get_running_loop().create_task(self.aflush())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _take_pending_config(self) -> tuple[dict[str, Any], bytes] | None:
+        """Cancel any scheduled flush and snapshot the config if it is dirty."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._dirty or not self._config_path:
+            return None
+        self._dirty = False
+
+        config = self._serialize_config()
+        return config, orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    def _serialize_config(self) -> dict[str, Any]:
+        """Build the persisted form of the current datasources and mode."""
+        config: dict[str, Any] = {
+            "datasources": {},
+            "query_mode": self._current_mode.value,
+        }
+
+        for ds_id, ds in self._datasources.items():
+            ds_config: dict[str, Any] = {
+                "name": ds.name,
+                "type": ds.type.value,
+                "enabled": ds.enabled,
+                "description": ds.description,
             }
 
-            for ds_id, ds in self._datasources.items():
-                ds_config: dict[str, Any] = {
-                    "name": ds.name,
-                    "type": ds.type.value,
-                    "enabled": ds.enabled,
-                    "description": ds.description,
-                }
+            if ds.connection_config:
+                # Do NOT save connection string to file for security
+                ds_config["connection_string_env"] = f"{ds_id.upper()}_CONNECTION_STRING"
 
-                if ds.connection_config:
-                    # Do NOT save connection string to file for security
-                    ds_config["connection_string_env"] = f"{ds_id.upper()}_CONNECTION_STRING"
+            if ds.file_config:
+                ds_config["path"] = ds.file_config.path
 
-                if ds.file_config:
-                    ds_config["path"] = ds.file_config.path
+            config["datasources"][ds_id] = ds_config
 
-                config["datasources"][ds_id] = ds_config
+        return config
 
+    def _write_config(self, config: dict[str, Any], payload: bytes) -> None:
+        """Atomically replace the config file with ``payload`` (blocking I/O)."""
+        assert self._config_path is not None
+        try:
             self._config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            tmp_path = self._config_path.with_name(f".{self._config_path.name}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self._config_path)
+
+            # What we just wrote is the current parse of the file
+            stat = self._config_path.stat()
+            _CONFIG_CACHE[self._config_path] = ((stat.st_mtime_ns, stat.st_size), config)
 
             logger.debug("config_saved", path=str(self._config_path))
 
@@ -4,16 +4,23 @@ Query Service for executing natural language queries.
 Orchestrates the translation and execution of queries across datasources.
 """
 
-from datetime import datetime
-from typing import Any
+import logging
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, TYPE_CHECKING
 
 import structlog
 
 from src.domain.entities.query import Query, QueryMode, QueryStatus
 from src.domain.entities.result import QueryResult, ResultMetadata
-from src.domain.ports.translator_port import TranslatorPort
 from src.application.services.datasource_service import DatasourceService
-from src.infrastructure.config.settings import Settings
+
+# Only needed for annotations; keeps pydantic-settings out of the import graph
+if TYPE_CHECKING:
+    from src.domain.ports.result_cache_port import ResultCachePort
+    from src.domain.ports.translator_port import TranslatorPort
+    from src.infrastructure.config.settings import Settings
 
 logger = structlog.get_logger(__name__)
 
@@ -28,14 +35,20 @@ class QueryService:
     def __init__(
         self,
         datasource_service: DatasourceService,
-        translator: TranslatorPort,
-        settings: Settings,
+        translator: "TranslatorPort",
+        settings: "Settings",
+        result_cache: "ResultCachePort | None" = None,
     ) -> None:
         self._datasource_service = datasource_service
         self._translator = translator
         self._settings = settings
+        # Results are only reusable when queries cannot modify data
+        self._result_cache = result_cache if settings.read_only_mode else None
         self._last_result: QueryResult | None = None
-        self._query_history: list[Query] = []
+        # Ring buffer: oldest queries are evicted once the limit is reached
+        self._query_history: deque[Query] = deque(
+            maxlen=settings.query_history_max_entries
+        )
 
     async def execute_query(
         self,
@@ -64,12 +77,13 @@ class QueryService:
             timeout_seconds=timeout_seconds or self._settings.query_timeout_seconds,
         )
 
-        logger.info(
-            "executing_natural_language_query",
-            query_id=query.id,
-            input=natural_language[:100],
-            mode=query.mode.value,
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "executing_natural_language_query",
+                query_id=query.id,
+                input=natural_language[:100],
+                mode=query.mode.value,
+            )
 
         try:
             # Get available datasources for mode
@@ -104,18 +118,35 @@ class QueryService:
             if not adapter:
                 raise ValueError(f"Adapter not found for datasource: {translation.target_datasource_id}")
 
-            # Execute query
+            # Execute query (or reuse an identical recent one)
             query.mark_executing()
-            start_time = datetime.utcnow()
+            start_ns = time.perf_counter_ns()
+
+            result = None
+            if self._result_cache:
+                result = await self._result_cache.get(
+                    translation.query_string,
+                    translation.target_datasource_id,
+                    query.max_results,
+                )
 
-            async with adapter:
+            if result is None:
+                await adapter.ensure_connected()
                 result = await adapter.execute(
                     query=translation.query_string,
                     max_results=query.max_results,
                     timeout_seconds=query.timeout_seconds,
                 )
-
-            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                if self._result_cache:
+                    await self._result_cache.put(
+                        translation.query_string,
+                        translation.target_datasource_id,
+                        query.max_results,
+                        result,
+                        ttl_seconds=self._settings.result_cache_ttl_seconds,
+                    )
+
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             query.mark_completed(execution_time_ms)
 
             # Update result with query info
@@ -130,13 +161,14 @@ class QueryService:
             self._last_result = result
             self._query_history.append(query)
 
-            logger.info(
-                "query_executed_successfully",
-                query_id=query.id,
-                row_count=result.row_count,
-                execution_time_ms=execution_time_ms,
-                natural_response=result.natural_response[:100],
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    "query_executed_successfully",
+                    query_id=query.id,
+                    row_count=result.row_count,
+                    execution_time_ms=execution_time_ms,
+                    natural_response=result.natural_response[:100],
+                )
 
             return result
 
@@ -170,11 +202,12 @@ class QueryService:
             preview_only=True,
         )
 
-        logger.info(
-            "generating_query_preview",
-            query_id=query.id,
-            input=natural_language[:100],
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "generating_query_preview",
+                query_id=query.id,
+                input=natural_language[:100],
+            )
 
         try:
             available_datasources = self._datasource_service.get_datasources_for_mode(query.mode)
@@ -249,19 +282,28 @@ class QueryService:
 
     def get_query_history(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get recent query history."""
-        return [q.to_dict() for q in self._query_history[-limit:]]
+        return [q.to_dict() for q in self._recent_queries(limit)]
+
+    async def invalidate_results(self, datasource_id: str) -> None:
+        """Drop cached results for a datasource whose configuration changed."""
+        if self._result_cache:
+            await self._result_cache.invalidate(datasource_id)
 
     def clear_history(self) -> None:
         """Clear query history."""
         self._query_history.clear()
         self._last_result = None
 
+    def _recent_queries(self, limit: int) -> list[Query]:
+        """Last ``limit`` queries, oldest first, without walking the whole history."""
+        return list(islice(reversed(self._query_history), limit))[::-1]
+
     def _build_query_context(self) -> dict[str, Any]:
         """Build context from recent queries."""
         if not self._query_history:
             return {}
 
-        recent = self._query_history[-3:]
+        recent = self._recent_queries(3)
         context = {
             "previous_queries": [
                 {
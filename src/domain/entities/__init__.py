@@ -1,14 +1,36 @@
-"""Domain entities package."""
-
-from src.domain.entities.datasource import (
-    Datasource,
-    DatasourceType,
-    DatasourceCategory,
-    ConnectionConfig,
-    FileConfig,
-)
-from src.domain.entities.query import Query, QueryType, QueryStatus
-from src.domain.entities.result import QueryResult, ResultFormat, ExportFormat
+"""Domain entities package.
+
+Entities are imported lazily on first attribute access, so importing the
+package does not load every entity module.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.domain.entities.datasource import (
+        Datasource,
+        DatasourceType,
+        DatasourceCategory,
+        ConnectionConfig,
+        FileConfig,
+    )
+    from src.domain.entities.query import Query, QueryType, QueryStatus
+    from src.domain.entities.result import QueryResult, ResultFormat, ExportFormat
+
+_LAZY: dict[str, str] = {
+    "Datasource": "src.domain.entities.datasource",
+    "DatasourceType": "src.domain.entities.datasource",
+    "DatasourceCategory": "src.domain.entities.datasource",
+    "ConnectionConfig": "src.domain.entities.datasource",
+    "FileConfig": "src.domain.entities.datasource",
+    "Query": "src.domain.entities.query",
+    "QueryType": "src.domain.entities.query",
+    "QueryStatus": "src.domain.entities.query",
+    "QueryResult": "src.domain.entities.result",
+    "ResultFormat": "src.domain.entities.result",
+    "ExportFormat": "src.domain.entities.result",
+}
 
 __all__ = [
     "Datasource",
@@ -23,3 +45,18 @@ __all__ = [
     "ResultFormat",
     "ExportFormat",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the entity on first access and cache it in the module namespace."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,8 +5,10 @@ This module defines the core entity for managing different types of data sources
 including SQL databases, NoSQL databases, and flat files.
 """
 
+import re
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
@@ -40,24 +42,32 @@ class DatasourceType(str, Enum):
     @property
     def category(self) -> DatasourceCategory:
         """Get the category for this datasource type."""
-        sql_types = {
-            DatasourceType.POSTGRESQL,
-            DatasourceType.MYSQL,
-            DatasourceType.SQLITE,
-            DatasourceType.SQLSERVER,
-            DatasourceType.MARIADB,
-        }
-        nosql_types = {DatasourceType.MONGODB, DatasourceType.DYNAMODB}
-
-        if self in sql_types:
-            return DatasourceCategory.SQL
-        elif self in nosql_types:
-            return DatasourceCategory.NOSQL
-        else:
-            return DatasourceCategory.FILE
+        return _CATEGORY_MAP[self]
+
+
+_CATEGORY_MAP: dict[DatasourceType, DatasourceCategory] = {
+    DatasourceType.POSTGRESQL: DatasourceCategory.SQL,
+    DatasourceType.MYSQL: DatasourceCategory.SQL,
+    DatasourceType.SQLITE: DatasourceCategory.SQL,
+    DatasourceType.SQLSERVER: DatasourceCategory.SQL,
+    DatasourceType.MARIADB: DatasourceCategory.SQL,
+    DatasourceType.MONGODB: DatasourceCategory.NOSQL,
+    DatasourceType.DYNAMODB: DatasourceCategory.NOSQL,
+    DatasourceType.CSV: DatasourceCategory.FILE,
+    DatasourceType.EXCEL: DatasourceCategory.FILE,
+}
+
 
+# user:password in a connection URL
+_CREDENTIALS_RE = re.compile(r"://([^:]+):([^@]+)@")
 
-@dataclass
+
+def mask_credentials(url: str) -> str:
+    """Mask the password in a connection URL for logging."""
+    return _CREDENTIALS_RE.sub(r"://\1:****@", url)
+
+
+@dataclass(frozen=True, slots=True)
 class ConnectionConfig:
     """Configuration for database connections."""
 
@@ -66,9 +76,12 @@ class ConnectionConfig:
     schema: str | None = None
     pool_size: int = 5
     timeout_seconds: int = 30
+    pool_max_overflow: int = 10  # Connections allowed beyond pool_size under load
+    pool_recycle_seconds: int = 3600  # Replace connections before server-side idle timeouts
+    pool_timeout_seconds: int = 30  # Wait for a free pooled connection before failing
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileConfig:
     """Configuration for file-based data sources."""
 
@@ -77,26 +90,28 @@ class FileConfig:
     delimiter: str = ","  # For CSV
     sheet_name: str | None = None  # For Excel
     has_header: bool = True
+    parquet_cache: bool = False  # For CSV: keep a Parquet copy beside the file (needs pyarrow)
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaCache:
     """Cached schema information for a datasource."""
 
     tables: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
-    cached_at: datetime | None = None
+    cached_at: datetime | None = None  # Wall clock, for display only
     ttl_seconds: int = 3600  # 1 hour default
+    # Monotonic timestamp used for TTL checks (immune to clock changes)
+    cached_at_monotonic: float | None = field(default=None, repr=False)
 
     @property
     def is_valid(self) -> bool:
         """Check if the cached schema is still valid."""
-        if self.cached_at is None:
+        if self.cached_at_monotonic is None:
             return False
-        elapsed = (datetime.utcnow() - self.cached_at).total_seconds()
-        return elapsed < self.ttl_seconds
+        return time.monotonic() - self.cached_at_monotonic < self.ttl_seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class Datasource:
     """
     Entity representing a data source.
@@ -117,12 +132,26 @@ class Datasource:
 
     # Metadata and caching
     schema_cache: SchemaCache = field(default_factory=SchemaCache)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    # Serialized form reused by to_dict(); dropped on any attribute write
+    _dict_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Derived from type, kept in sync by __setattr__
+    _category: DatasourceCategory = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "type":
+            object.__setattr__(self, "_category", _CATEGORY_MAP[value])
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
 
     def __post_init__(self) -> None:
         """Validate that the configuration matches the datasource type."""
-        if self.category == DatasourceCategory.FILE:
+        if self._category is DatasourceCategory.FILE:
             if self.file_config is None:
                 raise ValueError(f"File datasource {self.name} requires file_config")
         else:
@@ -132,43 +161,61 @@ class Datasource:
     @property
     def category(self) -> DatasourceCategory:
         """Get the category of this datasource."""
-        return self.type.category
+        return self._category
 
     @property
     def is_sql(self) -> bool:
         """Check if this is a SQL datasource."""
-        return self.category == DatasourceCategory.SQL
+        return self._category is DatasourceCategory.SQL
 
     @property
     def is_nosql(self) -> bool:
         """Check if this is a NoSQL datasource."""
-        return self.category == DatasourceCategory.NOSQL
+        return self._category is DatasourceCategory.NOSQL
 
     @property
     def is_file(self) -> bool:
         """Check if this is a file datasource."""
-        return self.category == DatasourceCategory.FILE
-
-    def update_schema_cache(self, tables: dict[str, list[dict[str, Any]]]) -> None:
-        """Update the cached schema information."""
+        return self._category is DatasourceCategory.FILE
+
+    def update_schema_cache(
+        self,
+        tables: dict[str, list[dict[str, Any]]],
+        age_seconds: float = 0.0,
+    ) -> None:
+        """
+        Update the cached schema information.
+
+        ``age_seconds`` backdates the entry when restoring a schema fetched
+        earlier, so it still expires at its original TTL.
+        """
+        now = datetime.now(UTC)
         self.schema_cache.tables = tables
-        self.schema_cache.cached_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.schema_cache.cached_at = now - timedelta(seconds=age_seconds)
+        self.schema_cache.cached_at_monotonic = time.monotonic() - age_seconds
+        self.updated_at = now
 
     def invalidate_schema_cache(self) -> None:
         """Invalidate the cached schema."""
         self.schema_cache.cached_at = None
+        self.schema_cache.cached_at_monotonic = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation (safe for logging/API)."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type.value,
-            "category": self.category.value,
-            "enabled": self.enabled,
-            "description": self.description,
-            "has_cached_schema": self.schema_cache.is_valid,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "name": self.name,
+                "type": self.type.value,
+                "category": self.category.value,
+                "enabled": self.enabled,
+                "description": self.description,
+                "has_cached_schema": False,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+            }
+
+        # Schema validity depends on the clock (TTL), so it is never cached
+        result = dict(self._dict_cache)
+        result["has_cached_schema"] = self.schema_cache.is_valid
+        return result
@@ -5,11 +5,31 @@ This module defines the Query entity which tracks the lifecycle of a query
 from natural language input through translation and execution.
 """
 
+import re
+import secrets
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
-from uuid import uuid4
+
+from src.domain.entities.datasource import DatasourceCategory
+
+_QUOTED_RE = re.compile(r"('[^']*'|\"[^\"]*\")")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def canonicalize(natural_language: str) -> str:
+    """
+    Normalize a question for exact-match caching.
+
+    Lowercases and collapses whitespace outside quoted literals and drops
+    trailing punctuation; quoted values keep their case ('Alice' != 'alice').
+    """
+    parts = _QUOTED_RE.split(natural_language.strip().rstrip("?.!").strip())
+    return "".join(
+        part if i % 2 else _WHITESPACE_RE.sub(" ", part.lower())
+        for i, part in enumerate(parts)
+    )
 
 
 class QueryType(str, Enum):
@@ -41,8 +61,20 @@ class QueryMode(str, Enum):
     FILES = "files"
     MIXED = "mixed"
 
+    @property
+    def category(self) -> DatasourceCategory | None:
+        """Datasource category this mode is limited to (None for MIXED, which spans all)."""
+        return _MODE_CATEGORY_MAP.get(self)
+
+
+_MODE_CATEGORY_MAP: dict[QueryMode, DatasourceCategory] = {
+    QueryMode.SQL: DatasourceCategory.SQL,
+    QueryMode.NOSQL: DatasourceCategory.NOSQL,
+    QueryMode.FILES: DatasourceCategory.FILE,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TranslationResult:
     """Result of translating natural language to a query."""
 
@@ -57,7 +89,7 @@ class TranslationResult:
     natural_response_template: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Query:
     """
     Entity representing a query from natural language input.
@@ -65,7 +97,8 @@ class Query:
     Tracks the full lifecycle from input through translation and execution.
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    # 128 random bits as hex; nothing parses IDs as UUIDs
+    id: str = field(default_factory=lambda: secrets.token_hex(16))
     natural_language_input: str = ""
     status: QueryStatus = QueryStatus.PENDING
     mode: QueryMode = QueryMode.MIXED
@@ -79,7 +112,7 @@ class Query:
     timeout_seconds: int = 30
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     executed_at: datetime | None = None
     execution_time_ms: int | None = None
 
@@ -87,6 +120,9 @@ class Query:
     error_message: str | None = None
     error_details: dict[str, Any] = field(default_factory=dict)
 
+    # created_at.isoformat(), computed on first serialization
+    _created_at_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def is_translated(self) -> bool:
         """Check if the query has been translated."""
@@ -114,7 +150,7 @@ class Query:
     def mark_executing(self) -> None:
         """Mark query as being executed."""
         self.status = QueryStatus.EXECUTING
-        self.executed_at = datetime.utcnow()
+        self.executed_at = datetime.now(UTC)
 
     def mark_completed(self, execution_time_ms: int) -> None:
         """Mark query as successfully completed."""
@@ -129,28 +165,34 @@ class Query:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+
+        # Enum ._value_ is a plain attribute; .value goes through a descriptor
         result = {
             "id": self.id,
             "natural_language_input": self.natural_language_input,
-            "status": self.status.value,
-            "mode": self.mode.value,
+            "status": self.status._value_,
+            "mode": self.mode._value_,
             "preview_only": self.preview_only,
             "max_results": self.max_results,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_iso,
         }
 
-        if self.translation:
+        translation = self.translation
+        if translation:
             result["translation"] = {
-                "query_string": self.translation.query_string,
-                "query_type": self.translation.query_type.value,
-                "target_datasource_id": self.translation.target_datasource_id,
-                "confidence": self.translation.confidence,
-                "explanation": self.translation.explanation,
-                "warnings": self.translation.warnings,
+                "query_string": translation.query_string,
+                "query_type": translation.query_type._value_,
+                "target_datasource_id": translation.target_datasource_id,
+                "confidence": translation.confidence,
+                "explanation": translation.explanation,
+                "warnings": translation.warnings,
             }
 
-        if self.executed_at:
-            result["executed_at"] = self.executed_at.isoformat()
+        executed_at = self.executed_at
+        if executed_at:
+            result["executed_at"] = executed_at.isoformat()
 
         if self.execution_time_ms is not None:
             result["execution_time_ms"] = self.execution_time_ms
@@ -5,11 +5,20 @@ This module defines the QueryResult entity which holds the data returned
 from executing a query, along with metadata and export capabilities.
 """
 
+import csv
+import io
+import json
+import re
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
+import orjson
+
 
 class ResultFormat(str, Enum):
     """Format of result data."""
@@ -29,7 +38,16 @@ class ExportFormat(str, Enum):
     EXCEL = "excel"
 
 
-@dataclass
+_RESPONSE_PLACEHOLDER_RE = re.compile(r"\{(count|sample)\}")
+
+
+@lru_cache(maxsize=256)
+def _compile_response_template(template: str) -> tuple[str, ...]:
+    """Split a response template into alternating literal and placeholder parts."""
+    return tuple(_RESPONSE_PLACEHOLDER_RE.split(template))
+
+
+@dataclass(frozen=True, slots=True)
 class ColumnInfo:
     """Information about a result column."""
 
@@ -38,11 +56,11 @@ class ColumnInfo:
     nullable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultMetadata:
     """Metadata about query result."""
 
-    total_rows: int = 0
+    total_rows: int = 0  # SQL sources: a lower bound (returned + 1) when truncated
     returned_rows: int = 0
     was_truncated: bool = False
     columns: list[ColumnInfo] = field(default_factory=list)
@@ -51,7 +69,7 @@ class ResultMetadata:
     datasource_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """
     Entity representing the result of a query execution.
@@ -63,7 +81,7 @@ class QueryResult:
     format: ResultFormat = ResultFormat.TABULAR
     data: list[dict[str, Any]] = field(default_factory=list)
     metadata: ResultMetadata = field(default_factory=ResultMetadata)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     # For preview mode
     generated_query: str | None = None
@@ -73,6 +91,13 @@ class QueryResult:
     natural_response_template: str = ""
     natural_response: str = ""
 
+    # created_at.isoformat(), computed on first serialization
+    _created_at_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    # (columns list or first row, names) from the last column_names lookup
+    _column_names: tuple[object, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def is_empty(self) -> bool:
         """Check if the result is empty."""
@@ -86,11 +111,19 @@ class QueryResult:
     @property
     def column_names(self) -> list[str]:
         """Get column names from metadata or infer from data."""
-        if self.metadata.columns:
-            return [col.name for col in self.metadata.columns]
-        elif self.data:
-            return list(self.data[0].keys())
-        return []
+        columns = self.metadata.columns
+        source: object = columns or (self.data[0] if self.data else None)
+        if source is None:
+            return []
+
+        # Recompute only when the columns list or first row is replaced
+        cached = self._column_names
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        names = [col.name for col in columns] if columns else list(source)
+        self._column_names = (source, names)
+        return names
 
     def generate_natural_response(self, template: str = "") -> str:
         """Generate a human-readable response using the template and actual data."""
@@ -98,60 +131,68 @@ class QueryResult:
         if not template:
             template = "Se encontraron {count} resultado(s)."
 
-        # Determine the count value
-        # If result is a single row with a single numeric value (aggregation like COUNT), use that value
-        count_value = len(self.data)
-        if len(self.data) == 1 and len(self.data[0]) == 1:
-            value = list(self.data[0].values())[0]
+        data = self.data
+        # A single row with a single value is an aggregation (e.g. COUNT)
+        is_scalar = len(data) == 1 and len(data[0]) == 1
+
+        # Determine the count value: the aggregated number itself, if numeric
+        count_value = len(data)
+        if is_scalar:
+            value = next(iter(data[0].values()))
             if isinstance(value, (int, float)):
                 count_value = value
 
-        # Format sample data as readable text
+        parts = _compile_response_template(template)
+        placeholders = parts[1::2]
+
+        # Format sample data as readable text (only if the template shows it,
+        # and never for scalar results)
         sample_text = ""
-        if self.data:
-            # If it's a scalar value, don't show it as a sample list
-            if len(self.data) == 1 and len(self.data[0]) == 1:
-               pass
-            else:
-                sample_rows = self.data[:5]  # First 5 rows
-                formatted_rows = []
-                for i, row in enumerate(sample_rows, 1):
-                    row_str = ", ".join(f"{k}: {v}" for k, v in row.items())
-                    formatted_rows.append(f"  {i}. {row_str}")
-                sample_text = "\n".join(formatted_rows)
-                if len(self.data) > 5:
-                    sample_text += f"\n  ... y {len(self.data) - 5} más"
-
-        # Replace placeholders
-        response = template.replace("{count}", str(count_value))
-        response = response.replace("{sample}", sample_text)
+        if data and not is_scalar and "sample" in placeholders:
+            sample_text = "\n".join(
+                f"  {i}. " + ", ".join(f"{k}: {v}" for k, v in row.items())
+                for i, row in enumerate(data[:5], 1)
+            )
+            if len(data) > 5:
+                sample_text += f"\n  ... y {len(data) - 5} más"
+
+        # Fill placeholders: odd parts are placeholder names
+        values = {"count": str(count_value), "sample": sample_text}
+        response = "".join(
+            values[part] if i % 2 else part for i, part in enumerate(parts)
+        )
 
         self.natural_response = response
         return response
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation for API response."""
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+
+        metadata = self.metadata
+        is_preview = self.is_preview
         result: dict[str, Any] = {
             "query_id": self.query_id,
-            "format": self.format.value,
-            "is_preview": self.is_preview,
-            "created_at": self.created_at.isoformat(),
+            "format": self.format._value_,  # Plain attribute, skips the .value descriptor
+            "is_preview": is_preview,
+            "created_at": self._created_at_iso,
             "natural_response": self.natural_response,
             "metadata": {
-                "total_rows": self.metadata.total_rows,
-                "returned_rows": self.metadata.returned_rows,
-                "was_truncated": self.metadata.was_truncated,
-                "execution_time_ms": self.metadata.execution_time_ms,
-                "datasource_id": self.metadata.datasource_id,
-                "datasource_name": self.metadata.datasource_name,
+                "total_rows": metadata.total_rows,
+                "returned_rows": metadata.returned_rows,
+                "was_truncated": metadata.was_truncated,
+                "execution_time_ms": metadata.execution_time_ms,
+                "datasource_id": metadata.datasource_id,
+                "datasource_name": metadata.datasource_name,
                 "columns": [
                     {"name": col.name, "data_type": col.data_type, "nullable": col.nullable}
-                    for col in self.metadata.columns
+                    for col in metadata.columns
                 ],
             },
         }
 
-        if self.is_preview:
+        if is_preview:
             result["generated_query"] = self.generated_query
         else:
             result["data"] = self.data
@@ -163,19 +204,70 @@ class QueryResult:
         if not self.data:
             return ""
 
-        import csv
-        import io
-
+        columns = self.column_names
         output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=self.column_names)
-        writer.writeheader()
-        writer.writerows(self.data)
+        writer = csv.writer(output)
+        writer.writerow(columns)
+        writer.writerows(self._iter_row_values(columns))
         return output.getvalue()
 
+    def iter_csv_chunks(self, chunk_size: int = 65536) -> Iterator[str]:
+        """Yield the result as CSV in chunks of roughly ``chunk_size`` characters."""
+        if not self.data:
+            return
+
+        columns = self.column_names
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(columns)
+        for values in self._iter_row_values(columns):
+            writer.writerow(values)
+            if output.tell() >= chunk_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+        if output.tell():
+            yield output.getvalue()
+
+    def _iter_row_values(self, columns: list[str]) -> Iterator[Sequence[Any]]:
+        """
+        Yield each row's values in ``columns`` order.
+
+        Uniform rows go through a C-level itemgetter; rows missing a column
+        fall back to per-key lookups with "" (as csv.DictWriter would).
+        """
+        if not columns:
+            yield from (() for _ in self.data)
+            return
+
+        getter = itemgetter(*columns)
+        single = len(columns) == 1
+        for row in self.data:
+            try:
+                values = getter(row)
+            except KeyError:
+                yield [row.get(column, "") for column in columns]
+                continue
+            yield (values,) if single else values
+
+    def iter_json_chunks(self, batch_size: int = 1000) -> Iterator[bytes]:
+        """Yield the result as a JSON array, serializing ``batch_size`` rows at a time."""
+        options = orjson.OPT_NON_STR_KEYS
+        yield b"["
+        for start in range(0, len(self.data), batch_size):
+            batch = orjson.dumps(self.data[start:start + batch_size], default=str, option=options)
+            # Strip the batch's own brackets and join batches with a comma
+            yield (b"," if start else b"") + batch[1:-1]
+        yield b"]"
+
     def to_json_string(self, indent: int = 2) -> str:
         """Convert result to JSON string."""
-        import json
+        if indent == 2:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(self.data, default=str, option=options).decode()
 
+        # orjson only supports two-space indentation
         return json.dumps(self.data, indent=indent, default=str)
 
     def get_preview_response(self) -> dict[str, Any]:
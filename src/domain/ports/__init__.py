@@ -3,5 +3,6 @@
 from src.domain.ports.datasource_port import DatasourcePort
 from src.domain.ports.translator_port import TranslatorPort
 from src.domain.ports.schema_port import SchemaPort
+from src.domain.ports.result_cache_port import ResultCachePort
 
-__all__ = ["DatasourcePort", "TranslatorPort", "SchemaPort"]
+__all__ = ["DatasourcePort", "TranslatorPort", "SchemaPort", "ResultCachePort"]
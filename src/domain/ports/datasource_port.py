@@ -5,6 +5,8 @@ This module defines the interface that all datasource adapters must implement,
 following the Hexagonal Architecture (Ports & Adapters) pattern.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -24,6 +26,8 @@ class DatasourcePort(ABC):
         """Initialize the adapter with a datasource configuration."""
         self._datasource = datasource
         self._connected = False
+        self._connect_lock = asyncio.Lock()
+        self._last_used = time.monotonic()
 
     @property
     def datasource(self) -> Datasource:
@@ -35,6 +39,11 @@ class DatasourcePort(ABC):
         """Check if currently connected to the datasource."""
         return self._connected
 
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the adapter was last requested through ensure_connected()."""
+        return time.monotonic() - self._last_used
+
     @abstractmethod
     async def connect(self) -> bool:
         """
@@ -48,6 +57,20 @@ class DatasourcePort(ABC):
         """
         pass
 
+    async def ensure_connected(self) -> None:
+        """
+        Connect once and keep the connection (pool) open for reuse.
+
+        Safe to call concurrently: only the first caller connects. Every call
+        counts as a use for idle eviction.
+        """
+        self._last_used = time.monotonic()
+        if self._connected:
+            return
+        async with self._connect_lock:
+            if not self._connected:
+                await self.connect()
+
     @abstractmethod
     async def disconnect(self) -> None:
         """
@@ -118,8 +141,9 @@ class DatasourcePort(ABC):
         pass
 
     async def __aenter__(self) -> "DatasourcePort":
-        """Async context manager entry."""
-        await self.connect()
+        """Async context manager entry (reuses an already open connection)."""
+        if not self._connected:
+            await self.connect()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -0,0 +1,70 @@
+"""
+Abstract port for query result caching.
+
+This module defines the interface for caching executed query results so that
+identical queries against the same datasource can skip execution.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.domain.entities.result import QueryResult
+
+
+class ResultCachePort(ABC):
+    """
+    Abstract port for query result caching.
+
+    Entries are keyed by the executed query string, the target datasource
+    and the row limit, and expire after a TTL.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        query: str,
+        datasource_id: str,
+        max_results: int,
+    ) -> QueryResult | None:
+        """
+        Retrieve a cached result if available and not expired.
+
+        Args:
+            query: The executed query string
+            datasource_id: ID of the datasource it ran against
+            max_results: Row limit it ran with
+
+        Returns:
+            A copy of the cached result, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    async def put(
+        self,
+        query: str,
+        datasource_id: str,
+        max_results: int,
+        result: QueryResult,
+        ttl_seconds: int = 60,
+    ) -> None:
+        """
+        Cache a query result.
+
+        Args:
+            query: The executed query string
+            datasource_id: ID of the datasource it ran against
+            max_results: Row limit it ran with
+            result: Result to cache
+            ttl_seconds: Time-to-live for cache entry
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, datasource_id: str | None = None) -> None:
+        """
+        Drop cached results for a datasource, or all results if None.
+
+        Args:
+            datasource_id: ID of the datasource
+        """
+        pass
@@ -5,6 +5,7 @@ This module defines the interface for LLM-based translators that convert
 natural language queries into executable database queries.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -45,6 +46,33 @@ class TranslatorPort(ABC):
         """
         pass
 
+    async def translate_batch(
+        self,
+        natural_languages: list[str],
+        available_datasources: list[Datasource],
+        mode: QueryMode,
+        context: dict[str, Any] | None = None,
+    ) -> list[TranslationResult]:
+        """
+        Translate several natural language queries against the same datasources.
+
+        The default translates them concurrently, one call each; LLM-backed
+        implementations may override it to send the shared schema context once.
+
+        Args:
+            natural_languages: User queries in natural language
+            available_datasources: List of datasources available for querying
+            mode: Current query mode (sql, nosql, files, mixed)
+            context: Optional additional context shared by all queries
+
+        Returns:
+            One TranslationResult per query, in input order.
+        """
+        return list(await asyncio.gather(*(
+            self.translate(natural_language, available_datasources, mode, context)
+            for natural_language in natural_languages
+        )))
+
     @abstractmethod
     async def clarify(
         self,
@@ -102,3 +130,12 @@ class TranslatorPort(ABC):
             List of suggested natural language queries.
         """
         pass
+
+    async def warm_up(self) -> None:
+        """
+        Prepare the translator for its first request.
+
+        Optional hook called at startup; implementations may open provider
+        connections here so the first user query doesn't pay for them.
+        """
+        return None
@@ -5,6 +5,7 @@ Follows Dependency Inversion Principle - high-level modules don't depend on low-
 Both depend on abstractions.
 """
 
+import importlib
 from typing import Protocol
 
 from src.domain.entities.datasource import Datasource, DatasourceType
@@ -33,27 +34,59 @@ class AdapterFactory:
 
     def __init__(self) -> None:
         self._adapters: dict[DatasourceType, type[DatasourcePort]] = {}
+        # ds_type -> (module path, class name), imported on first create()
+        self._lazy_adapters: dict[DatasourceType, tuple[str, str]] = {}
+        self._frozen = False
 
     def register(self, ds_type: DatasourceType, adapter_class: type[DatasourcePort]) -> None:
         """Register an adapter class for a datasource type."""
+        self._check_not_frozen()
+        self._lazy_adapters.pop(ds_type, None)
         self._adapters[ds_type] = adapter_class
 
+    def register_lazy(self, ds_type: DatasourceType, module_path: str, class_name: str) -> None:
+        """Register an adapter by import path; its module is imported on first use."""
+        self._check_not_frozen()
+        self._adapters.pop(ds_type, None)
+        self._lazy_adapters[ds_type] = (module_path, class_name)
+
+    def _check_not_frozen(self) -> None:
+        """Raise if registrations are no longer accepted."""
+        if self._frozen:
+            raise ValueError("Adapter factory is frozen; create a new factory to register adapters")
+
+    def freeze(self) -> None:
+        """Reject further registrations (the default factory is shared process-wide)."""
+        self._frozen = True
+
     def create(self, datasource: Datasource) -> DatasourcePort:
         """Create an adapter for the given datasource."""
-        adapter_class = self._adapters.get(datasource.type)
-        if not adapter_class:
-            raise ValueError(f"No adapter registered for type: {datasource.type.value}")
+        try:
+            adapter_class = self._adapters[datasource.type]
+        except KeyError:
+            adapter_class = self._resolve_lazy(datasource.type)
 
         return adapter_class(datasource)
 
+    def _resolve_lazy(self, ds_type: DatasourceType) -> type[DatasourcePort]:
+        """Import a lazily registered adapter class and cache it."""
+        try:
+            module_path, class_name = self._lazy_adapters.pop(ds_type)
+        except KeyError:
+            raise ValueError(f"No adapter registered for type: {ds_type.value}") from None
+
+        adapter_class = getattr(importlib.import_module(module_path), class_name)
+        self._adapters[ds_type] = adapter_class
+        return adapter_class
+
     def supports(self, ds_type: DatasourceType) -> bool:
         """Check if this factory supports the given datasource type."""
-        return ds_type in self._adapters
+        return ds_type in self._adapters or ds_type in self._lazy_adapters
 
     @property
     def supported_types(self) -> list[DatasourceType]:
         """Get list of supported datasource types."""
-        return list(self._adapters.keys())
+        return [*self._adapters, *self._lazy_adapters]
 
 
 def create_default_factory() -> AdapterFactory:
@@ -63,27 +96,40 @@ def create_default_factory() -> AdapterFactory:
     This is a convenience function that creates a pre-configured factory.
     For testing, you can create an empty factory and register mock adapters.
     """
-    # Import here to avoid circular imports and allow lazy loading
-    from src.infrastructure.adapters.sql import (
-        PostgreSQLAdapter,
-        MySQLAdapter,
-        SQLiteAdapter,
-    )
-    from src.infrastructure.adapters.nosql import MongoDBAdapter
-    from src.infrastructure.adapters.files import CSVAdapter, ExcelAdapter
-
     factory = AdapterFactory()
 
-    # Register SQL adapters
-    factory.register(DatasourceType.POSTGRESQL, PostgreSQLAdapter)
-    factory.register(DatasourceType.MYSQL, MySQLAdapter)
-    factory.register(DatasourceType.SQLITE, SQLiteAdapter)
-
-    # Register NoSQL adapters
-    factory.register(DatasourceType.MONGODB, MongoDBAdapter)
-
-    # Register file adapters
-    factory.register(DatasourceType.CSV, CSVAdapter)
-    factory.register(DatasourceType.EXCEL, ExcelAdapter)
+    # Adapter modules pull in heavy drivers (pandas, pymongo), so they are
+    # only imported once a datasource of that type is actually used
+    factory.register_lazy(
+        DatasourceType.POSTGRESQL,
+        "src.infrastructure.adapters.sql.postgresql_adapter",
+        "PostgreSQLAdapter",
+    )
+    factory.register_lazy(
+        DatasourceType.MYSQL,
+        "src.infrastructure.adapters.sql.mysql_adapter",
+        "MySQLAdapter",
+    )
+    factory.register_lazy(
+        DatasourceType.SQLITE,
+        "src.infrastructure.adapters.sql.sqlite_adapter",
+        "SQLiteAdapter",
+    )
+    factory.register_lazy(
+        DatasourceType.MONGODB,
+        "src.infrastructure.adapters.nosql.mongodb_adapter",
+        "MongoDBAdapter",
+    )
+    factory.register_lazy(
+        DatasourceType.CSV,
+        "src.infrastructure.adapters.files.csv_adapter",
+        "CSVAdapter",
+    )
+    factory.register_lazy(
+        DatasourceType.EXCEL,
+        "src.infrastructure.adapters.files.excel_adapter",
+        "ExcelAdapter",
+    )
 
+    factory.freeze()
     return factory
@@ -0,0 +1,30 @@
+"""
+Helpers shared by the file adapters.
+"""
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+# Dedicated pool for file parsing and DuckDB queries, so they neither starve nor are
+# starved by other users of the loop's default executor
+IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="file-io")
+atexit.register(IO_POOL.shutdown)
+
+
+def describe_columns(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Schema entries for a DataFrame, computing nulls and samples in one pass each."""
+    sample = df.head(3)
+    return [
+        {
+            "name": str(col),
+            "type": str(dtype),
+            "nullable": bool(has_nulls),
+            "sample_values": sample.iloc[:, i].tolist(),
+        }
+        for i, (col, dtype, has_nulls) in enumerate(
+            zip(df.columns, df.dtypes, df.isna().any(), strict=True)
+        )
+    ]
@@ -5,13 +5,17 @@ Provides CSV-specific implementation of the DatasourcePort.
 """
 
 import asyncio
-from datetime import datetime
+import hashlib
+import importlib.util
+import logging
+import re
+import time
 from pathlib import Path
 from typing import Any
 
+import duckdb
 import pandas as pd
 import structlog
-from pandasql import sqldf
 
 from src.domain.entities.datasource import Datasource
 from src.domain.entities.result import (
@@ -21,21 +25,88 @@ from src.domain.entities.result import (
     ColumnInfo,
 )
 from src.domain.ports.datasource_port import DatasourcePort
+from src.infrastructure.adapters.files import frame_cache
+from src.infrastructure.adapters.files.common import IO_POOL, describe_columns
+from src.infrastructure.adapters.files.sandbox import ensure_read_only, lock_down
 
 logger = structlog.get_logger(__name__)
 
+# {{table}} and $table placeholders for the table name
+_PLACEHOLDER_RE = re.compile(r"\{\{table\}\}|\$table")
+
+# pyarrow is optional: it enables the Arrow CSV reader and Parquet sidecars
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# The multithreaded Arrow CSV reader when available, otherwise pandas'
+# C engine reading straight from a memory-mapped file
+_CSV_READ_OPTIONS: dict[str, Any] = (
+    {"engine": "pyarrow"} if _HAS_PYARROW else {"engine": "c", "memory_map": True}
+)
+
+
+def _parquet_sidecar(file_path: Path, *options: Any) -> Path:
+    """Hidden Parquet cache path for this version of the file and parse options."""
+    stat = file_path.stat()
+    raw = repr((stat.st_mtime_ns, stat.st_size, *options)).encode("utf-8")
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    return file_path.with_name(f".{file_path.name}.{digest}.parquet")
+
+
+def _read_csv(
+    file_path: Path,
+    encoding: str,
+    delimiter: str,
+    has_header: bool,
+    parquet_cache: bool,
+) -> pd.DataFrame:
+    """Parse a CSV file, going through its Parquet sidecar when enabled."""
+    sidecar = None
+    if parquet_cache and _HAS_PYARROW:
+        sidecar = _parquet_sidecar(file_path, encoding, delimiter, has_header)
+        if sidecar.exists():
+            return pd.read_parquet(sidecar)
+
+    df = pd.read_csv(
+        file_path,
+        encoding=encoding,
+        delimiter=delimiter,
+        header=0 if has_header else None,
+        **_CSV_READ_OPTIONS,
+    )
+
+    if sidecar is not None:
+        try:
+            # Sidecars of older file versions are dropped
+            for stale in file_path.parent.glob(f".{file_path.name}.*.parquet"):
+                stale.unlink(missing_ok=True)
+            df.to_parquet(sidecar, compression="zstd")
+        except Exception as e:
+            logger.warning("parquet_sidecar_write_failed", path=str(sidecar), error=str(e))
+
+    return df
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Whether DuckDB can scan a file in this encoding without transcoding."""
+    return encoding.lower().replace("-", "").replace("_", "") == "utf8"
+
 
 class CSVAdapter(DatasourcePort):
     """
     CSV file adapter using Pandas.
 
-    Loads CSV files into DataFrames and executes SQL queries using pandasql.
+    Loads CSV files into DataFrames and executes SQL queries over them with DuckDB.
+    Files of at least STREAM_THRESHOLD_BYTES are not loaded; DuckDB scans them
+    on each query instead, so memory stays bounded and LIMITs stop the scan early.
     """
 
+    STREAM_THRESHOLD_BYTES = 200 * 1024 * 1024
+
     def __init__(self, datasource: Datasource) -> None:
         super().__init__(datasource)
         self._dataframe: pd.DataFrame | None = None
         self._table_name: str = ""
+        self._connection: duckdb.DuckDBPyConnection | None = None
 
     def _get_file_path(self) -> Path:
         """Get the file path from configuration."""
@@ -61,21 +132,38 @@ class CSVAdapter(DatasourcePort):
             encoding = self._datasource.file_config.encoding if self._datasource.file_config else "utf-8"
             delimiter = self._datasource.file_config.delimiter if self._datasource.file_config else ","
             has_header = self._datasource.file_config.has_header if self._datasource.file_config else True
+            parquet_cache = self._datasource.file_config.parquet_cache if self._datasource.file_config else False
 
-            # Load CSV in thread pool
+            # Use filename without extension as table name
+            self._table_name = file_path.stem.replace("-", "_").replace(" ", "_").lower()
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = duckdb.connect()
+
+            size_bytes = file_path.stat().st_size
+            if size_bytes >= self.STREAM_THRESHOLD_BYTES and _is_utf8(encoding):
+                self._dataframe = None
+                self._connection.execute(self._scan_view_sql(file_path, delimiter, has_header))
+                lock_down(self._connection, allowed_paths=[str(file_path)])
+                self._connected = True
+                logger.info(
+                    "csv_attached_for_streaming",
+                    datasource_id=self._datasource.id,
+                    size_bytes=size_bytes,
+                )
+                return True
+
+            # Load CSV in thread pool, reusing the parse while the file is unchanged
             def _load_csv() -> pd.DataFrame:
-                return pd.read_csv(
+                return frame_cache.load_cached(
                     file_path,
-                    encoding=encoding,
-                    delimiter=delimiter,
-                    header=0 if has_header else None,
+                    ("csv", encoding, delimiter, has_header),
+                    lambda: _read_csv(file_path, encoding, delimiter, has_header, parquet_cache),
                 )
 
             loop = asyncio.get_event_loop()
-            self._dataframe = await loop.run_in_executor(None, _load_csv)
-
-            # Use filename without extension as table name
-            self._table_name = file_path.stem.replace("-", "_").replace(" ", "_").lower()
+            self._dataframe = await loop.run_in_executor(IO_POOL, _load_csv)
+            lock_down(self._connection)
 
             self._connected = True
             logger.info(
@@ -94,15 +182,28 @@ class CSVAdapter(DatasourcePort):
             )
             raise ConnectionError(f"Failed to load CSV: {e}") from e
 
+    def _scan_view_sql(self, file_path: Path, delimiter: str, has_header: bool) -> str:
+        """SQL creating a view that scans the CSV file under the table name."""
+        path = str(file_path).replace("'", "''")
+        delim = delimiter.replace("'", "''")
+        table = self._table_name.replace('"', '""')
+        return (
+            f'CREATE VIEW "{table}" AS SELECT * FROM read_csv('
+            f"'{path}', delim = '{delim}', header = {'true' if has_header else 'false'})"
+        )
+
     async def disconnect(self) -> None:
         """Release DataFrame from memory."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
         self._dataframe = None
         self._connected = False
         logger.info("csv_unloaded", datasource_id=self._datasource.id)
 
     async def validate_connection(self) -> bool:
-        """Check if DataFrame is loaded."""
-        return self._dataframe is not None
+        """Check if the CSV is loaded or attached."""
+        return self._connection is not None
 
     async def execute(
         self,
@@ -112,19 +213,20 @@ class CSVAdapter(DatasourcePort):
         timeout_seconds: int = 30,
     ) -> QueryResult:
         """
-        Execute SQL query against the CSV data using pandasql.
+        Execute SQL query against the CSV data using DuckDB.
 
         The table name in the query should match the CSV filename (without extension).
         """
-        if self._dataframe is None:
+        if self._connection is None:
             raise ConnectionError("CSV file not loaded")
 
-        start_time = datetime.utcnow()
-        logger.info(
-            "executing_csv_query",
-            datasource_id=self._datasource.id,
-            query_preview=query[:100] + "..." if len(query) > 100 else query,
-        )
+        start_ns = time.perf_counter_ns()
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "executing_csv_query",
+                datasource_id=self._datasource.id,
+                query_preview=query[:100] + "..." if len(query) > 100 else query,
+            )
 
         try:
             result = await asyncio.wait_for(
@@ -132,9 +234,7 @@ class CSVAdapter(DatasourcePort):
                 timeout=timeout_seconds,
             )
 
-            execution_time_ms = int(
-                (datetime.utcnow() - start_time).total_seconds() * 1000
-            )
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             logger.info(
                 "csv_query_executed",
@@ -179,43 +279,51 @@ class CSVAdapter(DatasourcePort):
         query: str,
         max_results: int,
     ) -> dict[str, Any]:
-        """Execute SQL query using pandasql."""
+        """Execute SQL query with DuckDB directly over the loaded DataFrames."""
 
         def _run_query() -> dict[str, Any]:
-            if self._dataframe is None:
+            if self._connection is None:
                 raise ConnectionError("DataFrame not loaded")
 
-            # Make DataFrame available to pandasql using the table name
-            env = {self._table_name: self._dataframe}
-
-            # Replace common table name placeholders
-            normalized_query = query.replace("{{table}}", self._table_name)
-            normalized_query = normalized_query.replace("$table", self._table_name)
-
-            # Execute query
-            result_df = sqldf(normalized_query, env)
-
-            # Get total rows
-            total_rows = len(result_df)
-            was_truncated = total_rows > max_results
-
-            # Limit results
-            if was_truncated:
-                result_df = result_df.head(max_results)
+            # Replace common table name placeholders in one pass
+            name = self._table_name
+            normalized_query = _PLACEHOLDER_RE.sub(lambda _: name, query)
+            ensure_read_only(normalized_query)
+
+            # Registered DataFrames are scanned in place (no copy) and are
+            # scoped to the cursor, so concurrent queries each get their own
+            with self._connection.cursor() as cursor:
+                if self._dataframe is not None:
+                    cursor.register(self._table_name, self._dataframe)
+                relation = cursor.sql(normalized_query)
+                if relation is None:
+                    # Statement without a result set
+                    names, types, rows = [], [], []
+                else:
+                    names = relation.columns
+                    types = [str(t) for t in relation.types]
+                    # LIMIT is pushed into DuckDB; one extra row flags truncation
+                    rows = relation.limit(max_results + 1).fetchall()
+
+                was_truncated = len(rows) > max_results
+                data = [dict(zip(names, row, strict=True)) for row in rows[:max_results]]
+                total_rows = (
+                    relation.aggregate("count(*)").fetchone()[0]  # type: ignore[union-attr,index]
+                    if was_truncated
+                    else len(data)
+                )
 
-            # Build column info
+            # One pass over the rows for every column's null check
+            null_columns = {k for row in data for k, v in row.items() if v is None}
             columns = [
                 ColumnInfo(
-                    name=str(col),
-                    data_type=str(result_df[col].dtype),
-                    nullable=result_df[col].isnull().any(),
+                    name=name,
+                    data_type=data_type,
+                    nullable=name in null_columns,
                 )
-                for col in result_df.columns
+                for name, data_type in zip(names, types, strict=True)
             ]
 
-            # Convert to list of dicts
-            data = result_df.to_dict(orient="records")
-
             return {
                 "data": data,
                 "total_rows": total_rows,
@@ -224,23 +332,43 @@ class CSVAdapter(DatasourcePort):
             }
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run_query)
+        return await loop.run_in_executor(IO_POOL, _run_query)
 
     async def get_schema(self) -> dict[str, list[dict[str, Any]]]:
         """Get CSV schema (column info)."""
-        if self._dataframe is None:
+        if self._connection is None:
             raise ConnectionError("CSV file not loaded")
 
-        columns = []
-        for col in self._dataframe.columns:
-            columns.append({
-                "name": str(col),
-                "type": str(self._dataframe[col].dtype),
-                "nullable": bool(self._dataframe[col].isnull().any()),
-                "sample_values": self._dataframe[col].head(3).tolist(),
-            })
+        if self._dataframe is None:
+            return {self._table_name: await self._get_streamed_columns()}
+
+        return {self._table_name: describe_columns(self._dataframe)}
+
+    async def _get_streamed_columns(self) -> list[dict[str, Any]]:
+        """Column info for a streamed file, from DuckDB's sniffed types and a few rows."""
+
+        def _describe() -> list[dict[str, Any]]:
+            if self._connection is None:
+                raise ConnectionError("CSV file not loaded")
+
+            table = self._table_name.replace('"', '""')
+            with self._connection.cursor() as cursor:
+                described = cursor.execute(f'DESCRIBE "{table}"').fetchall()
+                sample = cursor.execute(f'SELECT * FROM "{table}" LIMIT 3').fetchall()
+
+            # DESCRIBE rows: (name, type, null, key, default, extra)
+            return [
+                {
+                    "name": name,
+                    "type": data_type,
+                    "nullable": null == "YES",
+                    "sample_values": [row[i] for row in sample],
+                }
+                for i, (name, data_type, null, *_) in enumerate(described)
+            ]
 
-        return {self._table_name: columns}
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(IO_POOL, _describe)
 
     async def get_tables(self) -> list[str]:
         """Get table name (CSV filename)."""
@@ -5,13 +5,16 @@ Provides Excel-specific implementation of the DatasourcePort.
 """
 
 import asyncio
-from datetime import datetime
+import importlib.util
+import logging
+import re
+import time
 from pathlib import Path
 from typing import Any
 
+import duckdb
 import pandas as pd
 import structlog
-from pandasql import sqldf
 
 from src.domain.entities.datasource import Datasource
 from src.domain.entities.result import (
@@ -21,15 +24,25 @@ from src.domain.entities.result import (
     ColumnInfo,
 )
 from src.domain.ports.datasource_port import DatasourcePort
+from src.infrastructure.adapters.files import frame_cache
+from src.infrastructure.adapters.files.common import IO_POOL, describe_columns
+from src.infrastructure.adapters.files.sandbox import ensure_read_only, lock_down
 
 logger = structlog.get_logger(__name__)
 
+# {{sheet}} and $sheet placeholders for the active sheet name
+_PLACEHOLDER_RE = re.compile(r"\{\{sheet\}\}|\$sheet")
+
+# The Rust calamine reader when python-calamine is installed (optional, also
+# reads .xls/.ods); otherwise openpyxl, which pandas opens read-only already
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
 
 class ExcelAdapter(DatasourcePort):
     """
     Excel file adapter using Pandas.
 
-    Loads Excel files into DataFrames and executes SQL queries using pandasql.
+    Loads Excel files into DataFrames and executes SQL queries over them with DuckDB.
     Supports .xlsx and .xls formats.
     """
 
@@ -37,6 +50,7 @@ class ExcelAdapter(DatasourcePort):
         super().__init__(datasource)
         self._dataframes: dict[str, pd.DataFrame] = {}
         self._active_sheet: str = ""
+        self._connection: duckdb.DuckDBPyConnection | None = None
 
     def _get_file_path(self) -> Path:
         """Get the file path from configuration."""
@@ -62,17 +76,21 @@ class ExcelAdapter(DatasourcePort):
             sheet_name = self._datasource.file_config.sheet_name if self._datasource.file_config else None
 
             # Load Excel in thread pool
-            def _load_excel() -> dict[str, pd.DataFrame]:
+            def _read_excel() -> dict[str, pd.DataFrame]:
                 if sheet_name:
                     # Load specific sheet
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
+                    df = pd.read_excel(file_path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
                     return {sheet_name: df}
                 else:
                     # Load all sheets
-                    return pd.read_excel(file_path, sheet_name=None, engine="openpyxl")
+                    return pd.read_excel(file_path, sheet_name=None, engine=_EXCEL_ENGINE)
+
+            def _load_excel() -> dict[str, pd.DataFrame]:
+                # Reuse the parse while the file is unchanged; copy the shared dict
+                return dict(frame_cache.load_cached(file_path, ("excel", sheet_name), _read_excel))
 
             loop = asyncio.get_event_loop()
-            self._dataframes = await loop.run_in_executor(None, _load_excel)
+            self._dataframes = await loop.run_in_executor(IO_POOL, _load_excel)
 
             # Normalize sheet names for SQL compatibility
             normalized: dict[str, pd.DataFrame] = {}
@@ -86,6 +104,8 @@ class ExcelAdapter(DatasourcePort):
             if self._dataframes:
                 self._active_sheet = list(self._dataframes.keys())[0]
 
+            self._connection = duckdb.connect()
+            lock_down(self._connection)
             self._connected = True
             logger.info(
                 "excel_loaded",
@@ -104,6 +124,9 @@ class ExcelAdapter(DatasourcePort):
 
     async def disconnect(self) -> None:
         """Release DataFrames from memory."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
         self._dataframes.clear()
         self._connected = False
         logger.info("excel_unloaded", datasource_id=self._datasource.id)
@@ -120,19 +143,20 @@ class ExcelAdapter(DatasourcePort):
         timeout_seconds: int = 30,
     ) -> QueryResult:
         """
-        Execute SQL query against Excel data using pandasql.
+        Execute SQL query against Excel data using DuckDB.
 
         Table names in the query should match sheet names (normalized).
         """
         if not self._dataframes:
             raise ConnectionError("Excel file not loaded")
 
-        start_time = datetime.utcnow()
-        logger.info(
-            "executing_excel_query",
-            datasource_id=self._datasource.id,
-            query_preview=query[:100] + "..." if len(query) > 100 else query,
-        )
+        start_ns = time.perf_counter_ns()
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "executing_excel_query",
+                datasource_id=self._datasource.id,
+                query_preview=query[:100] + "..." if len(query) > 100 else query,
+            )
 
         try:
             result = await asyncio.wait_for(
@@ -140,9 +164,7 @@ class ExcelAdapter(DatasourcePort):
                 timeout=timeout_seconds,
             )
 
-            execution_time_ms = int(
-                (datetime.utcnow() - start_time).total_seconds() * 1000
-            )
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             logger.info(
                 "excel_query_executed",
@@ -187,43 +209,54 @@ class ExcelAdapter(DatasourcePort):
         query: str,
         max_results: int,
     ) -> dict[str, Any]:
-        """Execute SQL query using pandasql."""
+        """Execute SQL query with DuckDB directly over the loaded DataFrames."""
 
         def _run_query() -> dict[str, Any]:
-            if not self._dataframes:
+            if not self._dataframes or self._connection is None:
                 raise ConnectionError("DataFrames not loaded")
 
-            # Make all DataFrames available to pandasql
-            env = dict(self._dataframes)
-
-            # Replace common table name placeholders
-            normalized_query = query.replace("{{sheet}}", self._active_sheet)
-            normalized_query = normalized_query.replace("$sheet", self._active_sheet)
-
-            # Execute query
-            result_df = sqldf(normalized_query, env)
-
-            # Get total rows
-            total_rows = len(result_df)
-            was_truncated = total_rows > max_results
-
-            # Limit results
-            if was_truncated:
-                result_df = result_df.head(max_results)
+            # Replace common table name placeholders in one pass
+            name = self._active_sheet
+            normalized_query = _PLACEHOLDER_RE.sub(lambda _: name, query)
+            ensure_read_only(normalized_query)
+
+            # Registered DataFrames are scanned in place (no copy) and are
+            # scoped to the cursor, so concurrent queries each get their own.
+            # Only sheets the query can reference are registered (names are lowercase).
+            query_text = normalized_query.lower()
+            with self._connection.cursor() as cursor:
+                for sheet_name, df in self._dataframes.items():
+                    if sheet_name in query_text:
+                        cursor.register(sheet_name, df)
+                relation = cursor.sql(normalized_query)
+                if relation is None:
+                    # Statement without a result set
+                    names, types, rows = [], [], []
+                else:
+                    names = relation.columns
+                    types = [str(t) for t in relation.types]
+                    # LIMIT is pushed into DuckDB; one extra row flags truncation
+                    rows = relation.limit(max_results + 1).fetchall()
+
+                was_truncated = len(rows) > max_results
+                data = [dict(zip(names, row, strict=True)) for row in rows[:max_results]]
+                total_rows = (
+                    relation.aggregate("count(*)").fetchone()[0]  # type: ignore[union-attr,index]
+                    if was_truncated
+                    else len(data)
+                )
 
-            # Build column info
+            # One pass over the rows for every column's null check
+            null_columns = {k for row in data for k, v in row.items() if v is None}
             columns = [
                 ColumnInfo(
-                    name=str(col),
-                    data_type=str(result_df[col].dtype),
-                    nullable=result_df[col].isnull().any(),
+                    name=name,
+                    data_type=data_type,
+                    nullable=name in null_columns,
                 )
-                for col in result_df.columns
+                for name, data_type in zip(names, types, strict=True)
             ]
 
-            # Convert to list of dicts
-            data = result_df.to_dict(orient="records")
-
             return {
                 "data": data,
                 "total_rows": total_rows,
@@ -232,7 +265,7 @@ class ExcelAdapter(DatasourcePort):
             }
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run_query)
+        return await loop.run_in_executor(IO_POOL, _run_query)
 
     async def get_schema(self) -> dict[str, list[dict[str, Any]]]:
         """Get Excel schema (all sheets and their columns)."""
@@ -242,15 +275,7 @@ class ExcelAdapter(DatasourcePort):
         schema: dict[str, list[dict[str, Any]]] = {}
 
         for sheet_name, df in self._dataframes.items():
-            columns = []
-            for col in df.columns:
-                columns.append({
-                    "name": str(col),
-                    "type": str(df[col].dtype),
-                    "nullable": bool(df[col].isnull().any()),
-                    "sample_values": df[col].head(3).tolist(),
-                })
-            schema[sheet_name] = columns
+            schema[sheet_name] = describe_columns(df)
 
         return schema
 
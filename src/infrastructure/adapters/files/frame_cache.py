@@ -0,0 +1,54 @@
+"""
+Process-wide cache of parsed file datasources.
+
+Parsing dominates file connect time, so parsed DataFrames are reused across
+(re)connects while the file's mtime and size are unchanged.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+MAX_ENTRIES = 32
+
+# (resolved path, *parse options) -> ((st_mtime_ns, st_size), parsed value)
+_CACHE: OrderedDict[tuple[Any, ...], tuple[tuple[int, int], Any]] = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def load_cached(path: Path, options: tuple[Any, ...], load: Callable[[], _T]) -> _T:
+    """
+    Return the cached parse of ``path`` for ``options``, calling ``load`` on a miss.
+
+    Callers share the cached value and must not mutate it. Safe to call from
+    executor threads.
+    """
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    key = (str(path.resolve()), *options)
+
+    with _LOCK:
+        cached = _CACHE.get(key)
+        if cached and cached[0] == version:
+            _CACHE.move_to_end(key)
+            return cached[1]  # type: ignore[no-any-return]
+
+    value = load()
+
+    with _LOCK:
+        _CACHE[key] = (version, value)
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+
+    return value
+
+
+def clear() -> None:
+    """Drop all cached parses."""
+    with _LOCK:
+        _CACHE.clear()
@@ -0,0 +1,32 @@
+"""
+Locked-down DuckDB connections for running generated SQL over file data.
+
+DuckDB can read and write arbitrary files (read_csv, COPY, ATTACH) and load
+extensions, so file adapters lock each connection down once their own
+tables and views exist, and only accept a single SELECT statement.
+"""
+
+from collections.abc import Iterable
+
+import duckdb
+
+
+def lock_down(connection: duckdb.DuckDBPyConnection, allowed_paths: Iterable[str] = ()) -> None:
+    """
+    Disable file system and extension access for the rest of the connection's life.
+
+    Call after creating views over files; ``allowed_paths`` keeps those files
+    readable. DataFrames registered later on cursors are unaffected.
+    """
+    paths = list(allowed_paths)
+    if paths:
+        connection.execute("SET allowed_paths = ?", [paths])
+    connection.execute("SET enable_external_access = false")
+    connection.execute("SET lock_configuration = true")
+
+
+def ensure_read_only(query: str) -> None:
+    """Raise ValueError unless ``query`` is exactly one SELECT (or WITH ... SELECT) statement."""
+    statements = duckdb.extract_statements(query)
+    if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+        raise ValueError("Only a single SELECT query is allowed on file datasources")
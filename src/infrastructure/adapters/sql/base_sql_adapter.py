@@ -1,20 +1,24 @@
 """
-Base SQL Adapter using SQLAlchemy.
+Base SQL Adapter using SQLAlchemy's asyncio engine.
 
 Provides common functionality for all SQL database adapters.
 """
 
 import asyncio
+import logging
+import time
 from abc import abstractmethod
-from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import structlog
-from sqlalchemy import create_engine, text, inspect, MetaData
-from sqlalchemy.engine import Engine
+from sqlalchemy import text, inspect, MetaData
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
-from src.domain.entities.datasource import Datasource
+from src.domain.entities.datasource import ConnectionConfig, Datasource, mask_credentials
 from src.domain.entities.result import (
     QueryResult,
     ResultFormat,
@@ -25,6 +29,21 @@ from src.domain.ports.datasource_port import DatasourcePort
 
 logger = structlog.get_logger(__name__)
 
+_PING = text("SELECT 1")
+
+
+@lru_cache(maxsize=512)
+def _compile(query: str) -> TextClause:
+    """text() construct for a query; reused so repeated queries skip bind-param parsing."""
+    return text(query)
+
+
+@lru_cache(maxsize=4096)
+def _untyped_column(name: str) -> ColumnInfo:
+    """Shared ColumnInfo for a result column (frozen, so safe to reuse across results)."""
+    # Type info not available from CursorResult.keys()
+    return ColumnInfo(name=name, data_type="unknown", nullable=True)
+
 
 class QueryExecutionError(Exception):
     """Raised when query execution fails."""
@@ -37,12 +56,15 @@ class BaseSQLAdapter(DatasourcePort):
     Base adapter for SQL databases using SQLAlchemy.
 
     Provides common functionality for connection management, query execution,
-    and schema introspection. Specific database adapters extend this class.
+    and schema introspection. Specific database adapters extend this class and
+    return a URL for an asyncio driver from _get_connection_url().
     """
 
     def __init__(self, datasource: Datasource) -> None:
         super().__init__(datasource)
-        self._engine: Engine | None = None
+        self._engine: AsyncEngine | None = None
+        # Validated, driver-qualified URL; the config is immutable, so computed once
+        self._connection_url: str | None = None
         self._metadata: MetaData | None = None
 
     @property
@@ -57,23 +79,29 @@ class BaseSQLAdapter(DatasourcePort):
             raise ValueError("Connection config is required for SQL datasources")
         return self._datasource.connection_config.connection_string
 
+    def _engine_options(self) -> dict[str, Any]:
+        """Pool options passed to create_async_engine()."""
+        config = self._datasource.connection_config or ConnectionConfig(connection_string="")
+        return {
+            "pool_size": config.pool_size,
+            "max_overflow": config.pool_max_overflow,
+            "pool_recycle": config.pool_recycle_seconds,
+            "pool_timeout": config.pool_timeout_seconds,
+            "pool_pre_ping": True,
+        }
+
     async def connect(self) -> bool:
         """Establish connection to the database."""
         try:
-            connection_url = self._get_connection_url()
+            if self._connection_url is None:
+                self._connection_url = self._get_connection_url()
+            connection_url = self._connection_url
 
             # Mask credentials in logs
-            safe_url = self._mask_credentials(connection_url)
+            safe_url = mask_credentials(connection_url)
             logger.info("connecting_to_database", datasource_id=self._datasource.id, url=safe_url)
 
-            pool_size = self._datasource.connection_config.pool_size if self._datasource.connection_config else 5
-
-            self._engine = create_engine(
-                connection_url,
-                pool_size=pool_size,
-                pool_pre_ping=True,
-                echo=False,
-            )
+            self._engine = create_async_engine(connection_url, echo=False, **self._engine_options())
 
             # Test connection
             await self.validate_connection()
@@ -93,7 +121,7 @@ class BaseSQLAdapter(DatasourcePort):
     async def disconnect(self) -> None:
         """Close database connection."""
         if self._engine:
-            self._engine.dispose()
+            await self._engine.dispose()
             self._engine = None
         self._connected = False
         logger.info("database_disconnected", datasource_id=self._datasource.id)
@@ -104,8 +132,8 @@ class BaseSQLAdapter(DatasourcePort):
             return False
 
         try:
-            with self._engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            async with self._engine.connect() as conn:
+                await conn.execute(_PING)
             return True
         except SQLAlchemyError as e:
             logger.warning(
@@ -126,23 +154,23 @@ class BaseSQLAdapter(DatasourcePort):
         if not self._engine:
             raise QueryExecutionError("Not connected to database")
 
-        start_time = datetime.utcnow()
-        logger.info(
-            "executing_query",
-            datasource_id=self._datasource.id,
-            query_preview=query[:100] + "..." if len(query) > 100 else query,
-        )
+        start_ns = time.perf_counter_ns()
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "executing_query",
+                datasource_id=self._datasource.id,
+                query_preview=query[:100] + "..." if len(query) > 100 else query,
+            )
 
         try:
-            # Run query with timeout
+            # The database enforces the timeout too (see _apply_statement_timeout);
+            # wait_for bounds everything else, such as pool waits and stalled sockets
             result = await asyncio.wait_for(
-                self._execute_query(query, params, max_results),
+                self._execute_query(query, params, max_results, timeout_seconds),
                 timeout=timeout_seconds,
             )
 
-            execution_time_ms = int(
-                (datetime.utcnow() - start_time).total_seconds() * 1000
-            )
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             logger.info(
                 "query_executed",
@@ -187,94 +215,80 @@ class BaseSQLAdapter(DatasourcePort):
         query: str,
         params: dict[str, Any] | None,
         max_results: int,
+        timeout_seconds: int,
     ) -> dict[str, Any]:
-        """Execute query in thread pool to not block event loop."""
-
-        def _run_query() -> dict[str, Any]:
-            if self._engine is None:
-                raise QueryExecutionError("Engine not initialized")
-
-            with self._engine.connect() as conn:
-                result = conn.execute(text(query), params or {})
-
-                # Get column info - keys() returns column names as strings
-                column_names = list(result.keys())
-                columns = [
-                    ColumnInfo(
-                        name=col_name,
-                        data_type="unknown",  # Type info not available from CursorResult.keys()
-                        nullable=True,
-                    )
-                    for col_name in column_names
-                ] if column_names else []
-
-                # Fetch results with limit
-                rows = []
-                total_rows = 0
-                was_truncated = False
-
-                for row in result:
-                    total_rows += 1
-                    if len(rows) < max_results:
-                        rows.append(dict(row._mapping))
-                    else:
-                        was_truncated = True
-
-                return {
-                    "data": rows,
-                    "total_rows": total_rows,
-                    "was_truncated": was_truncated,
-                    "columns": columns,
-                }
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run_query)
+        """Execute query on the async engine."""
+        if self._engine is None:
+            raise QueryExecutionError("Engine not initialized")
+
+        async with self._engine.connect() as conn:
+            await self._apply_statement_timeout(conn, timeout_seconds)
+
+            # Server-side cursor: only the rows fetched below cross the wire
+            result = await conn.stream(_compile(query), params or {})
+
+            # Get column info - keys() returns column names as strings
+            column_names = list(result.keys())
+            columns = [_untyped_column(col_name) for col_name in column_names]
+
+            # One row past the limit only flags truncation; a truncated result
+            # reports that lower bound as its total instead of re-running the
+            # query to count it (not every statement can be wrapped in COUNT(*))
+            fetched = await result.fetchmany(max_results + 1)
+            await result.close()
+            was_truncated = len(fetched) > max_results
+            rows = [dict(zip(column_names, row, strict=True)) for row in fetched[:max_results]]
+
+            return {
+                "data": rows,
+                "total_rows": len(fetched),
+                "was_truncated": was_truncated,
+                "columns": columns,
+            }
+
+    async def _apply_statement_timeout(self, conn: AsyncConnection, timeout_seconds: int) -> None:
+        """
+        Have the server abort the next statements on ``conn`` after ``timeout_seconds``.
+
+        No-op by default; dialects with a native statement timeout override it.
+        """
 
     async def get_schema(self) -> dict[str, list[dict[str, Any]]]:
         """Get database schema (tables and columns)."""
         if not self._engine:
             raise QueryExecutionError("Not connected to database")
 
-        def _get_schema() -> dict[str, list[dict[str, Any]]]:
-            if self._engine is None:
-                return {}
-
-            inspector = inspect(self._engine)
-            schema: dict[str, list[dict[str, Any]]] = {}
-
-            for table_name in inspector.get_table_names():
-                columns = []
-                for column in inspector.get_columns(table_name):
-                    columns.append({
-                        "name": column["name"],
-                        "type": str(column["type"]),
-                        "nullable": column.get("nullable", True),
-                        "default": str(column.get("default")) if column.get("default") else None,
-                        "primary_key": column.get("primary_key", False),
-                    })
-                schema[table_name] = columns
-
-            return schema
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _get_schema)
+        # Reflection is synchronous; run_sync drives it over the async connection
+        async with self._engine.connect() as conn:
+            return await conn.run_sync(self._read_schema)
+
+    def _read_schema(self, sync_conn: Connection) -> dict[str, list[dict[str, Any]]]:
+        """
+        Reflect every table's columns.
+
+        get_multi_columns() is a single catalog query on dialects that batch
+        reflection (PostgreSQL) and falls back to one query per table elsewhere.
+        """
+        schema: dict[str, list[dict[str, Any]]] = {}
+
+        for (_, table_name), table_columns in inspect(sync_conn).get_multi_columns().items():
+            columns = []
+            for column in table_columns:
+                columns.append({
+                    "name": column["name"],
+                    "type": str(column["type"]),
+                    "nullable": column.get("nullable", True),
+                    "default": str(column.get("default")) if column.get("default") else None,
+                    "primary_key": column.get("primary_key", False),
+                })
+            schema[table_name] = columns
+
+        return schema
 
     async def get_tables(self) -> list[str]:
         """Get list of table names."""
         if not self._engine:
             raise QueryExecutionError("Not connected to database")
 
-        def _get_tables() -> list[str]:
-            if self._engine is None:
-                return []
-            inspector = inspect(self._engine)
-            return inspector.get_table_names()
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _get_tables)
-
-    @staticmethod
-    def _mask_credentials(url: str) -> str:
-        """Mask password in connection URL for logging."""
-        import re
-        return re.sub(r"://([^:]+):([^@]+)@", r"://\1:****@", url)
+        async with self._engine.connect() as conn:
+            return await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
@@ -4,6 +4,8 @@ SQLite adapter using SQLAlchemy.
 Extends BaseSQLAdapter with SQLite-specific functionality.
 """
 
+from typing import Any
+
 from src.domain.entities.datasource import Datasource
 from src.infrastructure.adapters.sql.base_sql_adapter import BaseSQLAdapter
 
@@ -12,7 +14,7 @@ class SQLiteAdapter(BaseSQLAdapter):
     """
     SQLite-specific adapter.
 
-    Uses SQLite driver via SQLAlchemy.
+    Uses the aiosqlite driver via SQLAlchemy.
     Connection string format: sqlite:///path/to/database.db
     """
 
@@ -24,13 +26,20 @@ class SQLiteAdapter(BaseSQLAdapter):
         return "sqlite"
 
     def _get_connection_url(self) -> str:
-        """Ensure SQLite dialect prefix."""
+        """Ensure SQLite dialect prefix with the aiosqlite driver."""
         url = super()._get_connection_url()
 
-        if not url.startswith("sqlite:"):
+        if url.startswith("sqlite:"):
+            url = url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+
+        if not url.startswith("sqlite+aiosqlite:"):
             raise ValueError(
                 f"Invalid SQLite connection string. "
                 f"Expected format: sqlite:///path/to/database.db"
             )
 
         return url
+
+    def _engine_options(self) -> dict[str, Any]:
+        """No pool sizing: aiosqlite serves in-memory databases from a StaticPool."""
+        return {}
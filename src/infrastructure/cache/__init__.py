@@ -0,0 +1,5 @@
+"""Cache package for query result caching."""
+
+from src.infrastructure.cache.memory_result_cache import InMemoryResultCache
+
+__all__ = ["InMemoryResultCache"]
@@ -0,0 +1,79 @@
+"""
+In-process query result cache.
+
+LRU-bounded, TTL-expiring implementation of ResultCachePort for a single
+server process.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import replace
+
+import structlog
+
+from src.domain.entities.result import QueryResult
+from src.domain.ports.result_cache_port import ResultCachePort
+
+logger = structlog.get_logger(__name__)
+
+# (query string, datasource id, max results)
+_Key = tuple[str, str, int]
+
+
+class InMemoryResultCache(ResultCachePort):
+    """
+    Result cache held in process memory.
+
+    Stores and returns shallow copies, so callers can annotate the result
+    they get (query id, natural response) without touching the cached entry.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        # key -> (monotonic expiry, result)
+        self._entries: OrderedDict[_Key, tuple[float, QueryResult]] = OrderedDict()
+
+    async def get(
+        self,
+        query: str,
+        datasource_id: str,
+        max_results: int,
+    ) -> QueryResult | None:
+        """Return a copy of the cached result, dropping it if expired."""
+        key = (query, datasource_id, max_results)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        logger.debug("result_cache_hit", datasource_id=datasource_id)
+        return replace(result)
+
+    async def put(
+        self,
+        query: str,
+        datasource_id: str,
+        max_results: int,
+        result: QueryResult,
+        ttl_seconds: int = 60,
+    ) -> None:
+        """Store a copy of the result, evicting the least recently used entry."""
+        key = (query, datasource_id, max_results)
+        self._entries[key] = (time.monotonic() + ttl_seconds, replace(result))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, datasource_id: str | None = None) -> None:
+        """Drop cached results for a datasource, or everything."""
+        if datasource_id is None:
+            self._entries.clear()
+            return
+
+        for key in [k for k in self._entries if k[1] == datasource_id]:
+            del self._entries[key]
@@ -1,5 +1,6 @@
 """Configuration package."""
 
+from src.infrastructure.config.logging_config import configure_logging
 from src.infrastructure.config.settings import Settings, get_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "configure_logging", "get_settings"]
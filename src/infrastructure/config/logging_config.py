@@ -0,0 +1,102 @@
+"""
+Logging configuration.
+
+Structlog events are pre-processed on the calling thread, then handed to a
+QueueHandler. Rendering (orjson or console) and I/O happen on a QueueListener
+thread, keeping log formatting off the asyncio event loop.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+import structlog
+
+from src.infrastructure.config.settings import Settings
+
+_listener: QueueListener | None = None
+
+
+def _orjson_renderer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> str:
+    """Render the event dict as a JSON line using orjson."""
+    return orjson.dumps(event_dict, default=str).decode()
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched.
+
+    The default prepare() formats the record on the calling thread, which
+    is exactly the work we want the listener thread to do.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(settings: Settings) -> None:
+    """Configure structlog and stdlib logging with a background writer thread."""
+    global _listener
+
+    if _listener is not None:
+        return
+
+    json_format = settings.log_format == "json"
+
+    # Runs on the caller: cheap enrichment, timestamps and exception capture
+    shared_processors: list[Any] = [
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+    ]
+    if json_format:
+        # Lean chain: no positional args, stack info or bytes in our events
+        caller_processors = shared_processors + [
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.format_exc_info,
+        ]
+        renderer: Any = _orjson_renderer
+    else:
+        caller_processors = shared_processors + [
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+        ]
+        renderer = structlog.dev.ConsoleRenderer()
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *caller_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    # Runs on the listener thread
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            renderer,
+        ],
+        foreign_pre_chain=shared_processors + [structlog.processors.TimeStamper(fmt="iso")],
+    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [_PassthroughQueueHandler(log_queue)]
+    root.setLevel(settings.log_level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
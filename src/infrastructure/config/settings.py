@@ -4,10 +4,14 @@ Application settings using Pydantic Settings.
 Loads configuration from environment variables with validation and defaults.
 """
 
+import os
+from collections.abc import Mapping
 from functools import lru_cache
-from typing import Literal
+from types import MappingProxyType
+from typing import Any, Literal
 
-from pydantic import Field, SecretStr, model_validator
+from dotenv import dotenv_values
+from pydantic import Field, PrivateAttr, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.domain.entities.query import QueryMode
@@ -27,6 +31,9 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    # Environment snapshot for resolve_env_secret(), taken once at startup
+    _env: Mapping[str, str] = PrivateAttr(default_factory=dict)
+
     # -------------------------------------------------------------------------
     # Server Configuration
     # -------------------------------------------------------------------------
@@ -93,6 +100,12 @@ class Settings(BaseSettings):
         le=8000,
         description="Maximum tokens for LLM response",
     )
+    llm_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Maximum concurrent LLM translation calls",
+    )
 
     # -------------------------------------------------------------------------
     # Query Settings
@@ -117,6 +130,21 @@ class Settings(BaseSettings):
         default=True,
         description="Only allow SELECT/read operations",
     )
+    query_history_max_entries: int = Field(
+        default=256,
+        ge=1,
+        le=10000,
+        description="Maximum number of queries kept in the in-memory history",
+    )
+    preconnect_datasources: bool = Field(
+        default=False,
+        description="Connect every enabled datasource at startup instead of on first use",
+    )
+    datasource_idle_ttl_seconds: int = Field(
+        default=900,
+        ge=0,
+        description="Close datasource connections unused for this long (0 = never)",
+    )
 
     # -------------------------------------------------------------------------
     # Logging Configuration
@@ -142,6 +170,40 @@ class Settings(BaseSettings):
         default=None,
         description="Redis URL for caching (optional)",
     )
+    translation_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse translations for repeated natural language queries",
+    )
+    translation_cache_semantic: bool = Field(
+        default=False,
+        description="Also reuse translations of similar (not identical) queries",
+    )
+    translation_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic translation cache hit",
+    )
+    translation_cache_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum cached translations per cache tier",
+    )
+    result_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse results of identical queries (read-only mode only)",
+    )
+    result_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=86400,
+        description="How long a cached query result stays valid",
+    )
+    result_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum cached query results",
+    )
 
     # -------------------------------------------------------------------------
     # File Paths
@@ -150,6 +212,10 @@ class Settings(BaseSettings):
         default="/app/config/datasources.json",
         description="Path to datasources configuration file",
     )
+    query_templates_path: str = Field(
+        default="/app/config/query_templates.json",
+        description="Path to NL query templates answered without the LLM (optional)",
+    )
     data_directory: str = Field(
         default="/app/data",
         description="Base directory for file datasources",
@@ -191,6 +257,29 @@ class Settings(BaseSettings):
         
         return self
     
+    def model_post_init(self, __context: Any) -> None:
+        """Snapshot .env and process environment (process wins, as for fields)."""
+        env_file = self.model_config.get("env_file")
+        file_values = dotenv_values(env_file) if isinstance(env_file, str) else {}
+        self._env = MappingProxyType(
+            {**{k: v for k, v in file_values.items() if v is not None}, **os.environ}
+        )
+
+    def resolve_env_secret(self, name: str) -> str:
+        """
+        Resolve a secret referenced by environment variable name.
+
+        Looks in the process environment and the .env file. Raises ValueError
+        if the variable is not set.
+        """
+        value = self._env.get(name)
+        if not value:
+            raise ValueError(
+                f"Environment variable '{name}' not found. "
+                "Please set it in your .env file or environment."
+            )
+        return value
+
     def get_active_model(self) -> str:
         """Get the model name for the active provider."""
         if self.llm_provider == "openai":
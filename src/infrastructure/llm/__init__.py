@@ -4,6 +4,8 @@ from src.infrastructure.llm.base_translator import BaseTranslator, TranslationEr
 from src.infrastructure.llm.openai_translator import OpenAITranslator
 from src.infrastructure.llm.anthropic_translator import AnthropicTranslator
 from src.infrastructure.llm.gemini_translator import GeminiTranslator
+from src.infrastructure.llm.semantic_cache import SemanticCache
+from src.infrastructure.llm.template_translator import TemplateMatcher, TemplateTranslator
 
 __all__ = [
     "BaseTranslator",
@@ -11,5 +13,8 @@ __all__ = [
     "OpenAITranslator",
     "AnthropicTranslator",
     "GeminiTranslator",
+    "SemanticCache",
+    "TemplateMatcher",
+    "TemplateTranslator",
 ]
 
@@ -4,19 +4,32 @@ Anthropic Claude-based natural language to query translator.
 Uses Claude to translate natural language into executable database queries.
 """
 
-import json
 from typing import Any
 
+import httpx
 import structlog
-from anthropic import AsyncAnthropic
-from tenacity import retry, stop_after_attempt, wait_exponential
+from anthropic import APIConnectionError, APIStatusError, AsyncAnthropic, RateLimitError
+from tenacity import retry, retry_if_exception, stop_after_attempt
 
 from src.domain.entities.datasource import Datasource
-from src.infrastructure.llm.base_translator import BaseTranslator
+from src.infrastructure.llm.base_translator import (
+    BaseTranslator,
+    schema_to_json,
+    wait_retry_after,
+)
 
 logger = structlog.get_logger(__name__)
 
 
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry connection failures, timeouts, rate limits and server errors only."""
+    if isinstance(exc, (APIConnectionError, RateLimitError)):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in (408, 409) or exc.status_code >= 500
+    return False
+
+
 class AnthropicTranslator(BaseTranslator):
     """
     Anthropic Claude-based translator for natural language to query conversion.
@@ -30,13 +43,26 @@ class AnthropicTranslator(BaseTranslator):
         model: str = "claude-sonnet-4-20250514",
         temperature: float = 0.0,
         max_tokens: int = 2000,
+        http_client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 8,
     ) -> None:
-        super().__init__(model=model, temperature=temperature, max_tokens=max_tokens)
-        self._client = AsyncAnthropic(api_key=api_key)
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+        )
+        # Retries are handled (once) by the tenacity policy on _call_llm
+        self._client = AsyncAnthropic(api_key=api_key, http_client=http_client, max_retries=0)
+
+    async def warm_up(self) -> None:
+        """Open the HTTPS connection to the API with a cheap model lookup."""
+        await self._client.models.retrieve(self._model)
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=wait_retry_after,
+        retry=retry_if_exception(_is_retryable),
     )
     async def _call_llm(
         self,
@@ -114,7 +140,7 @@ Explain it in 2-3 sentences, focusing on what data it retrieves and any conditio
 Datasource: {datasource.name} (Type: {datasource.type.value})
 
 Tables/Collections:
-{json.dumps(schema, indent=2)}
+{schema_to_json(schema)}
 
 Generate {count} example natural language questions that a user might ask about this data.
 Make the questions practical and diverse (aggregations, filters, joins, etc.).
@@ -5,19 +5,31 @@ Provides common functionality shared by all LLM translators (OpenAI, Anthropic,
 Follows DRY principle - all shared logic is here, providers only implement their specifics.
 """
 
+import asyncio
 import json
+import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
 
+import orjson
 import structlog
+from tenacity import RetryCallState, wait_exponential
 
-from src.domain.entities.datasource import Datasource, DatasourceCategory
+from src.domain.entities.datasource import Datasource
 from src.domain.entities.query import QueryMode, QueryType, TranslationResult
 from src.domain.ports.translator_port import TranslatorPort
 
 logger = structlog.get_logger(__name__)
 
+_T = TypeVar("_T")
+
+_BATCH_PROMPT_SUFFIX = """
+
+You will receive several numbered user queries. Translate each one independently and respond with a single JSON object of the form {"results": [...]}, holding one object in the format above per query, in the same order as the queries."""
+
 
 class TranslationError(Exception):
     """Raised when translation fails."""
@@ -25,6 +37,54 @@ class TranslationError(Exception):
     pass
 
 
+_backoff = wait_exponential(multiplier=1, min=1, max=10)
+
+# id(schema) -> (schema, its JSON); holding the schema keeps its id from being reused
+_SCHEMA_JSON: OrderedDict[int, tuple[dict[str, Any], str]] = OrderedDict()
+_SCHEMA_JSON_MAX_ENTRIES = 64
+
+
+def schema_to_json(schema: dict[str, Any]) -> str:
+    """
+    Indented JSON of a schema for prompts, memoized per schema object.
+
+    Cached schemas are replaced rather than mutated, so the same dict always
+    renders the same text.
+    """
+    cached = _SCHEMA_JSON.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        _SCHEMA_JSON.move_to_end(id(schema))
+        return cached[1]
+
+    rendered = orjson.dumps(schema, option=orjson.OPT_INDENT_2, default=str).decode()
+    _SCHEMA_JSON[id(schema)] = (schema, rendered)
+    if len(_SCHEMA_JSON) > _SCHEMA_JSON_MAX_ENTRIES:
+        _SCHEMA_JSON.popitem(last=False)
+    return rendered
+
+
+def wait_retry_after(retry_state: RetryCallState) -> float:
+    """
+    Tenacity wait strategy for LLM calls.
+
+    Honors the provider's retry-after (or retry-after-ms) header on rate-limit
+    errors, capped at 60s; otherwise falls back to exponential backoff.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+
+    if headers:
+        try:
+            if "retry-after-ms" in headers:
+                return min(float(headers["retry-after-ms"]) / 1000, 60.0)
+            if "retry-after" in headers:
+                return min(float(headers["retry-after"]), 60.0)
+        except ValueError:
+            pass  # HTTP-date form, use backoff
+
+    return _backoff(retry_state)
+
+
 class BaseTranslator(TranslatorPort, ABC):
     """
     Abstract base class for LLM translators.
@@ -45,10 +105,13 @@ class BaseTranslator(TranslatorPort, ABC):
         model: str,
         temperature: float = 0.0,
         max_tokens: int = 2000,
+        max_concurrency: int = 8,
     ) -> None:
         self._model = model
         self._temperature = temperature
         self._max_tokens = max_tokens
+        # Caps in-flight LLM calls so request bursts don't turn into 429 storms
+        self._llm_semaphore = asyncio.Semaphore(max_concurrency)
 
     @property
     def model(self) -> str:
@@ -119,14 +182,15 @@ class BaseTranslator(TranslatorPort, ABC):
         Template Method pattern: defines the algorithm skeleton,
         subclasses provide the _call_llm() implementation.
         """
-        logger.info(
-            "translating_query",
-            input=natural_language[:100],
-            mode=mode.value,
-            datasource_count=len(available_datasources),
-            model=self._model,
-            provider=self.__class__.__name__,
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "translating_query",
+                input=natural_language[:100],
+                mode=mode.value,
+                datasource_count=len(available_datasources),
+                model=self._model,
+                provider=self.__class__.__name__,
+            )
 
         # Step 1: Filter datasources by mode
         filtered_sources = self._filter_by_mode(available_datasources, mode)
@@ -142,16 +206,89 @@ class BaseTranslator(TranslatorPort, ABC):
         system_prompt = self._build_system_prompt(mode)
         user_prompt = self._build_user_prompt(natural_language, schema_context, context)
 
+        # Steps 3-4: Call LLM and parse response
+        return await self._run_translation(
+            system_prompt,
+            user_prompt,
+            lambda result: self._parse_translation_result(result, filtered_sources),
+        )
+
+    async def translate_batch(
+        self,
+        natural_languages: list[str],
+        available_datasources: list[Datasource],
+        mode: QueryMode,
+        context: dict[str, Any] | None = None,
+    ) -> list[TranslationResult]:
+        """
+        Translate several queries in a single LLM call.
+
+        The instructions and schema context are sent once for the whole
+        batch instead of once per query. If the LLM answers with the wrong
+        number of results, the queries are translated one call each instead.
+        """
+        if len(natural_languages) < 2:
+            return await super().translate_batch(
+                natural_languages, available_datasources, mode, context
+            )
+
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "translating_query_batch",
+                size=len(natural_languages),
+                mode=mode.value,
+                datasource_count=len(available_datasources),
+                model=self._model,
+                provider=self.__class__.__name__,
+            )
+
+        filtered_sources = self._filter_by_mode(available_datasources, mode)
+
+        if not filtered_sources:
+            raise TranslationError(
+                f"No datasources available for mode '{mode.value}'. "
+                "Configure and enable appropriate datasources first."
+            )
+
+        schema_context = self._build_schema_context(filtered_sources)
+        system_prompt = self._build_system_prompt(mode) + _BATCH_PROMPT_SUFFIX
+        user_prompt = self._build_batch_user_prompt(natural_languages, schema_context, context)
+
+        def parse(response: dict[str, Any]) -> list[TranslationResult] | None:
+            results = response.get("results")
+            if not isinstance(results, list) or len(results) != len(natural_languages):
+                logger.warning(
+                    "batch_translation_mismatch",
+                    expected=len(natural_languages),
+                    received=len(results) if isinstance(results, list) else None,
+                )
+                return None
+            return [self._parse_translation_result(r, filtered_sources) for r in results]
+
+        results = await self._run_translation(system_prompt, user_prompt, parse)
+        if results is None:
+            # Results cannot be matched to queries reliably; translate each one
+            return await super().translate_batch(
+                natural_languages, available_datasources, mode, context
+            )
+        return results
+
+    async def _run_translation(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        parse: Callable[[dict[str, Any]], _T],
+    ) -> _T:
+        """Call the LLM under the concurrency cap and parse its JSON response."""
         try:
-            # Step 3: Call LLM (provider-specific)
-            result_text = await self._call_llm(system_prompt, user_prompt)
+            # Bounded by the concurrency cap
+            async with self._llm_semaphore:
+                result_text = await self._call_llm(system_prompt, user_prompt)
 
             if not result_text:
                 raise TranslationError("Empty response from LLM")
 
-            # Step 4: Parse response
-            result = self._extract_json(result_text)
-            return self._parse_translation_result(result, filtered_sources)
+            return parse(self._extract_json(result_text))
 
         except json.JSONDecodeError as e:
             logger.error("translation_json_error", error=str(e))
@@ -177,13 +314,7 @@ class BaseTranslator(TranslatorPort, ABC):
         if mode == QueryMode.MIXED:
             return [ds for ds in datasources if ds.enabled]
 
-        category_map = {
-            QueryMode.SQL: DatasourceCategory.SQL,
-            QueryMode.NOSQL: DatasourceCategory.NOSQL,
-            QueryMode.FILES: DatasourceCategory.FILE,
-        }
-
-        target_category = category_map.get(mode)
+        target_category = mode.category
         return [
             ds for ds in datasources
             if ds.enabled and ds.category == target_category
@@ -202,7 +333,7 @@ ID: {ds.id}
 Category: {ds.category.value}
 """
             if schema_info:
-                ds_info += f"Schema:\n{json.dumps(schema_info, indent=2)}"
+                ds_info += f"Schema:\n{schema_to_json(schema_info)}"
             else:
                 ds_info += "Schema: Not cached (will be fetched if selected)"
 
@@ -222,7 +353,7 @@ IMPORTANT RULES:
 - Generate ONLY SELECT/read queries (no INSERT, UPDATE, DELETE, DROP, etc.)
 - For SQL databases, use standard SQL syntax appropriate for the dialect
 - For MongoDB, generate a JSON query document with "collection", "filter", and optional "projection"
-- For file-based sources (CSV/Excel), generate SQL that can be run with pandasql
+- For file-based sources (CSV/Excel), generate DuckDB-compatible SQL (each file or sheet is a table)
 - The natural_response_template should be professional, concise, and helpful. 
 - Avoid overly casual language like "¡Amigo!"
 - Use {count} placeholder for the number of results (or the value of the result if it's a count)
@@ -243,7 +374,7 @@ Always respond with a JSON object containing:
         mode_suffix = {
             QueryMode.SQL: "\n\nFocus on SQL databases only.",
             QueryMode.NOSQL: "\n\nFocus on NoSQL databases (MongoDB, DynamoDB) only.",
-            QueryMode.FILES: "\n\nFocus on file-based sources (CSV, Excel) only. Use SQL syntax compatible with pandasql.",
+            QueryMode.FILES: "\n\nFocus on file-based sources (CSV, Excel) only. Use SQL syntax compatible with DuckDB.",
         }
 
         return base_prompt + mode_suffix.get(mode, "")
@@ -258,6 +389,26 @@ Always respond with a JSON object containing:
         prompt = f"""## User Query
 {natural_language}
 
+## Available Datasources
+{schema_context}
+"""
+
+        if context and "previous_queries" in context:
+            prompt += f"\n## Previous Queries (for context)\n{context['previous_queries']}"
+
+        return prompt
+
+    def _build_batch_user_prompt(
+        self,
+        natural_languages: list[str],
+        schema_context: str,
+        context: dict[str, Any] | None,
+    ) -> str:
+        """Build the user prompt for a numbered batch of queries."""
+        queries = "\n".join(f"{i}. {nl}" for i, nl in enumerate(natural_languages, 1))
+        prompt = f"""## User Queries
+{queries}
+
 ## Available Datasources
 {schema_context}
 """
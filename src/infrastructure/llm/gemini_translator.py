@@ -4,15 +4,18 @@ Google Gemini-based natural language to query translator.
 Uses Gemini to translate natural language into executable database queries.
 """
 
-import json
 from typing import Any
 
 import structlog
 import google.generativeai as genai
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt
 
 from src.domain.entities.datasource import Datasource
-from src.infrastructure.llm.base_translator import BaseTranslator
+from src.infrastructure.llm.base_translator import (
+    BaseTranslator,
+    schema_to_json,
+    wait_retry_after,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -30,14 +33,20 @@ class GeminiTranslator(BaseTranslator):
         model: str = "gemini-2.0-flash",
         temperature: float = 0.0,
         max_tokens: int = 2000,
+        max_concurrency: int = 8,
     ) -> None:
-        super().__init__(model=model, temperature=temperature, max_tokens=max_tokens)
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+        )
         genai.configure(api_key=api_key)
         self._client = genai.GenerativeModel(model)
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=wait_retry_after,
     )
     async def _call_llm(
         self,
@@ -117,7 +126,7 @@ Explain it in 2-3 sentences, focusing on what data it retrieves and any conditio
 Datasource: {datasource.name} (Type: {datasource.type.value})
 
 Tables/Collections:
-{json.dumps(schema, indent=2)}
+{schema_to_json(schema)}
 
 Generate {count} example natural language questions that a user might ask about this data.
 Make the questions practical and diverse (aggregations, filters, joins, etc.).
@@ -0,0 +1,314 @@
+"""
+Semantic cache for natural language translations.
+
+Wraps any TranslatorPort and short-circuits the LLM call when the same question
+(or, with the opt-in semantic tier, a sufficiently similar one) was already
+translated against the same schema. Follow-up questions, whose meaning depends
+on the previous queries, always go to the LLM.
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from src.domain.entities.datasource import Datasource
+from src.domain.entities.query import QueryMode, TranslationResult, canonicalize
+from src.domain.ports.translator_port import TranslatorPort
+
+logger = structlog.get_logger(__name__)
+
+# Sparse vector: feature -> weight (L2-normalized)
+Embedding = dict[str, float]
+
+# (exact key, embedding, guard tokens, vector bucket key) of a cache lookup
+_Probe = tuple[str, Embedding, frozenset[str], tuple[str, QueryMode]]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_LITERAL_RE = re.compile(r"\d+(?:\.\d+)?|'[^']*'|\"[^\"]*\"")
+_OPERATOR_RE = re.compile(
+    r"[<>!]=|[<>=]|n't\b|\b(?:not|no|never|none|nor|neither|without|except|excluding|"
+    r"more|less|greater|fewer|higher|lower|above|below|over|under|before|after|"
+    r"least|most|between|equals?|exceeds?)\b",
+    re.IGNORECASE,
+)
+# Questions that refer back to earlier queries ("now only the active ones")
+_FOLLOW_UP_RE = re.compile(
+    r"^\s*(?:and|but|also|now|then|only|what about|how about)\b|"
+    r"\b(?:it|its|they|them|their|these|those|ones|same|previous|above|instead|again)\b",
+    re.IGNORECASE,
+)
+
+
+def lexical_embedding(text: str) -> Embedding:
+    """
+    Embed text as a normalized bag of word unigrams and character trigrams.
+
+    Dependency-free default; inject a model-backed embedder for true paraphrase matching.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    features: dict[str, float] = {}
+
+    for token in tokens:
+        features[f"w:{token}"] = features.get(f"w:{token}", 0.0) + 1.0
+        padded = f" {token} "
+        for i in range(len(padded) - 2):
+            gram = f"c:{padded[i:i + 3]}"
+            features[gram] = features.get(gram, 0.0) + 0.5
+
+    norm = math.sqrt(sum(w * w for w in features.values()))
+    if not norm:
+        return {}
+    return {k: w / norm for k, w in features.items()}
+
+
+def extract_literals(text: str) -> frozenset[str]:
+    """Numbers and quoted strings, which must match exactly for a semantic hit."""
+    return frozenset(_LITERAL_RE.findall(text))
+
+
+def extract_operators(text: str) -> frozenset[str]:
+    """Negations and comparison operators, which must match exactly for a semantic hit."""
+    return frozenset(match.lower() for match in _OPERATOR_RE.findall(text))
+
+
+def is_follow_up(text: str, context: dict[str, Any] | None) -> bool:
+    """Whether a question may depend on the previous queries in ``context``."""
+    return bool(context and context.get("previous_queries") and _FOLLOW_UP_RE.search(text))
+
+
+def cosine_similarity(a: Embedding, b: Embedding) -> float:
+    """Cosine similarity of two normalized sparse vectors. O(min(|a|, |b|))."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(k, 0.0) for k, w in a.items())
+
+
+class SemanticCache(TranslatorPort):
+    """
+    Caching decorator around a TranslatorPort.
+
+    Lookup waterfall:
+    - L0: exact hash of (canonicalized natural language, mode, schema fingerprint)
+    - L1 (only with ``semantic=True``): top-1 cosine similarity search over
+      previous questions for the same (schema fingerprint, mode), accepted above
+      ``threshold`` and only when both questions carry the same literals,
+      negations and comparison operators ("top 5" never matches "top 6",
+      "is 'bob'" never matches "is not 'bob'")
+    - Miss: delegate to the wrapped translator and store the result
+
+    Follow-up questions are neither looked up nor stored while the context
+    holds previous queries; the conversation context is not part of the key,
+    since it changes on every query.
+
+    Lexical similarity cannot tell every change of meaning apart, so the
+    semantic tier is off unless explicitly enabled.
+    """
+
+    def __init__(
+        self,
+        translator: TranslatorPort,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        embed: Callable[[str], Embedding] = lexical_embedding,
+        semantic: bool = False,
+    ) -> None:
+        self._translator = translator
+        self._threshold = threshold
+        self._semantic = semantic
+        self._max_entries = max_entries
+        self._embed = embed
+        self._exact: OrderedDict[str, TranslationResult] = OrderedDict()
+        # Buckets in least recently used order; max_entries bounds their total size
+        self._vectors: OrderedDict[
+            tuple[str, QueryMode],
+            list[tuple[Embedding, frozenset[str], TranslationResult]],
+        ] = OrderedDict()
+        self._vector_count = 0
+
+    @property
+    def translator(self) -> TranslatorPort:
+        """Get the wrapped translator."""
+        return self._translator
+
+    async def translate(
+        self,
+        natural_language: str,
+        available_datasources: list[Datasource],
+        mode: QueryMode,
+        context: dict[str, Any] | None = None,
+    ) -> TranslationResult:
+        """Translate using the cache tiers before falling back to the LLM."""
+        probe: _Probe | None = None
+        if not is_follow_up(natural_language, context):
+            fingerprint = self._schema_fingerprint(available_datasources)
+            cached, probe = self._lookup(natural_language, mode, fingerprint)
+            if cached is not None:
+                return cached
+
+        # Miss: call the LLM
+        result = await self._translator.translate(
+            natural_language=natural_language,
+            available_datasources=available_datasources,
+            mode=mode,
+            context=context,
+        )
+
+        if probe is not None:
+            self._store(probe, result)
+        return result
+
+    async def translate_batch(
+        self,
+        natural_languages: list[str],
+        available_datasources: list[Datasource],
+        mode: QueryMode,
+        context: dict[str, Any] | None = None,
+    ) -> list[TranslationResult]:
+        """Serve cached translations and batch only the misses to the LLM."""
+        fingerprint = self._schema_fingerprint(available_datasources)
+        results: list[TranslationResult | None] = []
+        misses: list[tuple[int, _Probe | None]] = []
+        for i, natural_language in enumerate(natural_languages):
+            if is_follow_up(natural_language, context):
+                results.append(None)
+                misses.append((i, None))
+                continue
+            cached, probe = self._lookup(natural_language, mode, fingerprint)
+            results.append(cached)
+            if cached is None:
+                misses.append((i, probe))
+
+        if misses:
+            translated = await self._translator.translate_batch(
+                [natural_languages[i] for i, _ in misses], available_datasources, mode, context
+            )
+            for (i, probe), result in zip(misses, translated, strict=True):
+                if probe is not None:
+                    self._store(probe, result)
+                results[i] = result
+
+        return results  # type: ignore[return-value]
+
+    async def clarify(
+        self,
+        natural_language: str,
+        available_datasources: list[Datasource],
+        ambiguity_reason: str,
+    ) -> str:
+        """Delegate to the wrapped translator."""
+        return await self._translator.clarify(
+            natural_language, available_datasources, ambiguity_reason
+        )
+
+    async def explain_query(self, query: str, query_type: str) -> str:
+        """Delegate to the wrapped translator."""
+        return await self._translator.explain_query(query, query_type)
+
+    async def suggest_queries(
+        self,
+        datasource: Datasource,
+        schema: dict[str, Any],
+        count: int = 5,
+    ) -> list[str]:
+        """Delegate to the wrapped translator."""
+        return await self._translator.suggest_queries(datasource, schema, count)
+
+    async def warm_up(self) -> None:
+        """Delegate to the wrapped translator."""
+        await self._translator.warm_up()
+
+    def clear(self) -> None:
+        """Drop all cached translations."""
+        self._exact.clear()
+        self._vectors.clear()
+        self._vector_count = 0
+
+    def _lookup(
+        self,
+        natural_language: str,
+        mode: QueryMode,
+        fingerprint: str,
+    ) -> tuple[TranslationResult | None, _Probe]:
+        """Search the exact and semantic tiers; the probe is reused to store a miss."""
+        # L0: exact match
+        key = self._hash(natural_language, mode, fingerprint)
+        cached = self._exact.get(key)
+        if cached is not None:
+            self._exact.move_to_end(key)
+            logger.debug("translation_cache_hit", tier="exact")
+            return cached, (key, {}, frozenset(), (fingerprint, mode))
+
+        if not self._semantic:
+            return None, (key, {}, frozenset(), (fingerprint, mode))
+
+        # L1: semantic match
+        vector = self._embed(natural_language)
+        guard = extract_literals(natural_language) | extract_operators(natural_language)
+        probe = (key, vector, guard, (fingerprint, mode))
+        best_score = 0.0
+        best: TranslationResult | None = None
+        for candidate_vector, candidate_guard, candidate in self._vectors.get(probe[3], ()):
+            if candidate_guard != guard:
+                continue
+            score = cosine_similarity(vector, candidate_vector)
+            if score > best_score:
+                best_score, best = score, candidate
+
+        if best is not None and best_score >= self._threshold:
+            logger.debug("translation_cache_hit", tier="semantic", score=round(best_score, 3))
+            self._vectors.move_to_end(probe[3])
+            self._store_exact(key, best)
+            return best, probe
+
+        return None, probe
+
+    def _store(self, probe: _Probe, result: TranslationResult) -> None:
+        """Record a fresh translation in the enabled tiers."""
+        key, vector, guard, bucket_key = probe
+        self._store_exact(key, result)
+        if not self._semantic:
+            return
+        bucket = self._vectors.setdefault(bucket_key, [])
+        self._vectors.move_to_end(bucket_key)
+        bucket.append((vector, guard, result))
+        self._vector_count += 1
+        if self._vector_count > self._max_entries:
+            # Evict the oldest entry of the least recently used bucket
+            oldest_key, oldest = next(iter(self._vectors.items()))
+            del oldest[0]
+            self._vector_count -= 1
+            if not oldest:
+                del self._vectors[oldest_key]
+
+    def _store_exact(self, key: str, result: TranslationResult) -> None:
+        """Insert into the exact-match tier, evicting the least recently used entry."""
+        self._exact[key] = result
+        self._exact.move_to_end(key)
+        if len(self._exact) > self._max_entries:
+            self._exact.popitem(last=False)
+
+    @staticmethod
+    def _hash(natural_language: str, mode: QueryMode, fingerprint: str) -> str:
+        """Exact-match key for a question against a schema fingerprint."""
+        raw = f"{canonicalize(natural_language)}\x00{mode.value}\x00{fingerprint}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _schema_fingerprint(datasources: list[Datasource]) -> str:
+        """Fingerprint of the datasources (and cached schemas) a translation was made for."""
+        parts = [
+            {
+                "id": ds.id,
+                "type": ds.type.value,
+                "schema": ds.schema_cache.tables if ds.schema_cache.is_valid else None,
+            }
+            for ds in sorted(datasources, key=lambda ds: ds.id)
+        ]
+        raw = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
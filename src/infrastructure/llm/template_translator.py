@@ -0,0 +1,240 @@
+"""
+Template-based fast path for natural language translation.
+
+Matches questions against known parameterized patterns and fills in a SQL
+template, skipping the LLM entirely for common request shapes.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.domain.entities.datasource import Datasource
+from src.domain.entities.query import QueryMode, QueryType, TranslationResult
+from src.domain.ports.translator_port import TranslatorPort
+
+logger = structlog.get_logger(__name__)
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Placeholder name -> regex for the value it captures
+_PLACEHOLDER_PATTERNS = {
+    "n": r"\d+",
+    "table": r"\w+",
+    "column": r"\w+",
+}
+# Free-text values: no quotes or SQL punctuation can be captured
+_VALUE_PATTERN = r"\w[\w .-]*?"
+
+
+@dataclass(frozen=True)
+class QueryTemplate:
+    """A compiled question pattern and the SQL it maps to."""
+
+    pattern: str
+    template: str
+    regex: re.Pattern[str]
+    response: str = ""
+
+
+def compile_template(pattern: str, template: str, response: str = "") -> QueryTemplate:
+    """
+    Compile a question pattern such as ``show (top|first) {n} {table}``.
+
+    ``{n}`` captures an integer, ``{table}`` a table name and ``{column}`` a
+    column of that table (both checked against the cached schema); any other
+    placeholder captures a plain word value.
+    """
+    parts: list[str] = []
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(pattern):
+        parts.append(pattern[position:match.start()])
+        name = match.group(1)
+        parts.append(f"(?P<{name}>{_PLACEHOLDER_PATTERNS.get(name, _VALUE_PATTERN)})")
+        position = match.end()
+    parts.append(pattern[position:])
+
+    source = re.sub(r"\s+", r"\\s+", "".join(parts).strip())
+    return QueryTemplate(
+        pattern=pattern,
+        template=template,
+        regex=re.compile(source, re.IGNORECASE),
+        response=response,
+    )
+
+
+class TemplateMatcher:
+    """Matches natural language against query templates."""
+
+    def __init__(self, templates: list[QueryTemplate]) -> None:
+        self._templates = templates
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "TemplateMatcher":
+        """Load templates from a JSON list of {pattern, template, response?} entries."""
+        with open(path) as f:
+            entries = json.load(f)
+
+        templates = [
+            compile_template(e["pattern"], e["template"], e.get("response", ""))
+            for e in entries
+        ]
+        logger.info("query_templates_loaded", path=str(path), count=len(templates))
+        return cls(templates)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def match(
+        self,
+        natural_language: str,
+        datasources: list[Datasource],
+    ) -> TranslationResult | None:
+        """Return a filled-in translation for the first matching template, if any."""
+        text = natural_language.strip().rstrip("?.!").strip()
+
+        for template in self._templates:
+            found = template.regex.fullmatch(text)
+            if not found:
+                continue
+
+            result = self._fill(template, found.groupdict(), datasources)
+            if result:
+                return result
+
+        return None
+
+    def _fill(
+        self,
+        template: QueryTemplate,
+        params: dict[str, str],
+        datasources: list[Datasource],
+    ) -> TranslationResult | None:
+        """Resolve identifiers against cached schemas and render the SQL."""
+        table_name = params.get("table")
+        if not table_name:
+            return None
+
+        for ds in datasources:
+            if not ds.is_sql or not ds.enabled or not ds.schema_cache.is_valid:
+                continue
+
+            tables = {name.lower(): name for name in ds.schema_cache.tables}
+            table = tables.get(table_name.lower())
+            if not table:
+                continue
+
+            values: dict[str, Any] = dict(params, table=table)
+            if "column" in params:
+                columns = {
+                    col["name"].lower(): col["name"]
+                    for col in ds.schema_cache.tables[table]
+                }
+                column = columns.get(params["column"].lower())
+                if not column:
+                    continue
+                values["column"] = column
+
+            return TranslationResult(
+                query_string=template.template.format(**values),
+                query_type=QueryType.SQL,
+                target_datasource_id=ds.id,
+                confidence=1.0,
+                explanation=f"Matched query template '{template.pattern}'",
+                natural_response_template=template.response,
+            )
+
+        return None
+
+
+class TemplateTranslator(TranslatorPort):
+    """
+    Translator decorator that answers template matches without the LLM.
+
+    Only applies to SQL and mixed modes; everything else is delegated.
+    """
+
+    def __init__(self, translator: TranslatorPort, matcher: TemplateMatcher) -> None:
+        self._translator = translator
+        self._matcher = matcher
+
+    @property
+    def translator(self) -> TranslatorPort:
+        """Get the wrapped translator."""
+        return self._translator
+
+    async def translate(
+        self,
+        natural_language: str,
+        available_datasources: list[Datasource],
+        mode: QueryMode,
+        context: dict[str, Any] | None = None,
+    ) -> TranslationResult:
+        """Try the templates first, then fall back to the wrapped translator."""
+        if mode in (QueryMode.SQL, QueryMode.MIXED):
+            result = self._matcher.match(natural_language, available_datasources)
+            if result:
+                logger.debug("query_template_hit", datasource_id=result.target_datasource_id)
+                return result
+
+        return await self._translator.translate(
+            natural_language=natural_language,
+            available_datasources=available_datasources,
+            mode=mode,
+            context=context,
+        )
+
+    async def translate_batch(
+        self,
+        natural_languages: list[str],
+        available_datasources: list[Datasource],
+        mode: QueryMode,
+        context: dict[str, Any] | None = None,
+    ) -> list[TranslationResult]:
+        """Answer template matches directly and batch the rest to the wrapped translator."""
+        results: list[TranslationResult | None] = [None] * len(natural_languages)
+        if mode in (QueryMode.SQL, QueryMode.MIXED):
+            for i, natural_language in enumerate(natural_languages):
+                results[i] = self._matcher.match(natural_language, available_datasources)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            translated = await self._translator.translate_batch(
+                [natural_languages[i] for i in pending], available_datasources, mode, context
+            )
+            for i, result in zip(pending, translated, strict=True):
+                results[i] = result
+
+        return results  # type: ignore[return-value]
+
+    async def clarify(
+        self,
+        natural_language: str,
+        available_datasources: list[Datasource],
+        ambiguity_reason: str,
+    ) -> str:
+        """Delegate to the wrapped translator."""
+        return await self._translator.clarify(
+            natural_language, available_datasources, ambiguity_reason
+        )
+
+    async def explain_query(self, query: str, query_type: str) -> str:
+        """Delegate to the wrapped translator."""
+        return await self._translator.explain_query(query, query_type)
+
+    async def suggest_queries(
+        self,
+        datasource: Datasource,
+        schema: dict[str, Any],
+        count: int = 5,
+    ) -> list[str]:
+        """Delegate to the wrapped translator."""
+        return await self._translator.suggest_queries(datasource, schema, count)
+
+    async def warm_up(self) -> None:
+        """Delegate to the wrapped translator."""
+        await self._translator.warm_up()
@@ -0,0 +1,142 @@
+"""
+Unit tests for BaseTranslator shared behavior.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.query import QueryMode
+from src.infrastructure.llm.base_translator import (
+    BaseTranslator,
+    schema_to_json,
+    wait_retry_after,
+)
+
+
+class FakeTranslator(BaseTranslator):
+    """Translator whose LLM call records peak concurrency."""
+
+    def __init__(self, **kwargs):
+        super().__init__(model="fake", **kwargs)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _call_llm(self, _system_prompt: str, _user_prompt: str) -> str:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return json.dumps({
+            "query": "SELECT 1",
+            "query_type": "sql",
+            "datasource_id": "test_postgres",
+            "confidence": 0.9,
+        })
+
+    async def clarify(self, _natural_language, _available_datasources, _ambiguity_reason):
+        return ""
+
+    async def explain_query(self, _query, _query_type):
+        return ""
+
+    async def suggest_queries(self, _datasource, _schema, _count=5):
+        return []
+
+
+class BatchFakeTranslator(FakeTranslator):
+    """Translator that answers numbered batch prompts with one result per query."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    async def _call_llm(self, _system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        queries = user_prompt.split("## Available Datasources")[0].strip().splitlines()[1:]
+        return json.dumps({"results": [
+            {"query": f"-- {q}", "query_type": "sql", "datasource_id": "test_postgres"}
+            for q in queries
+        ]})
+
+
+class ShortBatchFakeTranslator(FakeTranslator):
+    """Translator that drops the last result of batch prompts."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_calls = 0
+
+    async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
+        if "several numbered user queries" not in system_prompt:
+            return await super()._call_llm(system_prompt, user_prompt)
+        self.batch_calls += 1
+        return json.dumps({"results": [
+            {"query": "SELECT 1", "query_type": "sql", "datasource_id": "test_postgres"}
+        ]})
+
+
+class TestBaseTranslator:
+    """Tests for BaseTranslator."""
+
+    @pytest.mark.asyncio
+    async def test_llm_concurrency_is_capped(self, mock_datasource):
+        """Test that concurrent translations never exceed max_concurrency LLM calls."""
+        translator = FakeTranslator(max_concurrency=2)
+
+        await asyncio.gather(*(
+            translator.translate("count users", [mock_datasource], QueryMode.SQL)
+            for _ in range(6)
+        ))
+
+        assert translator.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_llm_call(self, mock_datasource):
+        """Test that a batch is translated in one LLM request, in input order."""
+        translator = BatchFakeTranslator()
+
+        results = await translator.translate_batch(
+            ["count users", "list orders", "top products"], [mock_datasource], QueryMode.SQL
+        )
+
+        assert translator.calls == 1
+        assert [r.query_string for r in results] == [
+            "-- 1. count users", "-- 2. list orders", "-- 3. top products",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_count_mismatch_falls_back_per_query(self, mock_datasource):
+        """Test that a batch answer with missing results is retried one query per call."""
+        translator = ShortBatchFakeTranslator()
+
+        results = await translator.translate_batch(
+            ["count users", "list orders"], [mock_datasource], QueryMode.SQL
+        )
+
+        assert translator.batch_calls == 1
+        assert [r.query_string for r in results] == ["SELECT 1", "SELECT 1"]
+
+    def test_wait_honors_retry_after_header(self):
+        """Test that rate-limit waits use the provider's retry-after header."""
+        exc = Exception("rate limited")
+        exc.response = MagicMock(headers={"retry-after": "7"})
+        retry_state = MagicMock(attempt_number=1)
+        retry_state.outcome.exception.return_value = exc
+
+        assert wait_retry_after(retry_state) == 7.0
+
+        exc.response.headers = {}
+        assert wait_retry_after(retry_state) == 1.0
+
+    def test_schema_json_is_rendered_once_per_schema(self):
+        """Test that prompt schema JSON is reused for the same schema object."""
+        schema = {"users": [{"name": "id", "type": "INTEGER", "default": None}]}
+
+        rendered = schema_to_json(schema)
+
+        assert json.loads(rendered) == schema
+        assert schema_to_json(schema) is rendered
+        assert schema_to_json(dict(schema)) is not rendered
@@ -0,0 +1,119 @@
+"""
+Unit tests for CSVAdapter.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.domain.entities.datasource import Datasource, DatasourceType, FileConfig
+from src.infrastructure.adapters.files import CSVAdapter, frame_cache
+
+
+def make_adapter(path, **options) -> CSVAdapter:
+    """Build a CSV adapter for a file."""
+    return CSVAdapter(
+        Datasource(
+            id="csv1",
+            name="CSV",
+            type=DatasourceType.CSV,
+            file_config=FileConfig(path=str(path), **options),
+        )
+    )
+
+
+class TestCSVAdapter:
+    """Tests for CSVAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_parsed_csv(self, tmp_path):
+        """Test that an unchanged CSV is parsed once across reconnects."""
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        adapter = make_adapter(csv_path)
+
+        with patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            await adapter.connect()
+            await adapter.disconnect()
+            await adapter.connect()
+            assert read_csv.call_count == 1
+
+            csv_path.write_text("id,name\n1,Alice\n2,Bob\n")
+            await adapter.connect()
+            assert read_csv.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_result_columns_report_nulls(self, tmp_path):
+        """Test that result columns are nullable only when a returned row holds a null."""
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name,email\n1,Alice,\n2,Bob,b@example.com\n")
+        adapter = make_adapter(csv_path)
+        await adapter.connect()
+
+        result = await adapter.execute("SELECT * FROM {{table}} ORDER BY id")
+
+        assert {c.name: c.nullable for c in result.metadata.columns} == {
+            "id": False, "name": False, "email": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_parquet_sidecar(self, tmp_path):
+        """Test that an opted-in CSV is re-read from its Parquet sidecar."""
+        pytest.importorskip("pyarrow")
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n2,Bob\n")
+        adapter = make_adapter(csv_path, parquet_cache=True)
+
+        await adapter.connect()
+        assert len(list(tmp_path.glob(".users.csv.*.parquet"))) == 1
+
+        frame_cache.clear()
+        with patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            await adapter.connect()
+            read_csv.assert_not_called()
+
+        result = await adapter.execute("SELECT name FROM {{table}} WHERE id = 2")
+        assert result.data == [{"name": "Bob"}]
+
+    @pytest.mark.asyncio
+    async def test_large_csv_is_streamed(self, tmp_path, monkeypatch):
+        """Test that CSVs above the size threshold are queried without loading them."""
+        monkeypatch.setattr(CSVAdapter, "STREAM_THRESHOLD_BYTES", 0)
+        csv_path = tmp_path / "orders.csv"
+        csv_path.write_text("id,total\n" + "".join(f"{i},{i * 10}\n" for i in range(50)))
+        adapter = make_adapter(csv_path)
+
+        with patch("pandas.read_csv") as read_csv:
+            await adapter.connect()
+            result = await adapter.execute("SELECT * FROM {{table}} LIMIT 3")
+            read_csv.assert_not_called()
+
+        assert result.data[2] == {"id": 2, "total": 20}
+        assert [c["name"] for c in (await adapter.get_schema())["orders"]] == ["id", "total"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streamed", [False, True])
+    async def test_queries_cannot_touch_other_files(self, tmp_path, monkeypatch, streamed):
+        """Test that only SELECTs run and they cannot read or write other files."""
+        if streamed:
+            monkeypatch.setattr(CSVAdapter, "STREAM_THRESHOLD_BYTES", 0)
+        secret = tmp_path / "secret.txt"
+        secret.write_text("token\n")
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        adapter = make_adapter(csv_path)
+
+        await adapter.connect()
+        assert (await adapter.execute("SELECT id FROM users")).data == [{"id": 1}]
+
+        for query in (
+            f"SELECT * FROM read_csv('{secret}', header = false)",
+            f"COPY (SELECT 'pwned') TO '{tmp_path / 'pwned.txt'}'",
+            "SET enable_external_access = true",
+            "SELECT 1; DROP VIEW users",
+        ):
+            with pytest.raises(ValueError):
+                await adapter.execute(query)
+
+        assert not (tmp_path / "pwned.txt").exists()
@@ -2,8 +2,10 @@
 Unit tests for DatasourceService.
 """
 
+import json
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.application.services.datasource_service import DatasourceService
 from src.domain.entities.datasource import DatasourceType, DatasourceCategory
@@ -143,6 +145,162 @@ class TestDatasourceService:
         assert ds is not None
         assert ds.enabled is False
 
+    @pytest.mark.asyncio
+    async def test_config_writes_are_coalesced(self, tmp_path):
+        """Test that bursts of changes inside the event loop produce one write."""
+        config_path = tmp_path / "datasources.json"
+        service = DatasourceService(config_path=str(config_path))
+
+        for ds_id in ("pg1", "pg2"):
+            service.add_datasource(
+                id=ds_id,
+                name=ds_id,
+                ds_type="postgresql",
+                connection_string=f"postgresql://localhost/{ds_id}",
+            )
+
+        assert not config_path.exists()
+
+        service.flush()
+
+        saved = json.loads(config_path.read_text())
+        assert set(saved["datasources"]) == {"pg1", "pg2"}
+
+    @pytest.mark.asyncio
+    async def test_debounced_config_write_runs_off_loop(self, tmp_path, monkeypatch):
+        """Test that the debounced write happens in a worker thread."""
+        import asyncio
+
+        monkeypatch.setattr(DatasourceService, "SAVE_DELAY_SECONDS", 0)
+        config_path = tmp_path / "datasources.json"
+        service = DatasourceService(config_path=str(config_path))
+
+        with patch(
+            "src.application.services.datasource_service.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path="/data/a.csv")
+            await asyncio.sleep(0.01)
+            await service.aflush()
+
+        assert to_thread.call_count == 1
+        assert "csv1" in json.loads(config_path.read_text())["datasources"]
+
+    @pytest.mark.asyncio
+    async def test_schema_sidecar_io_runs_off_loop(self, tmp_path):
+        """Test that schema sidecars are written and deleted in a worker thread."""
+        import asyncio
+
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        service = DatasourceService(config_path=str(tmp_path / "datasources.json"))
+        service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path=str(csv_path))
+        sidecar = service._schema_cache_file("csv1")
+
+        with patch(
+            "src.application.services.datasource_service.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            service.cache_schema("csv1", {"users": [{"name": "id"}]})
+            assert not sidecar.exists()
+            await service.aflush()
+            assert sidecar.exists()
+
+            service.remove_datasource("csv1")
+            await service.aflush()
+            assert not sidecar.exists()
+
+        funcs = [call.args[0].__name__ for call in to_thread.call_args_list]
+        assert "_write_schema_cache" in funcs
+        assert "_unlink_schema_cache" in funcs
+
+    def test_config_parse_is_cached_until_file_changes(self, tmp_path):
+        """Test that unchanged config files are parsed once across services."""
+        import orjson
+
+        config_path = tmp_path / "datasources.json"
+        config = {
+            "datasources": {
+                "csv1": {"name": "CSV", "type": "csv", "path": "/data/test.csv"},
+            },
+        }
+        config_path.write_bytes(orjson.dumps(config))
+
+        with patch(
+            "src.application.services.datasource_service.orjson.loads",
+            wraps=orjson.loads,
+        ) as loads:
+            DatasourceService(config_path=str(config_path))
+            service = DatasourceService(config_path=str(config_path))
+            assert loads.call_count == 1
+
+            service.reload()
+            assert loads.call_count == 2
+
+        assert service.get_datasource("csv1") is not None
+
+    def test_reload_applies_edited_config(self, tmp_path):
+        """Test that reload drops removed datasources and only reconnects changed ones."""
+        paths = {}
+        for name in ("users", "orders", "items"):
+            paths[name] = tmp_path / f"{name}.csv"
+            paths[name].write_text("id\n1\n")
+
+        def write_config(datasources):
+            config = {
+                ds_id: {"type": "csv", "path": str(paths[name])}
+                for ds_id, name in datasources.items()
+            }
+            config_path.write_text(json.dumps({"datasources": config}))
+
+        config_path = tmp_path / "datasources.json"
+        write_config({"csv1": "users", "csv2": "orders", "csv3": "items"})
+        service = DatasourceService(config_path=str(config_path))
+        adapters = {ds_id: service.get_adapter(ds_id) for ds_id in ("csv1", "csv2", "csv3")}
+        service.cache_schema("csv1", {"users": [{"name": "id"}]})
+
+        write_config({"csv1": "users", "csv2": "items"})
+        service.reload()
+
+        assert service.get_datasource("csv3") is None
+        assert service.get_adapter("csv3") is None
+        assert service.get_adapter("csv1") is adapters["csv1"]
+        assert service.get_adapter("csv2") is not adapters["csv2"]
+        assert service.get_datasource("csv1").schema_cache.tables == {"users": [{"name": "id"}]}
+
+    def test_config_loaded_datasources_use_schema_ttl(self, tmp_path):
+        """Test that the configured schema TTL applies to datasources read from config."""
+        config_path = tmp_path / "datasources.json"
+        config_path.write_text(
+            json.dumps({"datasources": {"csv1": {"type": "csv", "path": "/data/test.csv"}}})
+        )
+
+        service = DatasourceService(config_path=str(config_path), schema_cache_ttl_seconds=60)
+
+        assert service.get_datasource("csv1").schema_cache.ttl_seconds == 60
+
+    def test_to_dict_reflects_updates(self):
+        """Test that the cached dict representation is refreshed on writes."""
+        service = DatasourceService()
+
+        service.add_datasource(
+            id="test_pg",
+            name="Test PostgreSQL",
+            ds_type="postgresql",
+            connection_string="postgresql://localhost/db",
+        )
+        ds = service.get_datasource("test_pg")
+
+        assert ds.to_dict()["enabled"] is True
+        assert ds.to_dict()["has_cached_schema"] is False
+
+        service.toggle_datasource("test_pg")
+        ds.update_schema_cache({"users": []})
+
+        data = ds.to_dict()
+        assert data["enabled"] is False
+        assert data["has_cached_schema"] is True
+
     def test_set_query_mode(self):
         """Test setting query mode."""
         service = DatasourceService()
@@ -197,6 +355,28 @@ class TestDatasourceService:
         all_ds = service.get_datasources_for_mode(QueryMode.MIXED)
         assert len(all_ds) == 3
 
+    def test_mode_indexes_follow_updates(self):
+        """Test mode lookups stay consistent across toggle, replace and remove."""
+        service = DatasourceService()
+        service.add_datasource(
+            id="ds1", name="A", ds_type="postgresql",
+            connection_string="postgresql://localhost/db",
+        )
+        service.add_datasource(id="ds2", name="B", ds_type="csv", file_path="/data/b.csv")
+
+        service.toggle_datasource("ds2", enabled=False)
+        assert [ds.id for ds in service.get_datasources_for_mode(QueryMode.MIXED)] == ["ds1"]
+        assert service.get_datasources_for_mode(QueryMode.FILES) == []
+
+        # Re-adding an ID with another type moves it to the new category
+        service.add_datasource(id="ds1", name="A", ds_type="excel", file_path="/data/a.xlsx")
+        assert service.get_datasources_for_mode(QueryMode.SQL) == []
+        assert [ds.id for ds in service.get_datasources_for_mode(QueryMode.FILES)] == ["ds1"]
+
+        service.remove_datasource("ds1")
+        assert service.get_datasources_for_mode(QueryMode.MIXED) == []
+        assert len(service.list_datasources(category=DatasourceCategory.FILE)) == 1
+
     def test_create_adapter(self):
         """Test adapter creation for different datasource types."""
         from src.infrastructure.adapters.sql import PostgreSQLAdapter
@@ -229,3 +409,189 @@ class TestDatasourceService:
         adapter2 = service.get_adapter("test_pg")
 
         assert adapter1 is adapter2
+
+    @pytest.mark.asyncio
+    async def test_refresh_schemas(self, mock_adapter):
+        """Test concurrent schema refresh caches schemas and isolates failures."""
+        failing_adapter = AsyncMock()
+        failing_adapter.__aenter__.return_value = failing_adapter
+        failing_adapter.get_schema.side_effect = ConnectionError("down")
+
+        adapters = {"pg1": mock_adapter, "pg2": failing_adapter}
+        factory = MagicMock()
+        factory.create.side_effect = lambda ds: adapters[ds.id]
+        service = DatasourceService(adapter_factory=factory)
+
+        for ds_id in ("pg1", "pg2", "pg3"):
+            service.add_datasource(
+                id=ds_id,
+                name=ds_id,
+                ds_type="postgresql",
+                connection_string=f"postgresql://localhost/{ds_id}",
+                enabled=ds_id != "pg3",
+            )
+
+        results = await service.refresh_schemas()
+
+        assert set(results) == {"pg1", "pg2"}
+        assert "users" in results["pg1"]
+        assert isinstance(results["pg2"], ConnectionError)
+        assert service.get_datasource("pg1").schema_cache.is_valid is True
+        assert service.get_datasource("pg2").schema_cache.is_valid is False
+
+    @pytest.mark.asyncio
+    async def test_get_schema_serves_cache_and_revalidates_stale(self, mock_adapter):
+        """Test that schemas are fetched once and expired ones refresh in the background."""
+        import asyncio
+
+        factory = MagicMock()
+        factory.create.return_value = mock_adapter
+        service = DatasourceService(adapter_factory=factory, schema_cache_ttl_seconds=60)
+        service.add_datasource(
+            id="pg1", name="pg1", ds_type="postgresql", connection_string="postgresql://localhost/db"
+        )
+
+        first = await service.get_schema("pg1")
+        assert await service.get_schema("pg1") is first
+        assert mock_adapter.get_schema.await_count == 1
+
+        # Expire the entry: the stale copy is served while one refresh runs
+        service.get_datasource("pg1").schema_cache.cached_at_monotonic -= 61
+        assert await service.get_schema("pg1") is first
+        assert await service.get_schema("pg1") is first
+        await asyncio.sleep(0)
+
+        assert mock_adapter.get_schema.await_count == 2
+        assert service.get_datasource("pg1").schema_cache.is_valid is True
+
+    @pytest.mark.asyncio
+    async def test_adapter_connection_is_reused(self, tmp_path):
+        """Test that adapters connect once and stay open across calls."""
+        import asyncio
+
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+
+        service = DatasourceService()
+        service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path=str(csv_path))
+        adapter = service.get_adapter("csv1")
+
+        with patch.object(adapter, "connect", wraps=adapter.connect) as connect:
+            await asyncio.gather(*(adapter.ensure_connected() for _ in range(5)))
+            assert await service.validate_connection("csv1") is True
+
+        assert connect.await_count == 1
+        assert adapter.is_connected is True
+
+    @pytest.mark.asyncio
+    async def test_idle_adapters_are_disconnected(self, tmp_path):
+        """Test that only adapters unused past the idle TTL are closed."""
+        service = DatasourceService()
+        for ds_id in ("busy", "idle"):
+            csv_path = tmp_path / f"{ds_id}.csv"
+            csv_path.write_text("id,name\n1,Alice\n")
+            service.add_datasource(id=ds_id, name=ds_id, ds_type="csv", file_path=str(csv_path))
+            await service.get_adapter(ds_id).ensure_connected()
+
+        service.get_adapter("idle")._last_used -= 120
+
+        assert await service.disconnect_idle(60) == 1
+        assert service.get_adapter("busy").is_connected is True
+        assert service.get_adapter("idle").is_connected is False
+
+    def test_default_factory_imports_adapters_on_demand(self, tmp_path):
+        """Test that lazily registered adapters resolve on first use."""
+        from src.infrastructure.adapters.factory import create_default_factory
+        from src.infrastructure.adapters.files import CSVAdapter
+
+        factory = create_default_factory()
+        assert factory.supports(DatasourceType.MONGODB)
+        assert DatasourceType.EXCEL in factory.supported_types
+
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        service = DatasourceService(adapter_factory=factory)
+        service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path=str(csv_path))
+
+        assert isinstance(service.get_adapter("csv1"), CSVAdapter)
+
+    def test_adapter_dropped_when_config_changes(self, tmp_path):
+        """Test that re-adding a datasource only rebuilds its adapter on config changes."""
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        other_path = tmp_path / "orders.csv"
+        other_path.write_text("id,total\n1,10\n")
+
+        service = DatasourceService()
+        service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path=str(csv_path))
+        adapter = service.get_adapter("csv1")
+
+        service.add_datasource(id="csv1", name="Renamed", ds_type="csv", file_path=str(csv_path))
+        assert service.get_adapter("csv1") is adapter
+
+        service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path=str(other_path))
+        assert service.get_adapter("csv1") is not adapter
+
+    @pytest.mark.asyncio
+    async def test_validate_all_connections(self, mock_adapter):
+        """Test that all datasources are validated and hung ones time out."""
+        import asyncio
+
+        async def hang() -> bool:
+            await asyncio.sleep(10)
+            return True
+
+        hung_adapter = AsyncMock()
+        hung_adapter.validate_connection.side_effect = hang
+
+        adapters = {"pg1": mock_adapter, "pg2": hung_adapter}
+        factory = MagicMock()
+        factory.create.side_effect = lambda ds: adapters[ds.id]
+        service = DatasourceService(adapter_factory=factory)
+
+        for ds_id in adapters:
+            service.add_datasource(
+                id=ds_id,
+                name=ds_id,
+                ds_type="postgresql",
+                connection_string=f"postgresql://localhost/{ds_id}",
+            )
+
+        results = await service.validate_all_connections(timeout_seconds=0.05)
+
+        assert results == {"pg1": True, "pg2": False}
+
+    def test_schema_cache_survives_restart(self, tmp_path):
+        """Test that fetched schemas are reused by a new service until the source changes."""
+        csv_path = tmp_path / "users.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        config_path = tmp_path / "datasources.json"
+
+        service = DatasourceService(config_path=str(config_path))
+        service.add_datasource(id="csv1", name="CSV", ds_type="csv", file_path=str(csv_path))
+        service.cache_schema("csv1", {"users": [{"name": "id"}]})
+
+        restarted = DatasourceService(config_path=str(config_path))
+        cache = restarted.get_datasource("csv1").schema_cache
+        assert cache.is_valid is True
+        assert cache.tables == {"users": [{"name": "id"}]}
+
+        # Rewriting the file changes its fingerprint
+        csv_path.write_text("id,name,email\n1,Alice,a@example.com\n")
+        restarted = DatasourceService(config_path=str(config_path))
+        assert restarted.get_datasource("csv1").schema_cache.is_valid is False
+
+    def test_identical_configs_are_shared(self):
+        """Test that equal connection configs are interned across datasources."""
+        service = DatasourceService()
+        for ds_id in ("pg1", "pg2"):
+            service.add_datasource(
+                id=ds_id,
+                name=ds_id,
+                ds_type="postgresql",
+                connection_string="postgresql://localhost/shared",
+            )
+
+        config1 = service.get_datasource("pg1").connection_config
+        config2 = service.get_datasource("pg2").connection_config
+        assert config1 is config2
@@ -0,0 +1,43 @@
+"""
+Unit tests for ExcelAdapter.
+"""
+
+import pandas as pd
+import pytest
+
+from src.domain.entities.datasource import Datasource, DatasourceType, FileConfig
+from src.infrastructure.adapters.files import ExcelAdapter
+
+
+class TestExcelAdapter:
+    """Tests for ExcelAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_queries_cannot_touch_other_files(self, tmp_path):
+        """Test that only SELECTs run and they cannot read or write other files."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("token\n")
+        xlsx_path = tmp_path / "book.xlsx"
+        pd.DataFrame({"id": [1]}).to_excel(xlsx_path, sheet_name="users", index=False)
+        adapter = ExcelAdapter(
+            Datasource(
+                id="xl1",
+                name="Excel",
+                type=DatasourceType.EXCEL,
+                file_config=FileConfig(path=str(xlsx_path)),
+            )
+        )
+
+        await adapter.connect()
+        assert (await adapter.execute("SELECT id FROM users")).data == [{"id": 1}]
+
+        for query in (
+            f"SELECT * FROM read_csv('{secret}', header = false)",
+            f"COPY (SELECT 'pwned') TO '{tmp_path / 'pwned.txt'}'",
+            "SET enable_external_access = true",
+            "SELECT 1; DROP VIEW users",
+        ):
+            with pytest.raises(ValueError):
+                await adapter.execute(query)
+
+        assert not (tmp_path / "pwned.txt").exists()
@@ -0,0 +1,45 @@
+"""
+Unit tests for MongoDBAdapter.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.entities.datasource import ConnectionConfig, Datasource, DatasourceType
+from src.infrastructure.adapters.nosql import mongodb_adapter
+
+
+class TestMongoDBAdapter:
+    """Tests for MongoDBAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_adapters_share_client(self, monkeypatch):
+        """Test that datasources on the same cluster reuse one client until both disconnect."""
+        client = MagicMock()
+        client.admin.command = AsyncMock()
+        client.close = AsyncMock()
+        monkeypatch.setattr(mongodb_adapter, "_CLIENTS", {})
+        monkeypatch.setattr(mongodb_adapter, "AsyncMongoClient", MagicMock(return_value=client))
+
+        adapters = [
+            mongodb_adapter.MongoDBAdapter(
+                Datasource(
+                    id=db,
+                    name=db,
+                    type=DatasourceType.MONGODB,
+                    connection_config=ConnectionConfig(
+                        connection_string=f"mongodb://localhost:27017/{db}"
+                    ),
+                )
+            )
+            for db in ("sales", "crm")
+        ]
+        for adapter in adapters:
+            await adapter.connect()
+
+        mongodb_adapter.AsyncMongoClient.assert_called_once()
+        await adapters[0].disconnect()
+        client.close.assert_not_awaited()
+        await adapters[1].disconnect()
+        client.close.assert_awaited_once()
@@ -95,7 +95,9 @@ class TestQueryService:
     async def test_preview_query_no_datasources(self, query_service):
         """Test preview fails when no datasources available."""
         # Remove all datasources
-        query_service._datasource_service._datasources.clear()
+        datasource_service = query_service._datasource_service
+        for ds in datasource_service.list_datasources():
+            datasource_service.remove_datasource(ds.id)
 
         with pytest.raises(ValueError, match="No datasources available"):
             await query_service.preview_query(
@@ -122,6 +124,82 @@ class TestQueryService:
         assert len(history) == 1
         assert history[0]["natural_language_input"] == "Show me all users"
 
+    @pytest.mark.asyncio
+    async def test_identical_queries_reuse_cached_result(
+        self, mock_translator, mock_adapter, settings
+    ):
+        """Test that a repeated query is served from the result cache."""
+        from src.infrastructure.cache import InMemoryResultCache
+
+        datasource_service = DatasourceService()
+        datasource_service.add_datasource(
+            id="test_postgres",
+            name="Test PostgreSQL",
+            ds_type="postgresql",
+            connection_string="postgresql://localhost/db",
+        )
+
+        with patch.object(datasource_service, "get_adapter", return_value=mock_adapter):
+            service = QueryService(
+                datasource_service=datasource_service,
+                translator=mock_translator,
+                settings=settings,
+                result_cache=InMemoryResultCache(),
+            )
+            first = await service.execute_query(natural_language="Show me all users")
+            second = await service.execute_query(natural_language="Show me all users")
+
+        mock_adapter.execute.assert_called_once()
+        assert second.data == first.data
+        assert second.query_id != first.query_id
+
+    @pytest.mark.asyncio
+    async def test_translation_cache_hits_across_queries(
+        self, mock_translator, mock_adapter, settings
+    ):
+        """Test that repeated questions reuse translations despite the growing history."""
+        from src.infrastructure.llm.semantic_cache import SemanticCache
+
+        datasource_service = DatasourceService()
+        datasource_service.add_datasource(
+            id="test_postgres",
+            name="Test PostgreSQL",
+            ds_type="postgresql",
+            connection_string="postgresql://localhost/db",
+        )
+
+        with patch.object(datasource_service, "get_adapter", return_value=mock_adapter):
+            service = QueryService(
+                datasource_service=datasource_service,
+                translator=SemanticCache(mock_translator),
+                settings=settings,
+            )
+            for _ in range(4):
+                await service.execute_query(natural_language="Show me all users")
+            assert mock_translator.translate.call_count == 1
+
+            # Follow-ups depend on the history, so they are always translated
+            for _ in range(2):
+                await service.execute_query(natural_language="now only the first ones")
+            assert mock_translator.translate.call_count == 3
+
+    def test_query_history_is_bounded(self, mock_translator, settings):
+        """Test that the history keeps only the most recent queries."""
+        settings.query_history_max_entries = 3
+        service = QueryService(
+            datasource_service=DatasourceService(),
+            translator=mock_translator,
+            settings=settings,
+        )
+
+        for i in range(5):
+            query = MagicMock()
+            query.to_dict.return_value = {"n": i}
+            service._query_history.append(query)
+
+        assert service.get_query_history() == [{"n": 2}, {"n": 3}, {"n": 4}]
+        assert service.get_query_history(limit=2) == [{"n": 3}, {"n": 4}]
+
     def test_clear_history(self, query_service):
         """Test clearing history."""
         query_service._query_history.append(MagicMock())
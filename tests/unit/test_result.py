@@ -0,0 +1,53 @@
+"""
+Unit tests for QueryResult export helpers.
+"""
+
+import json
+
+from src.domain.entities.result import QueryResult
+
+
+class TestQueryResultExport:
+    """Tests for QueryResult chunked exports."""
+
+    def test_iter_csv_chunks_matches_csv_string(self):
+        """Test that joined CSV chunks equal the buffered CSV export."""
+        result = QueryResult(
+            query_id="q1",
+            data=[{"id": i, "name": f"user, {i}"} for i in range(500)],
+        )
+
+        chunks = list(result.iter_csv_chunks(chunk_size=1024))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == result.to_csv_string()
+
+    def test_iter_json_chunks_is_valid_json(self):
+        """Test that joined JSON chunks form the full array of rows."""
+        result = QueryResult(
+            query_id="q1",
+            data=[{"id": i, "name": f"user {i}"} for i in range(25)],
+        )
+
+        payload = b"".join(result.iter_json_chunks(batch_size=10))
+
+        assert json.loads(payload) == result.data
+        assert b"".join(QueryResult(query_id="q2").iter_json_chunks()) == b"[]"
+
+    def test_csv_string_handles_missing_columns(self):
+        """Test that rows missing a column are written with an empty value."""
+        result = QueryResult(
+            query_id="q1",
+            data=[{"id": 1, "name": "Alice"}, {"id": 2}],
+        )
+
+        assert result.to_csv_string() == "id,name\r\n1,Alice\r\n2,\r\n"
+
+    def test_column_names_follow_replaced_data(self):
+        """Test that cached column names are recomputed when the data changes."""
+        result = QueryResult(query_id="q1", data=[{"id": 1, "name": "Alice"}])
+        assert result.column_names == ["id", "name"]
+        assert result.column_names is result.column_names
+
+        result.data = [{"total": 3}]
+        assert result.column_names == ["total"]
@@ -0,0 +1,45 @@
+"""
+Unit tests for InMemoryResultCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.entities.result import QueryResult
+from src.infrastructure.cache import InMemoryResultCache
+
+
+class TestInMemoryResultCache:
+    """Tests for InMemoryResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_copy(self):
+        """Test that hits are copies, so callers can annotate them freely."""
+        cache = InMemoryResultCache()
+        await cache.put("SELECT 1", "pg1", 100, QueryResult(query_id="q1", data=[{"a": 1}]))
+
+        hit = await cache.get("SELECT 1", "pg1", 100)
+        assert hit is not None
+        assert hit.data == [{"a": 1}]
+
+        hit.query_id = "q2"
+        assert (await cache.get("SELECT 1", "pg1", 100)).query_id == "q1"
+        assert await cache.get("SELECT 1", "pg1", 10) is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_evict(self):
+        """Test TTL expiry and LRU eviction."""
+        cache = InMemoryResultCache(max_entries=1)
+        await cache.put("SELECT 1", "pg1", 100, QueryResult(query_id="q1"), ttl_seconds=10)
+
+        with patch(
+            "src.infrastructure.cache.memory_result_cache.time.monotonic",
+            return_value=10**9,
+        ):
+            assert await cache.get("SELECT 1", "pg1", 100) is None
+
+        await cache.put("SELECT 1", "pg1", 100, QueryResult(query_id="q1"))
+        await cache.put("SELECT 2", "pg1", 100, QueryResult(query_id="q2"))
+        assert await cache.get("SELECT 1", "pg1", 100) is None
+        assert await cache.get("SELECT 2", "pg1", 100) is not None
@@ -0,0 +1,158 @@
+"""
+Unit tests for SemanticCache.
+"""
+
+import pytest
+
+from src.domain.entities.query import QueryMode
+from src.infrastructure.llm.semantic_cache import (
+    SemanticCache,
+    cosine_similarity,
+    extract_operators,
+    lexical_embedding,
+)
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_skips_translator(self, mock_translator, mock_datasource):
+        """Test that a repeated query is served from the exact tier."""
+        cache = SemanticCache(mock_translator)
+
+        first = await cache.translate("Show me all users", [mock_datasource], QueryMode.SQL)
+        second = await cache.translate("Show me all users", [mock_datasource], QueryMode.SQL)
+
+        assert first is second
+        mock_translator.translate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_forwards_only_misses(self, mock_translator, mock_datasource):
+        """Test that cached queries are left out of the batch sent to the translator."""
+        cache = SemanticCache(mock_translator)
+        cached = await cache.translate("Show me all users", [mock_datasource], QueryMode.SQL)
+        fresh = mock_translator.translate.return_value
+        mock_translator.translate_batch.return_value = [fresh]
+
+        results = await cache.translate_batch(
+            ["Show me all users", "count orders by month"], [mock_datasource], QueryMode.SQL
+        )
+
+        assert results == [cached, fresh]
+        mock_translator.translate_batch.assert_called_once()
+        assert mock_translator.translate_batch.call_args.args[0] == ["count orders by month"]
+
+    @pytest.mark.asyncio
+    async def test_similar_query_hits_semantic_tier(self, mock_translator, mock_datasource):
+        """Test that a near-duplicate query above the threshold is a hit."""
+        cache = SemanticCache(mock_translator, threshold=0.8, semantic=True)
+
+        await cache.translate("show me all users", [mock_datasource], QueryMode.SQL)
+        await cache.translate("Show me all the users", [mock_datasource], QueryMode.SQL)
+
+        mock_translator.translate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_is_off_by_default(self, mock_translator, mock_datasource):
+        """Test that only exact (canonicalized) repeats hit unless semantic matching is enabled."""
+        cache = SemanticCache(mock_translator, threshold=0.5)
+
+        await cache.translate("show me all users", [mock_datasource], QueryMode.SQL)
+        await cache.translate("Show me all the users", [mock_datasource], QueryMode.SQL)
+
+        assert mock_translator.translate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_negation_and_operators_miss(self, mock_translator, mock_datasource):
+        """Test that lexically close queries with opposite meaning never share a translation."""
+        cache = SemanticCache(mock_translator, threshold=0.5, semantic=True)
+
+        await cache.translate("users where name is 'bob'", [mock_datasource], QueryMode.SQL)
+        await cache.translate("users where name is not 'bob'", [mock_datasource], QueryMode.SQL)
+        await cache.translate("orders with more than 5 items", [mock_datasource], QueryMode.SQL)
+        await cache.translate("orders with less than 5 items", [mock_datasource], QueryMode.SQL)
+
+        assert mock_translator.translate.call_count == 4
+        assert extract_operators("total >= 5 and isn't shipped") == {">=", "n't"}
+
+    @pytest.mark.asyncio
+    async def test_follow_ups_bypass_cache(self, mock_translator, mock_datasource):
+        """Test that context only matters for questions that refer back to it."""
+        cache = SemanticCache(mock_translator)
+        first = {"previous_queries": [{"input": "list users"}]}
+        second = {"previous_queries": [{"input": "list orders"}]}
+
+        await cache.translate("count all users", [mock_datasource], QueryMode.SQL, first)
+        await cache.translate("count all users", [mock_datasource], QueryMode.SQL, second)
+        assert mock_translator.translate.call_count == 1
+
+        await cache.translate("only the active ones", [mock_datasource], QueryMode.SQL, first)
+        await cache.translate("only the active ones", [mock_datasource], QueryMode.SQL, first)
+        assert mock_translator.translate.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_different_mode_misses(self, mock_translator, mock_datasource):
+        """Test that cache entries are scoped by query mode."""
+        cache = SemanticCache(mock_translator)
+
+        await cache.translate("Show me all users", [mock_datasource], QueryMode.SQL)
+        await cache.translate("Show me all users", [mock_datasource], QueryMode.MIXED)
+
+        assert mock_translator.translate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_change_misses(self, mock_translator, mock_datasource):
+        """Test that refreshing the schema invalidates cached translations."""
+        cache = SemanticCache(mock_translator)
+
+        await cache.translate("Show me all users", [mock_datasource], QueryMode.SQL)
+        mock_datasource.update_schema_cache({"users": [{"name": "id", "type": "integer"}]})
+        await cache.translate("Show me all users", [mock_datasource], QueryMode.SQL)
+
+        assert mock_translator.translate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_is_bounded_across_schemas(
+        self, mock_translator, mock_datasource
+    ):
+        """Test that max_entries caps the semantic tier as a whole, not per schema."""
+        cache = SemanticCache(mock_translator, max_entries=2, semantic=True)
+
+        for i in range(5):
+            mock_datasource.update_schema_cache({f"table_{i}": []})
+            await cache.translate("show me all users", [mock_datasource], QueryMode.SQL)
+
+        assert sum(len(bucket) for bucket in cache._vectors.values()) == 2
+        assert len(cache._vectors) == 2
+
+    def test_lexical_embedding_similarity(self):
+        """Test that the default embedding ranks related text higher."""
+        base = lexical_embedding("list all customers")
+        similar = lexical_embedding("list all the customers")
+        unrelated = lexical_embedding("average order value by month")
+
+        assert cosine_similarity(base, base) == pytest.approx(1.0)
+        assert cosine_similarity(base, similar) > cosine_similarity(base, unrelated)
+
+    @pytest.mark.asyncio
+    async def test_different_literals_miss(self, mock_translator, mock_datasource):
+        """Test that queries differing only in a number never share a translation."""
+        cache = SemanticCache(mock_translator, threshold=0.5, semantic=True)
+
+        await cache.translate("show top 5 users", [mock_datasource], QueryMode.SQL)
+        await cache.translate("show top 6 users", [mock_datasource], QueryMode.SQL)
+
+        assert mock_translator.translate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exact_tier_ignores_case_and_spacing(self, mock_translator, mock_datasource):
+        """Test that formatting-only differences hit the exact tier, but literal case does not."""
+        cache = SemanticCache(mock_translator, threshold=1.1)
+
+        await cache.translate("Show me  users named 'Alice'", [mock_datasource], QueryMode.SQL)
+        await cache.translate("show me users named 'Alice'?", [mock_datasource], QueryMode.SQL)
+        assert mock_translator.translate.call_count == 1
+
+        await cache.translate("show me users named 'alice'", [mock_datasource], QueryMode.SQL)
+        assert mock_translator.translate.call_count == 2
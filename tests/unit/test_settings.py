@@ -0,0 +1,24 @@
+"""
+Unit tests for Settings.
+"""
+
+import pytest
+
+from src.infrastructure.config.settings import Settings
+
+
+class TestSettings:
+    """Tests for Settings."""
+
+    def test_resolve_env_secret(self, monkeypatch):
+        """Test that env secrets are resolved from the startup snapshot."""
+        monkeypatch.setenv("TEST_DB_CONNECTION_STRING", "postgresql://localhost/db")
+        settings = Settings(openai_api_key="test-key")
+
+        assert (
+            settings.resolve_env_secret("TEST_DB_CONNECTION_STRING")
+            == "postgresql://localhost/db"
+        )
+
+        with pytest.raises(ValueError, match="not found"):
+            settings.resolve_env_secret("MISSING_CONNECTION_STRING")
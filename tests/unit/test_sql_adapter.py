@@ -0,0 +1,48 @@
+"""
+Unit tests for the SQLAlchemy-based SQL adapters.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.domain.entities.datasource import ConnectionConfig, Datasource, DatasourceType
+from src.infrastructure.adapters.sql import SQLiteAdapter
+
+
+class TestSQLiteAdapter:
+    """Tests for SQLiteAdapter (and the shared BaseSQLAdapter behavior)."""
+
+    @pytest.mark.asyncio
+    async def test_queries_run_on_async_engine(self, tmp_path):
+        """Test that SQL adapters query and introspect through the async driver."""
+        db_path = tmp_path / "app.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.executemany("INSERT INTO users (name) VALUES (?)", [("Alice",), ("Bob",), ("Eve",)])
+
+        adapter = SQLiteAdapter(
+            Datasource(
+                id="lite",
+                name="SQLite",
+                type=DatasourceType.SQLITE,
+                connection_config=ConnectionConfig(connection_string=f"sqlite:///{db_path}"),
+            )
+        )
+        await adapter.connect()
+        try:
+            result = await adapter.execute(
+                "SELECT name FROM users WHERE id > :min_id ORDER BY id", {"min_id": 0}, max_results=2
+            )
+            assert result.data == [{"name": "Alice"}, {"name": "Bob"}]
+            assert result.metadata.total_rows == 3
+            assert result.metadata.was_truncated is True
+            assert await adapter.get_tables() == ["users"]
+
+            # Statements that cannot be a subquery still truncate cleanly
+            pragma = await adapter.execute("PRAGMA table_info(users)", max_results=1)
+            assert [row["name"] for row in pragma.data] == ["id"]
+            assert pragma.metadata.was_truncated is True
+            assert pragma.metadata.total_rows == 2
+        finally:
+            await adapter.disconnect()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the template fast path.
+"""
+
+import pytest
+
+from src.domain.entities.query import QueryMode
+from src.infrastructure.llm.template_translator import (
+    TemplateMatcher,
+    TemplateTranslator,
+    compile_template,
+)
+
+
+@pytest.fixture
+def matcher():
+    """Matcher with a couple of common templates."""
+    return TemplateMatcher([
+        compile_template("show (top|first) {n} {table}", "SELECT * FROM {table} LIMIT {n}"),
+        compile_template("how many {table} are there", "SELECT COUNT(*) AS total FROM {table}"),
+    ])
+
+
+@pytest.fixture
+def schema_datasource(mock_datasource):
+    """Datasource with a cached schema."""
+    mock_datasource.update_schema_cache({
+        "Users": [{"name": "id", "type": "integer", "nullable": False}],
+    })
+    return mock_datasource
+
+
+class TestTemplateTranslator:
+    """Tests for TemplateMatcher and TemplateTranslator."""
+
+    def test_match_fills_template(self, matcher, schema_datasource):
+        """Test that a matching question renders SQL with the canonical table name."""
+        result = matcher.match("Show top 5 users?", [schema_datasource])
+
+        assert result is not None
+        assert result.query_string == "SELECT * FROM Users LIMIT 5"
+        assert result.target_datasource_id == schema_datasource.id
+
+    def test_unknown_table_does_not_match(self, matcher, schema_datasource):
+        """Test that identifiers missing from the schema never reach the SQL."""
+        assert matcher.match("show top 5 users; DROP TABLE x", [schema_datasource]) is None
+        assert matcher.match("show top 5 orders", [schema_datasource]) is None
+
+    @pytest.mark.asyncio
+    async def test_translator_falls_back(self, matcher, mock_translator, schema_datasource):
+        """Test that non-matching questions are delegated to the wrapped translator."""
+        translator = TemplateTranslator(mock_translator, matcher)
+
+        hit = await translator.translate("how many users are there", [schema_datasource], QueryMode.SQL)
+        await translator.translate("average age per city", [schema_datasource], QueryMode.SQL)
+
+        assert hit.query_string == "SELECT COUNT(*) AS total FROM Users"
+        assert mock_translator.translate.call_count == 1
@@ -0,0 +1,154 @@
+"""
+Unit tests for the MCP tool endpoints.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.application.services.datasource_service import DatasourceService
+from src.application.services.query_service import QueryService
+from src.domain.entities.result import QueryResult
+from src.infrastructure.cache import InMemoryResultCache
+
+
+@pytest.fixture
+def csv_request(tmp_path):
+    """Request body configuring a small CSV datasource."""
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text("id,name\n1,Alice\n")
+    return {"id": "csv1", "name": "CSV", "type": "csv", "file_path": str(csv_path)}
+
+
+@pytest.fixture
+def services(mock_translator, settings):
+    """Patch the endpoints' services with fresh instances sharing a result cache."""
+    datasource_service = DatasourceService()
+    result_cache = InMemoryResultCache()
+    query_service = QueryService(
+        datasource_service=datasource_service,
+        translator=mock_translator,
+        settings=settings,
+        result_cache=result_cache,
+    )
+
+    with (
+        patch("src.api.tools.get_datasource_service", return_value=datasource_service),
+        patch("src.api.tools.get_query_service", return_value=query_service),
+    ):
+        yield datasource_service, result_cache
+
+
+@pytest.fixture
+def client():
+    """Test client without the startup lifespan."""
+    return TestClient(app)
+
+
+class TestConfigureDatasource:
+    """Tests for the configure_datasource tool."""
+
+    def test_update_keeps_open_adapter(self, client, services, csv_request):
+        """Test that reconfiguring without connection changes keeps the adapter."""
+        datasource_service, _ = services
+        assert client.post("/mcp/configure_datasource", json=csv_request).status_code == 200
+        adapter = datasource_service.get_adapter("csv1")
+
+        response = client.post(
+            "/mcp/configure_datasource", json={**csv_request, "name": "Renamed"}
+        )
+
+        assert response.status_code == 200
+        assert datasource_service.get_datasource("csv1").name == "Renamed"
+        assert datasource_service.get_adapter("csv1") is adapter
+
+
+class TestResultCacheInvalidation:
+    """Tests that datasource changes drop its cached results."""
+
+    @pytest.fixture
+    def cached(self, client, services, csv_request):
+        """Configure the datasource and cache a result for it."""
+        import asyncio
+
+        _, result_cache = services
+        client.post("/mcp/configure_datasource", json=csv_request)
+        asyncio.run(result_cache.put("SELECT 1", "csv1", 100, QueryResult(query_id="q1")))
+        return result_cache
+
+    @staticmethod
+    def _is_cached(result_cache: InMemoryResultCache) -> bool:
+        import asyncio
+
+        return asyncio.run(result_cache.get("SELECT 1", "csv1", 100)) is not None
+
+    def test_update_invalidates(self, client, cached, csv_request):
+        """Test that updating a datasource drops its cached results."""
+        assert self._is_cached(cached)
+        client.post("/mcp/configure_datasource", json={**csv_request, "name": "Renamed"})
+        assert not self._is_cached(cached)
+
+    def test_remove_invalidates(self, client, cached):
+        """Test that removing a datasource drops its cached results."""
+        assert client.delete("/mcp/remove_datasource/csv1").status_code == 200
+        assert not self._is_cached(cached)
+
+    def test_toggle_invalidates(self, client, cached):
+        """Test that toggling a datasource drops its cached results."""
+        assert client.post("/mcp/toggle_datasource", json={"id": "csv1"}).status_code == 200
+        assert not self._is_cached(cached)
+
+
+class TestExportResults:
+    """Tests for the export_results tool."""
+
+    @pytest.fixture
+    def last_result(self):
+        """Patch the query service to hold a last result."""
+        query_service = MagicMock()
+        query_service.get_last_result.return_value = QueryResult(
+            query_id="q1", data=[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+        )
+        with patch("src.api.tools.get_query_service", return_value=query_service):
+            yield query_service
+
+    @pytest.mark.usefixtures("last_result")
+    def test_csv_export_streams_file(self, client):
+        """Test that CSV exports are streamed as an attachment with a row count."""
+        response = client.post("/mcp/export_results", json={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.headers["content-disposition"] == 'attachment; filename="q1.csv"'
+        assert response.headers["x-row-count"] == "2"
+        assert response.text == "id,name\r\n1,Alice\r\n2,Bob\r\n"
+
+    def test_json_export_streams_file(self, client, last_result):
+        """Test that JSON exports are streamed as an array of rows."""
+        response = client.post("/mcp/export_results", json={"format": "JSON"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-disposition"] == 'attachment; filename="q1.json"'
+        assert response.headers["x-row-count"] == "2"
+        assert json.loads(response.content) == last_result.get_last_result.return_value.data
+
+    @pytest.mark.usefixtures("last_result")
+    def test_unsupported_format_is_rejected(self, client):
+        """Test that unknown formats return 400."""
+        response = client.post("/mcp/export_results", json={"format": "xml"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unsupported format: xml"
+
+    def test_missing_results_return_404(self, client, last_result):
+        """Test that exporting before any query returns 404."""
+        last_result.get_last_result.return_value = None
+
+        response = client.post("/mcp/export_results", json={"format": "csv"})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No query results to export"